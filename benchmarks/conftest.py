@@ -0,0 +1,48 @@
+"""Fixtures for Trinnov Altitude benchmarks."""
+
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from tests.simulator import AltitudeSimulator
+
+from .harness import BenchReport, SimulatedEntry, async_setup_simulated_entry
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark output option."""
+    parser.addoption(
+        "--bench-json",
+        default=".benchmarks/latest.json",
+        help="Where to write benchmark results as JSON.",
+    )
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations for all benchmarks."""
+    yield
+
+
+@pytest.fixture(scope="session")
+def bench_report(request: pytest.FixtureRequest) -> Iterator[BenchReport]:
+    """Collect results from every benchmark and write them at the end."""
+    report = BenchReport()
+    yield report
+    if report.results:
+        report.write(Path(request.config.getoption("--bench-json")))
+
+
+@pytest.fixture
+async def simulated_entry(
+    hass: HomeAssistant, socket_enabled
+) -> AsyncIterator[SimulatedEntry]:
+    """Set up the integration against a simulated processor."""
+    async with AltitudeSimulator() as simulator:
+        setup = await async_setup_simulated_entry(hass, simulator, "BENCH0")
+        await hass.async_block_till_done()
+        yield setup
+        assert await hass.config_entries.async_unload(setup.entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,181 @@
+"""Shared helpers for Trinnov Altitude benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import platform
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.const import CONF_HOST, EVENT_STATE_CHANGED
+from homeassistant.const import __version__ as HA_VERSION
+from homeassistant.core import Event, HomeAssistant, callback
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from trinnov_altitude.client import TrinnovAltitudeClient
+
+from custom_components.trinnov_altitude import coordinator as coordinator_module
+from custom_components.trinnov_altitude.const import DOMAIN
+from custom_components.trinnov_altitude.coordinator import TrinnovAltitudeCoordinator
+from tests.simulator import AltitudeSimulator
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Return the ``q`` percentile (0-100) by nearest rank."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def latency_summary(seconds: list[float]) -> dict[str, float]:
+    """Summarize latencies in milliseconds."""
+    return {
+        "p50_ms": round(percentile(seconds, 50) * 1000, 3),
+        "p99_ms": round(percentile(seconds, 99) * 1000, 3),
+        "mean_ms": round(sum(seconds) / len(seconds) * 1000, 3) if seconds else 0.0,
+        "max_ms": round(max(seconds, default=0.0) * 1000, 3),
+    }
+
+
+@dataclass
+class BenchReport:
+    """Benchmark results collected over a session and written as JSON."""
+
+    results: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, name: str, result: dict[str, Any]) -> None:
+        """Record the result of one benchmark scenario."""
+        self.results[name] = result
+
+    def write(self, path: Path) -> None:
+        """Write the results with enough context to compare runs."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "created_at": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "homeassistant": HA_VERSION,
+            "machine": platform.machine(),
+            "results": self.results,
+        }
+        path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
+
+
+@dataclass
+class SimulatedEntry:
+    """A config entry set up against a simulated processor."""
+
+    simulator: AltitudeSimulator
+    entry: MockConfigEntry
+    coordinator: TrinnovAltitudeCoordinator
+
+
+def client_factory(
+    endpoints: dict[str, tuple[str, int]],
+) -> Callable[..., TrinnovAltitudeClient]:
+    """Return a client constructor that connects each host to its simulator."""
+
+    def create(host: str, **kwargs: Any) -> TrinnovAltitudeClient:
+        address, port = endpoints[host]
+        return TrinnovAltitudeClient(
+            address,
+            port=port,
+            heartbeat_interval=None,
+            reconcile_interval=None,
+            **kwargs,
+        )
+
+    return create
+
+
+async def async_setup_simulated_entry(
+    hass: HomeAssistant,
+    simulator: AltitudeSimulator,
+    unique_id: str,
+    host: str | None = None,
+) -> SimulatedEntry:
+    """Set up one config entry whose client talks to ``simulator``.
+
+    ``host`` is the address stored in the entry; it defaults to the
+    simulator's, and lets many entries share one loopback address.
+    """
+    host = host or simulator.host
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Trinnov Altitude ({host})",
+        data={CONF_HOST: host},
+        unique_id=unique_id,
+    )
+    entry.add_to_hass(hass)
+    with patch(
+        "custom_components.trinnov_altitude.TrinnovAltitudeClient",
+        client_factory({host: (simulator.host, simulator.port)}),
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+    return SimulatedEntry(
+        simulator, entry, hass.data[DOMAIN][entry.entry_id].coordinator
+    )
+
+
+@dataclass
+class PipelineCounters:
+    """Work done by the coordinator and entities between two readings."""
+
+    snapshot_builds: int = 0
+
+
+@contextmanager
+def count_snapshot_builds() -> Iterator[PipelineCounters]:
+    """Count snapshots the coordinator builds from client state."""
+    counters = PipelineCounters()
+    build = coordinator_module.snapshot_from_state
+
+    def counting_build(*args: Any, **kwargs: Any) -> Any:
+        counters.snapshot_builds += 1
+        return build(*args, **kwargs)
+
+    with patch.object(coordinator_module, "snapshot_from_state", counting_build):
+        yield counters
+
+
+class StateWriteProbe:
+    """Timestamp state writes and wait for an entity to reach a state."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Start listening for state changes."""
+        self.writes = 0
+        self._waiters: dict[tuple[str, str], asyncio.Future[float]] = {}
+        self._unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, self._handle)
+
+    @callback
+    def _handle(self, event: Event) -> None:
+        self.writes += 1
+        new_state = event.data["new_state"]
+        if new_state is None:
+            return
+        waiter = self._waiters.pop((event.data["entity_id"], new_state.state), None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(time.perf_counter())
+
+    def expect(self, entity_id: str, state: str) -> asyncio.Future[float]:
+        """Return a future resolving with the time ``entity_id`` shows ``state``."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[(entity_id, state)] = future
+        return future
+
+    def close(self) -> None:
+        """Stop listening."""
+        self._unsub()
+
+
+async def wait_for(future: asyncio.Future[float], timeout: float = 10.0) -> float:
+    """Wait for a probe future with a deadline."""
+    return await asyncio.wait_for(future, timeout)
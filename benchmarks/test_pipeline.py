@@ -0,0 +1,147 @@
+"""End-to-end benchmarks from a wire message to a Home Assistant state write.
+
+Each scenario pushes protocol messages from the simulator, lets the real
+client parse them and the coordinator publish, and times until the number
+entity for volume writes the expected state. Results are added to the JSON
+report written at the end of the session.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .harness import (
+    BenchReport,
+    SimulatedEntry,
+    StateWriteProbe,
+    count_snapshot_builds,
+    latency_summary,
+    wait_for,
+)
+
+ROUNDS = 200
+SWEEPS = 20
+SWEEP_STEPS = 50
+RESYNCS = 20
+
+# Messages a playing processor sends without a user changing anything.
+_STEADY_MESSAGES = (
+    "SRATE 44100",
+    "CURRENT_SOURCE_FORMAT_NAME Dolby TrueHD",
+    "SRATE 48000",
+    "CURRENT_SOURCE_FORMAT_NAME Atmos narrow",
+    "AUDIOSYNC Master",
+    "AUDIOSYNC Slave",
+)
+
+
+def _volume_entity(hass: HomeAssistant, setup: SimulatedEntry) -> str:
+    registry = er.async_get(hass)
+    return next(
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(registry, setup.entry.entry_id)
+        if entry.domain == "number" and entry.unique_id.endswith("-volume-number")
+    )
+
+
+def _volume_levels(count: int, start: float = -60.0) -> list[float]:
+    return [round(start + (index % 100) * 0.5, 1) for index in range(count)]
+
+
+async def _run(
+    hass: HomeAssistant,
+    setup: SimulatedEntry,
+    rounds: list[list[str]],
+) -> dict[str, Any]:
+    """Push each round and time until its final volume is written."""
+    entity_id = _volume_entity(hass, setup)
+    coordinator = setup.coordinator
+    stats = coordinator.push_stats
+    probe = StateWriteProbe(hass)
+    latencies: list[float] = []
+    messages = sum(len(lines) for lines in rounds)
+    writes_before = stats.state_writes
+    suppressed_before = stats.state_writes_suppressed
+    published_before = stats.snapshots_published
+    try:
+        with count_snapshot_builds() as counters:
+            started_all = time.perf_counter()
+            for lines in rounds:
+                final = float(lines[-1].removeprefix("VOLUME "))
+                written = probe.expect(entity_id, str(final))
+                started = time.perf_counter()
+                await setup.simulator.push(*lines)
+                latencies.append(await wait_for(written) - started)
+            elapsed = time.perf_counter() - started_all
+    finally:
+        probe.close()
+
+    return {
+        "messages": messages,
+        "rounds": len(rounds),
+        "elapsed_s": round(elapsed, 4),
+        "throughput_msgs_per_s": round(messages / elapsed, 1),
+        "latency": latency_summary(latencies),
+        "snapshot_builds_per_message": round(counters.snapshot_builds / messages, 4),
+        "snapshots_published_per_message": round(
+            (stats.snapshots_published - published_before) / messages, 4
+        ),
+        "state_writes_per_message": round(
+            (stats.state_writes - writes_before) / messages, 4
+        ),
+        "state_writes_suppressed_per_message": round(
+            (stats.state_writes_suppressed - suppressed_before) / messages, 4
+        ),
+        "ha_state_changed_per_message": round(probe.writes / messages, 4),
+    }
+
+
+async def test_bench_steady_state(
+    hass: HomeAssistant, simulated_entry: SimulatedEntry, bench_report: BenchReport
+) -> None:
+    """Background traffic followed by one volume change, one round at a time."""
+    rounds = [
+        [_STEADY_MESSAGES[index % len(_STEADY_MESSAGES)], f"VOLUME {level}"]
+        for index, level in enumerate(_volume_levels(ROUNDS))
+    ]
+
+    result = await _run(hass, simulated_entry, rounds)
+
+    bench_report.add("steady_state", result)
+    assert result["latency"]["p50_ms"] > 0
+
+
+async def test_bench_volume_sweep(
+    hass: HomeAssistant, simulated_entry: SimulatedEntry, bench_report: BenchReport
+) -> None:
+    """Bursts of volume updates, as a user holding the volume key produces."""
+    rounds = [
+        [f"VOLUME {level}" for level in _volume_levels(SWEEP_STEPS, -70.0 + sweep)]
+        for sweep in range(SWEEPS)
+    ]
+
+    result = await _run(hass, simulated_entry, rounds)
+
+    bench_report.add("volume_sweep", result)
+    # A burst is coalesced: far fewer publishes than messages.
+    assert result["snapshots_published_per_message"] < 1
+
+
+async def test_bench_full_resync(
+    hass: HomeAssistant, simulated_entry: SimulatedEntry, bench_report: BenchReport
+) -> None:
+    """Full catalog and state re-sends, each ending with a volume change."""
+    simulator = simulated_entry.simulator
+    rounds = [
+        [*simulator._initial_messages(), f"VOLUME {level}"]
+        for level in _volume_levels(RESYNCS, -30.0)
+    ]
+
+    result = await _run(hass, simulated_entry, rounds)
+
+    bench_report.add("full_resync", result)
+    assert result["state_writes_per_message"] < 1
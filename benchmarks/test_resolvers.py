@@ -0,0 +1,119 @@
+"""Per-call cost of the state resolvers against a rebuild-per-call reference.
+
+Entities resolve source, preset and upmixer names on every state write. The
+references below index the catalog and normalize the upmixer on each call,
+as the resolvers did before entities passed them a catalog index; resolving
+through that index must stay well ahead of them on a large catalog.
+"""
+
+from __future__ import annotations
+
+import timeit
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+from trinnov_altitude.const import UpmixerMode
+
+from custom_components.trinnov_altitude.catalog import CatalogIndex
+from custom_components.trinnov_altitude.resolvers import (
+    resolve_preset_name,
+    resolve_source_name,
+    resolve_upmixer_value,
+)
+
+from .harness import BenchReport
+
+CALLS = 2000
+CATALOG_SIZE = 256
+# How many times faster than the reference each resolver must be.
+MIN_SPEEDUP = {"source": 4.0, "preset": 4.0, "upmixer": 1.5}
+
+
+def _reference_index(catalog: tuple[tuple[int, str], ...]) -> dict[int, str]:
+    out: dict[int, str] = {}
+    for item in catalog:
+        if not isinstance(item, tuple) or len(item) != 2:
+            continue
+        key, entry = item
+        if isinstance(key, int):
+            out[key] = str(entry)
+    return out
+
+
+def _reference_source(state: SimpleNamespace) -> str | None:
+    index = state.current_source_index
+    return _reference_index(state.sources).get(index) or f"Source {index}"
+
+
+def _reference_preset(state: SimpleNamespace) -> str | None:
+    index = state.current_preset_index
+    return _reference_index(state.presets).get(index) or f"Preset {index}"
+
+
+def _reference_upmixer(state: SimpleNamespace) -> str | None:
+    normalized = str(state.upmixer).strip().lower().replace("_", " ")
+    if normalized in {mode.value for mode in UpmixerMode}:
+        return normalized
+    return str(state.upmixer).strip()
+
+
+def _state() -> SimpleNamespace:
+    return SimpleNamespace(
+        source=None,
+        current_source_index=200,
+        sources=tuple((index, f"Source {index}") for index in range(CATALOG_SIZE)),
+        preset=None,
+        current_preset_index=200,
+        presets=tuple((index, f"Preset {index}") for index in range(CATALOG_SIZE)),
+        upmixer="upmix_on_native",
+        active_upmixer=None,
+    )
+
+
+def _indexed(
+    resolver: Callable[[SimpleNamespace, CatalogIndex], str | None], catalog: str
+) -> Callable[[SimpleNamespace], str | None]:
+    """Return ``resolver`` bound to an index built once, as entities hold it."""
+    index = CatalogIndex(getattr(_state(), catalog))
+    return lambda state: resolver(state, index)
+
+
+def _per_call_us(func: Callable[[SimpleNamespace], object]) -> float:
+    """Return the best-of-five per-call cost in microseconds."""
+    state = _state()
+    best = min(timeit.repeat(lambda: func(state), number=CALLS, repeat=5))
+    return best / CALLS * 1_000_000
+
+
+@pytest.mark.parametrize(
+    ("name", "resolver", "reference"),
+    [
+        ("source", _indexed(resolve_source_name, "sources"), _reference_source),
+        ("preset", _indexed(resolve_preset_name, "presets"), _reference_preset),
+        ("upmixer", resolve_upmixer_value, _reference_upmixer),
+    ],
+)
+def test_bench_resolver(
+    bench_report: BenchReport,
+    name: str,
+    resolver: Callable[[SimpleNamespace], object],
+    reference: Callable[[SimpleNamespace], object],
+) -> None:
+    """Indexed resolvers should beat rebuilding their lookups per call."""
+    assert resolver(_state()) == reference(_state())
+
+    cached_us = _per_call_us(resolver)
+    reference_us = _per_call_us(reference)
+
+    speedup = reference_us / cached_us
+    bench_report.add(
+        f"resolver_{name}",
+        {
+            "catalog_size": CATALOG_SIZE,
+            "per_call_us": round(cached_us, 3),
+            "reference_per_call_us": round(reference_us, 3),
+            "speedup": round(speedup, 1),
+        },
+    )
+    assert speedup >= MIN_SPEEDUP[name]
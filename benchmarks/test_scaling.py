@@ -0,0 +1,233 @@
+"""Scaling benchmarks: many config entries against many simulated processors.
+
+Each scenario sets up ``count`` entries, one per simulator on its own port,
+and reports setup time, steady-state memory, event-loop
+lag and CPU per protocol update. Per-entry figures divide by ``count`` so
+runs at different sizes compare directly; a per-entry number that grows
+with ``count`` points at shared state that does not scale. One unmeasured
+entry stays loaded throughout, so one-time loading and costs shared by all
+entries are in the baselines rather than spread over the measured entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from tests.simulator import AltitudeSimulator
+
+from .harness import (
+    BenchReport,
+    SimulatedEntry,
+    StateWriteProbe,
+    async_setup_simulated_entry,
+    latency_summary,
+    wait_for,
+)
+
+ENTRY_COUNTS = (1, 10, 50, 100)
+UPDATE_ROUNDS = 20
+LAG_INTERVAL = 0.005
+
+
+@asynccontextmanager
+async def _simulators(count: int) -> AsyncIterator[list[AltitudeSimulator]]:
+    """Serve ``count`` simulators, each on its own free port."""
+    async with AsyncExitStack() as stack:
+        yield [
+            await stack.enter_async_context(
+                AltitudeSimulator(device_id=f"{index + 1:08}")
+            )
+            for index in range(count)
+        ]
+
+
+async def _setup_entries(
+    hass: HomeAssistant, simulators: list[AltitudeSimulator]
+) -> tuple[list[SimulatedEntry], list[float]]:
+    """Set up one entry per simulator; return the entries and setup times."""
+    entries: list[SimulatedEntry] = []
+    durations: list[float] = []
+    for index, simulator in enumerate(simulators):
+        started = time.perf_counter()
+        entries.append(
+            await async_setup_simulated_entry(
+                hass, simulator, f"SCALE{index}", host=f"altitude-{index}.local"
+            )
+        )
+        await hass.async_block_till_done()
+        durations.append(time.perf_counter() - started)
+    return entries, durations
+
+
+async def _unload_entries(hass: HomeAssistant, entries: list[SimulatedEntry]) -> None:
+    for setup in entries:
+        assert await hass.config_entries.async_unload(setup.entry.entry_id)
+        await hass.config_entries.async_remove(setup.entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@asynccontextmanager
+async def _warm_entry(hass: HomeAssistant) -> AsyncIterator[None]:
+    """Keep one unmeasured entry loaded for the whole scenario.
+
+    The first entry pays for loading the integration and its platforms, and
+    for listeners that exist only while any entry is loaded.
+    """
+    async with _simulators(1) as (simulator,):
+        setup = await async_setup_simulated_entry(
+            hass, simulator, "WARMUP", host="altitude-warmup.local"
+        )
+        await hass.async_block_till_done()
+        try:
+            yield
+        finally:
+            await _unload_entries(hass, [setup])
+
+
+def _volume_entities(hass: HomeAssistant, entries: list[SimulatedEntry]) -> list[str]:
+    registry = er.async_get(hass)
+    return [
+        next(
+            entry.entity_id
+            for entry in er.async_entries_for_config_entry(
+                registry, setup.entry.entry_id
+            )
+            if entry.domain == "number" and entry.unique_id.endswith("-volume-number")
+        )
+        for setup in entries
+    ]
+
+
+class LoopLagSampler:
+    """Measure how late the event loop wakes a task that sleeps ``interval``."""
+
+    def __init__(self, interval: float = LAG_INTERVAL) -> None:
+        """Initialize a sampler; call ``start`` to begin sampling."""
+        self.interval = interval
+        self.lags: list[float] = []
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start sampling in the background."""
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+
+    async def stop(self) -> list[float]:
+        """Stop sampling and return the lags seen, in seconds."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+        return self.lags
+
+    async def _sample(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.lags.append(max(time.perf_counter() - started - self.interval, 0.0))
+
+
+async def _steady_state(
+    hass: HomeAssistant, entries: list[SimulatedEntry]
+) -> dict[str, Any]:
+    """Push a volume change to every device per round and time the fan-out."""
+    entity_ids = _volume_entities(hass, entries)
+    probe = StateWriteProbe(hass)
+    sampler = LoopLagSampler()
+    rounds: list[float] = []
+    messages = 0
+    cpu_started = time.process_time()
+    sampler.start()
+    try:
+        for index in range(UPDATE_ROUNDS):
+            level = str(round(-60.0 + index * 0.5, 1))
+            written = [probe.expect(entity_id, level) for entity_id in entity_ids]
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(
+                    setup.simulator.push("SRATE 44100", f"VOLUME {level}")
+                    for setup in entries
+                )
+            )
+            messages += 2 * len(entries)
+            done = await asyncio.gather(*(wait_for(future) for future in written))
+            rounds.append(max(done) - started)
+    finally:
+        lags = await sampler.stop()
+        probe.close()
+    cpu = time.process_time() - cpu_started
+    return {
+        "messages": messages,
+        "round_latency": latency_summary(rounds),
+        "loop_lag": latency_summary(lags),
+        "cpu_per_update_us": round(cpu / messages * 1e6, 2),
+        "ha_state_changed_per_update": round(probe.writes / messages, 4),
+    }
+
+
+async def _steady_state_memory(hass: HomeAssistant, count: int) -> int:
+    """Return bytes still allocated after ``count`` entries have settled.
+
+    The idle simulators are subtracted, but they run in this process, so the
+    buffers they allocate for each accepted connection are still counted.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        async with _simulators(count) as simulators:
+            simulators_only = tracemalloc.get_traced_memory()[0]
+            entries, _durations = await _setup_entries(hass, simulators)
+            await asyncio.sleep(0.1)
+            await hass.async_block_till_done()
+            gc.collect()
+            settled = tracemalloc.get_traced_memory()[0]
+            await _unload_entries(hass, entries)
+    finally:
+        tracemalloc.stop()
+    return settled - simulators_only
+
+
+@pytest.mark.parametrize("count", ENTRY_COUNTS)
+async def test_bench_scaling(
+    hass: HomeAssistant, socket_enabled, bench_report: BenchReport, count: int
+) -> None:
+    """Set up ``count`` entries and report per-entry overhead."""
+    async with _warm_entry(hass):
+        tasks_before = len(asyncio.all_tasks())
+        listeners_before = sum(hass.bus.async_listeners().values())
+        states_before = len(hass.states.async_all())
+
+        async with _simulators(count) as simulators:
+            setup_started = time.perf_counter()
+            entries, durations = await _setup_entries(hass, simulators)
+            setup_total = time.perf_counter() - setup_started
+
+            tasks = len(asyncio.all_tasks()) - tasks_before
+            listeners = sum(hass.bus.async_listeners().values()) - listeners_before
+            entities = len(hass.states.async_all()) - states_before
+            steady = await _steady_state(hass, entries)
+            await _unload_entries(hass, entries)
+
+        memory = await _steady_state_memory(hass, count)
+
+    result = {
+        "entries": count,
+        "setup_total_s": round(setup_total, 4),
+        "setup_per_entry": latency_summary(durations),
+        "memory_kib": round(memory / 1024, 1),
+        "memory_per_entry_kib": round(memory / count / 1024, 1),
+        "tasks_per_entry": round(tasks / count, 2),
+        "bus_listeners_per_entry": round(listeners / count, 2),
+        "entities_per_entry": round(entities / count, 2),
+        **steady,
+    }
+    bench_report.add(f"scaling_{count}", result)
+    assert result["entities_per_entry"] > 0
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_MAC, EVENT_HOMEASSISTANT_STOP, Platform
@@ -10,8 +11,14 @@ from homeassistant.core import Event, HomeAssistant
 
 from trinnov_altitude.client import TrinnovAltitudeClient
 
+from .cache import TrinnovAltitudeStateCache
 from .commands import TrinnovAltitudeCommands
-from .const import CLIENT_ID, DOMAIN
+from .const import (
+    CLIENT_ID,
+    CONF_BACKGROUND_STARTUP,
+    CONF_PUSH_COALESCE_WINDOW,
+    DOMAIN,
+)
 from .coordinator import TrinnovAltitudeCoordinator
 from .models import TrinnovAltitudeIntegrationData
 from .services import async_setup_services, async_unload_services
@@ -32,6 +39,7 @@ PLATFORMS: list[str] = [
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up a config entry for Trinnov Altitude."""
 
+    setup_started = time.monotonic()
     host = entry.data[CONF_HOST].strip()
     stable_device_id = entry.unique_id
     if stable_device_id is None:
@@ -49,11 +57,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device.state.id = stable_device_id
 
     coordinator = TrinnovAltitudeCoordinator(
-        hass, device, commands, stable_device_id=stable_device_id
+        hass,
+        device,
+        commands,
+        stable_device_id=stable_device_id,
+        cache=TrinnovAltitudeStateCache(hass, stable_device_id),
+        push_coalesce_window=entry.options.get(CONF_PUSH_COALESCE_WINDOW, 0.0),
     )
 
     try:
-        await coordinator.async_start()
+        await coordinator.async_start(
+            background=entry.options.get(CONF_BACKGROUND_STARTUP, False)
+        )
     except Exception:
         await coordinator.async_shutdown()
         _LOGGER.exception("Unexpected error while starting Trinnov Altitude client")
@@ -72,7 +87,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         await coordinator.async_shutdown()
 
     entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, unload))
+    platforms_started = time.monotonic()
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    timings = coordinator.startup_timings
+    timings.platform_setup = time.monotonic() - platforms_started
+    timings.setup_entry = time.monotonic() - setup_started
+    _LOGGER.debug("Trinnov Altitude startup timings for %s: %s", host, timings)
     return True
 
 
@@ -89,3 +110,10 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass.data.pop(DOMAIN, None)
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove persisted state for a deleted Trinnov Altitude config entry."""
+
+    if entry.unique_id is not None:
+        await TrinnovAltitudeStateCache(hass, entry.unique_id).async_remove()
@@ -76,6 +76,7 @@ class TrinnovAltitudeButton(TrinnovAltitudeEntity, ButtonEntity):
     """Representation of a Trinnov Altitude button."""
 
     entity_description: TrinnovAltitudeButtonEntityDescription
+    _snapshot_fields = frozenset()
 
     def __init__(
         self,
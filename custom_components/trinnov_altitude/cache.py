@@ -0,0 +1,143 @@
+"""Warm-start cache of the last synced Trinnov Altitude state."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from trinnov_altitude.adapter import AltitudeSnapshot
+
+STORAGE_VERSION = 1
+SAVE_DELAY_SECONDS = 10.0
+
+
+@dataclass(frozen=True)
+class CachedState:
+    """Catalog and selector values remembered across restarts."""
+
+    sources: tuple[tuple[int, str], ...] = ()
+    presets: tuple[tuple[int, str], ...] = ()
+    version: str | None = None
+    source: str | None = None
+    current_source_index: int | None = None
+    preset: str | None = None
+    current_preset_index: int | None = None
+    upmixer: str | None = None
+
+    @classmethod
+    def from_snapshot(cls, snapshot: AltitudeSnapshot) -> CachedState:
+        """Capture the cacheable subset of a snapshot."""
+        return cls(
+            sources=snapshot.sources,
+            presets=snapshot.presets,
+            version=snapshot.version,
+            source=snapshot.source,
+            current_source_index=snapshot.current_source_index,
+            preset=snapshot.preset,
+            current_preset_index=snapshot.current_preset_index,
+            upmixer=snapshot.upmixer,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CachedState:
+        """Restore a cached state from its stored representation."""
+        return cls(
+            sources=_catalog_from_json(data.get("sources")),
+            presets=_catalog_from_json(data.get("presets")),
+            version=data.get("version"),
+            source=data.get("source"),
+            current_source_index=data.get("current_source_index"),
+            preset=data.get("preset"),
+            current_preset_index=data.get("current_preset_index"),
+            upmixer=data.get("upmixer"),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "sources": [list(item) for item in self.sources],
+            "presets": [list(item) for item in self.presets],
+            "version": self.version,
+            "source": self.source,
+            "current_source_index": self.current_source_index,
+            "preset": self.preset,
+            "current_preset_index": self.current_preset_index,
+            "upmixer": self.upmixer,
+        }
+
+    def fill(self, snapshot: AltitudeSnapshot) -> AltitudeSnapshot:
+        """Fill fields the live snapshot has not received yet with cached values."""
+        changes: dict[str, Any] = {}
+        for name in (
+            "sources",
+            "presets",
+            "version",
+            "source",
+            "current_source_index",
+            "preset",
+            "current_preset_index",
+            "upmixer",
+        ):
+            cached = getattr(self, name)
+            if cached in (None, ()):
+                continue
+            if getattr(snapshot, name) in (None, ()):
+                changes[name] = cached
+        if not changes:
+            return snapshot
+        return replace(snapshot, **changes)
+
+
+class TrinnovAltitudeStateCache:
+    """Persist the last synced catalog through a debounced store."""
+
+    def __init__(self, hass: HomeAssistant, stable_device_id: str) -> None:
+        """Initialize the cache for one device."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{stable_device_id}"
+        )
+        self._state: CachedState | None = None
+
+    @property
+    def state(self) -> CachedState | None:
+        """Return the most recently loaded or saved state."""
+        return self._state
+
+    async def async_load(self) -> CachedState | None:
+        """Load the cached state from disk."""
+        data = await self._store.async_load()
+        if isinstance(data, dict):
+            self._state = CachedState.from_dict(data)
+        return self._state
+
+    def async_update(self, snapshot: AltitudeSnapshot) -> None:
+        """Schedule a save when a synced snapshot differs from the cache."""
+        if not snapshot.synced:
+            return
+        state = CachedState.from_snapshot(snapshot)
+        if state == self._state:
+            return
+        self._state = state
+        self._store.async_delay_save(state.as_dict, SAVE_DELAY_SECONDS)
+
+    async def async_remove(self) -> None:
+        """Delete the cached state."""
+        self._state = None
+        await self._store.async_remove()
+
+
+def _catalog_from_json(value: object) -> tuple[tuple[int, str], ...]:
+    if not isinstance(value, list):
+        return ()
+    items: list[tuple[int, str]] = []
+    for item in value:
+        if isinstance(item, list) and len(item) == 2 and isinstance(item[0], int):
+            items.append((item[0], str(item[1])))
+    return tuple(sorted(items))
@@ -0,0 +1,199 @@
+"""Protocol capture log for reproducing Trinnov Altitude sessions."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from trinnov_altitude import protocol
+from trinnov_altitude.lifecycle import (
+    AltitudeRuntimeState,
+    ControlHealth,
+    PowerState,
+    SyncState,
+    TransportState,
+)
+
+if TYPE_CHECKING:
+    from trinnov_altitude.protocol import Message
+
+CAPTURE_VERSION = 1
+FLUSH_INTERVAL_SECONDS = 1.0
+MAX_BUFFERED_RECORDS = 256
+
+# Lifecycle fields captured with runtime changes; timestamps are left out so
+# the per-message ``last_message_at`` bump does not produce a record.
+_RUNTIME_FIELDS = {
+    "transport": TransportState,
+    "sync": SyncState,
+    "control": ControlHealth,
+    "power": PowerState,
+}
+
+
+@dataclass(frozen=True)
+class CaptureRecord:
+    """One client event, ``offset`` seconds after the capture started."""
+
+    offset: float
+    event: str
+    message: Message | None = None
+    runtime: dict[str, Any] | None = None
+
+
+def encode_record(record: CaptureRecord) -> str:
+    """Return a record as one compact JSON line."""
+    message = record.message
+    payload: list[Any] = [round(record.offset, 6), record.event]
+    if message is not None:
+        payload += [type(message).__name__, dataclasses.asdict(message)]
+    elif record.runtime is not None:
+        payload += [None, {name: state.value for name, state in record.runtime.items()}]
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def decode_record(line: str) -> CaptureRecord:
+    """Parse a line written by ``encode_record``."""
+    offset, event, *rest = json.loads(line)
+    if not rest:
+        return CaptureRecord(offset, event)
+    kind, fields = rest
+    if kind is None:
+        return CaptureRecord(
+            offset,
+            event,
+            runtime={
+                name: _RUNTIME_FIELDS[name](value) for name, value in fields.items()
+            },
+        )
+    message_type = getattr(protocol, kind)
+    fields = {
+        name: tuple(value) if isinstance(value, list) else value
+        for name, value in fields.items()
+    }
+    return CaptureRecord(offset, event, message=message_type(**fields))
+
+
+def read_capture(path: Path) -> tuple[dict[str, Any], list[CaptureRecord]]:
+    """Return the header and records of a capture file."""
+    with path.open(encoding="utf-8") as capture:
+        header = json.loads(capture.readline())
+        if header.get("version") != CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture version in {path}")
+        return header, [decode_record(line) for line in capture if line.strip()]
+
+
+def runtime_fields(runtime: AltitudeRuntimeState) -> dict[str, Any]:
+    """Return the captured lifecycle fields of a runtime state."""
+    return {name: getattr(runtime, name) for name in _RUNTIME_FIELDS}
+
+
+class ProtocolCapture:
+    """Append client events to a capture file without blocking the event loop.
+
+    Records are encoded in the client callback and buffered; the buffer is
+    written from the executor every ``FLUSH_INTERVAL_SECONDS``, or as soon
+    as ``MAX_BUFFERED_RECORDS`` accumulate.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: Path, device_id: str) -> None:
+        """Initialize a capture that will write to ``path``."""
+        self.hass = hass
+        self.path = path
+        self.device_id = device_id
+        self.records = 0
+        self._started = 0.0
+        self._file: IO[str] | None = None
+        self._buffer: list[str] = []
+        self._runtime: dict[str, Any] | None = None
+        self._flush_timer: CALLBACK_TYPE | None = None
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def async_open(self) -> None:
+        """Create the capture file and write its header."""
+        header = json.dumps(
+            {
+                "version": CAPTURE_VERSION,
+                "device_id": self.device_id,
+                "started_at": datetime.now(UTC).isoformat(),
+            }
+        )
+        self._file = await self.hass.async_add_executor_job(self._open, header)
+        self._started = self.hass.loop.time()
+
+    def _open(self, header: str) -> IO[str]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        capture = self.path.open("w", encoding="utf-8")
+        capture.write(header + "\n")
+        capture.flush()
+        return capture
+
+    @callback
+    def record(
+        self, event: str, message: Message | None, runtime: AltitudeRuntimeState
+    ) -> None:
+        """Buffer a client event; runtime changes only when the lifecycle moved."""
+        captured_runtime = None
+        if event == "runtime_changed":
+            captured_runtime = runtime_fields(runtime)
+            if captured_runtime == self._runtime:
+                return
+            self._runtime = captured_runtime
+        self._buffer.append(
+            encode_record(
+                CaptureRecord(
+                    self.hass.loop.time() - self._started,
+                    event,
+                    message,
+                    captured_runtime,
+                )
+            )
+        )
+        self.records += 1
+        if len(self._buffer) >= MAX_BUFFERED_RECORDS:
+            self._start_flush()
+        elif self._flush_timer is None:
+            self._flush_timer = async_call_later(
+                self.hass, FLUSH_INTERVAL_SECONDS, self._async_flush_later
+            )
+
+    @callback
+    def _async_flush_later(self, _now: datetime) -> None:
+        self._flush_timer = None
+        self._start_flush()
+
+    def _start_flush(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self.hass.async_create_background_task(
+                self._async_flush(), "trinnov_altitude capture flush"
+            )
+
+    async def _async_flush(self) -> None:
+        while self._buffer and self._file is not None:
+            lines, self._buffer = self._buffer, []
+            await self.hass.async_add_executor_job(self._write, self._file, lines)
+
+    @staticmethod
+    def _write(capture: IO[str], lines: list[str]) -> None:
+        capture.write("\n".join(lines) + "\n")
+        capture.flush()
+
+    async def async_close(self) -> None:
+        """Write everything buffered and close the file."""
+        if self._flush_timer is not None:
+            self._flush_timer()
+            self._flush_timer = None
+        if self._flush_task is not None:
+            await self._flush_task
+        await self._async_flush()
+        if self._file is not None:
+            await self.hass.async_add_executor_job(self._file.close)
+            self._file = None
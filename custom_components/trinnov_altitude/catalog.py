@@ -0,0 +1,89 @@
+"""Indexed name lookup for Trinnov Altitude source and preset catalogs."""
+
+from __future__ import annotations
+
+import difflib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+Catalog = tuple[tuple[int, str], ...]
+
+FUZZY_CUTOFF = 0.75
+
+
+def normalize_name(name: str) -> str:
+    """Return a case-insensitive key with runs of whitespace collapsed."""
+    return " ".join(name.casefold().split())
+
+
+class CatalogIndex:
+    """Name to id lookup for one catalog, built once per catalog content.
+
+    Lookups try an exact match, then a case-insensitive match, then a match
+    with whitespace normalized, and optionally a fuzzy match. When several
+    entries share a name, lookups return the lowest id, as matching names in
+    catalog order always has, while ``names`` keeps the highest id, as the
+    select options always have.
+    """
+
+    def __init__(self, catalog: Catalog) -> None:
+        """Build lookup tables for the catalog."""
+        self._exact: dict[str, int] = {}
+        self._casefolded: dict[str, int] = {}
+        self._normalized: dict[str, int] = {}
+        self._options: dict[str, int] = {}
+        for catalog_id, name in sorted(catalog):
+            self._exact.setdefault(name, catalog_id)
+            self._casefolded.setdefault(name.casefold(), catalog_id)
+            self._normalized.setdefault(normalize_name(name), catalog_id)
+            self._options[name] = catalog_id
+        self._names = dict(catalog)
+        self.catalog = catalog
+
+    @property
+    def names(self) -> dict[str, int]:
+        """Return display names mapped to ids, in catalog order."""
+        return self._options
+
+    def lookup(self, name: str, *, fuzzy: bool = False) -> int | None:
+        """Return the id for ``name``, or None when nothing matches."""
+        if (catalog_id := self._exact.get(name)) is not None:
+            return catalog_id
+        if (catalog_id := self._casefolded.get(name.casefold())) is not None:
+            return catalog_id
+        normalized = normalize_name(name)
+        if (catalog_id := self._normalized.get(normalized)) is not None:
+            return catalog_id
+        if not fuzzy:
+            return None
+        matches = difflib.get_close_matches(
+            normalized, self._normalized, n=1, cutoff=FUZZY_CUTOFF
+        )
+        return self._normalized[matches[0]] if matches else None
+
+    def name_for(self, catalog_id: int) -> str | None:
+        """Return the display name for an id."""
+        return self._names.get(catalog_id)
+
+
+def catalog_from_mapping(mapping: Mapping[int, str]) -> Catalog:
+    """Return the hashable catalog form of a client-state mapping."""
+    return tuple(sorted(mapping.items()))
+
+
+def catalog_from_value(value: object) -> Catalog:
+    """Return the catalog form of a snapshot tuple or client-state mapping.
+
+    Entries without an integer id are skipped and names are coerced to text.
+    """
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, tuple):
+        items = [item for item in value if isinstance(item, tuple) and len(item) == 2]
+    else:
+        return ()
+    return tuple(
+        sorted((key, str(name)) for key, name in items if isinstance(key, int))
+    )
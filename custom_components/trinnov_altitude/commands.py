@@ -2,17 +2,111 @@
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import heapq
+import inspect
+import itertools
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 
 from trinnov_altitude.client import TrinnovAltitudeClient
+from trinnov_altitude.command_bridge import (
+    VALID_COMMANDS,
+    normalize_args,
+    parse_command,
+)
 from trinnov_altitude.exceptions import NotConnectedError, TrinnovAltitudeError
 from trinnov_altitude.lifecycle import PowerState
 
+from .catalog import CatalogIndex, catalog_from_mapping
+from .metrics import CommandMetrics
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Sequence
+
+MAX_QUEUED_COMMANDS = 32
+# How long commands issued during wake-up are held for the processor to sync.
+WAKE_DEFER_SECONDS = 120.0
+
+
+class CommandPriority(IntEnum):
+    """Scheduling class for queued commands; lower values run first."""
+
+    POWER = 0
+    MUTE = 1
+    NORMAL = 2
+    BULK = 3
+
+
+_COMMAND_PRIORITIES = {
+    "power_off": CommandPriority.POWER,
+    "mute_on": CommandPriority.MUTE,
+    "mute_off": CommandPriority.MUTE,
+    "mute_set": CommandPriority.MUTE,
+    "mute_toggle": CommandPriority.MUTE,
+    "preset_set": CommandPriority.BULK,
+    "remapping_mode_set": CommandPriority.BULK,
+    "source_set": CommandPriority.BULK,
+    "source_set_by_name": CommandPriority.BULK,
+    "upmixer_set": CommandPriority.BULK,
+}
+
+# Idempotent setters sharing a key replace each other while queued.
+_COALESCE_KEYS = {
+    "preset_set": "preset",
+    "remapping_mode_set": "remapping_mode",
+    "source_set": "source",
+    "source_set_by_name": "source",
+    "upmixer_set": "upmixer",
+    "volume_percentage_set": "volume",
+    "volume_set": "volume",
+}
+
+
+@dataclass
+class CommandQueueStatistics:
+    """Counters describing command queue pressure."""
+
+    enqueued: int = 0
+    executed: int = 0
+    coalesced: int = 0
+    rejected: int = 0
+    deferred: int = 0
+    deferred_expired: int = 0
+    max_depth: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    last_wait: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def average_wait(self) -> float:
+        """Return the mean time executed commands spent queued."""
+        return self.total_wait / self.executed if self.executed else 0.0
+
+
+@dataclass(order=True)
+class _QueuedCommand:
+    priority: int
+    sequence: int
+    method_name: str = field(compare=False)
+    enqueued_at: float = field(compare=False)
+    coalesce_key: str | None = field(compare=False)
+    # Resolves True when the command may run, False when it was superseded.
+    turn: asyncio.Future[bool] = field(compare=False)
+
 
 class TrinnovAltitudeCommands:
-    """Centralized command execution and optional ACK policy."""
+    """Centralized command execution and optional ACK policy.
+
+    Commands run one at a time per device. Waiting commands are ordered by
+    priority class, then arrival; a queued idempotent setter is replaced by a
+    newer one for the same setting. While the processor is waking, the queue
+    is held and flushed once the coordinator reports it synced.
+    """
 
     _CLIENT_CONVERGENCE_METHODS = {
         "preset_set",
@@ -21,12 +115,304 @@ class TrinnovAltitudeCommands:
         "upmixer_set",
     }
 
-    def __init__(self, client: TrinnovAltitudeClient) -> None:
+    def __init__(
+        self, client: TrinnovAltitudeClient, max_queued: int = MAX_QUEUED_COMMANDS
+    ) -> None:
         """Initialize command service."""
         self._client = client
+        self._max_queued = max_queued
+        self._queue: list[_QueuedCommand] = []
+        self._queued = 0
+        self._sequence = itertools.count()
+        self._coalescable: dict[str, _QueuedCommand] = {}
+        self._busy = False
+        self._held_until: float | None = None
+        self._hold_expiry: asyncio.TimerHandle | None = None
+        self._ready: asyncio.Event | None = None
+        self._catalogs: Callable[[str], CatalogIndex] | None = None
+        self._runtime_changed: Callable[[], None] | None = None
+        self.queue_stats = CommandQueueStatistics()
+        self.metrics = CommandMetrics()
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of commands waiting to run."""
+        return self._queued
+
+    @property
+    def deferring(self) -> bool:
+        """Return whether commands are held until a waking processor syncs."""
+        return self._held_until is not None
+
+    def defer_until_ready(self, timeout: float = WAKE_DEFER_SECONDS) -> None:
+        """Hold queued commands until ``release_deferred`` or ``timeout``.
+
+        Commands still held at the deadline fail instead of being sent.
+        """
+        self._held_until = time.monotonic() + timeout
+        if self._ready is None or self._ready.is_set():
+            self._ready = asyncio.Event()
+        if self._hold_expiry is not None:
+            self._hold_expiry.cancel()
+        self._hold_expiry = asyncio.get_running_loop().call_later(
+            timeout, self._expire_hold
+        )
+
+    def release_deferred(self) -> None:
+        """Stop holding commands and run the ones waiting, in queue order."""
+        if self._held_until is None:
+            return
+        self._end_hold()
+
+    def _end_hold(self) -> None:
+        self._held_until = None
+        if self._hold_expiry is not None:
+            self._hold_expiry.cancel()
+            self._hold_expiry = None
+        if self._ready is not None:
+            self._ready.set()
+        if not self._busy:
+            self._grant_next()
+
+    def _expire_hold(self) -> None:
+        """Fail every held command once the processor missed the deadline."""
+        self._hold_expiry = None
+        self._held_until = None
+        held, self._queue = self._queue, []
+        self._coalescable.clear()
+        for entry in held:
+            if entry.turn.done():
+                continue
+            self._queued -= 1
+            self.queue_stats.deferred_expired += 1
+            entry.turn.set_exception(
+                HomeAssistantError(
+                    "Trinnov Altitude did not finish waking up in time; "
+                    f"dropped {entry.method_name}"
+                )
+            )
+
+    async def async_wait_until_ready(self) -> None:
+        """Wait for a waking processor to sync; return at once otherwise."""
+        if not self.deferring or self._ready is None or self._held_until is None:
+            return
+        try:
+            async with asyncio.timeout(self._held_until - time.monotonic()):
+                await self._ready.wait()
+        except TimeoutError as exc:
+            raise HomeAssistantError(
+                "Trinnov Altitude did not finish waking up in time"
+            ) from exc
+
+    def parse_command_lines(
+        self, lines: Iterable[str]
+    ) -> list[tuple[str, tuple[Any, ...]]]:
+        """Parse and validate a command list before any of it is sent.
+
+        Raises ServiceValidationError naming the first invalid line.
+        """
+        lines = list(lines)
+        calls: list[tuple[str, tuple[Any, ...]]] = []
+        for position, line in enumerate(lines, start=1):
+            prefix = f"Command {position} ('{line}')" if len(lines) > 1 else None
+            method_name: str | None = None
+            try:
+                parsed = parse_command(line)
+                method_name = parsed.method_name
+                if method_name not in VALID_COMMANDS:
+                    raise ServiceValidationError(
+                        f"'{method_name}' is not a valid Trinnov Altitude command"
+                    )
+                args = tuple(normalize_args(method_name, parsed.args))
+                inspect.signature(getattr(self._client, method_name)).bind(*args)
+            except ServiceValidationError as exc:
+                raise _prefixed(prefix, str(exc)) from exc
+            except TypeError as exc:
+                raise _prefixed(
+                    prefix,
+                    f"Invalid arguments for command '{method_name or line}'. "
+                    "Expected format: <command> <arg1> <arg2> ...",
+                ) from exc
+            except ValueError as exc:
+                raise _prefixed(prefix, str(exc)) from exc
+            calls.append((method_name, args))
+        return calls
+
+    def use_catalogs(self, catalogs: Callable[[str], CatalogIndex]) -> None:
+        """Resolve names through the coordinator's catalog indexes.
+
+        The coordinator keeps each index until its catalog changes, so lookups
+        do not re-sort the client catalogs.
+        """
+        self._catalogs = catalogs
+
+    def on_runtime_changed(self, listener: Callable[[], None]) -> None:
+        """Call ``listener`` after a command updates the client runtime itself.
+
+        Powering off marks the runtime off without a device echo, so the
+        coordinator publishes it from here, whichever path sent the command.
+        """
+        self._runtime_changed = listener
+
+    def _catalog_index(self, name: str) -> CatalogIndex:
+        if self._catalogs is not None:
+            return self._catalogs(name)
+        return CatalogIndex(catalog_from_mapping(getattr(self._client.state, name)))
+
+    def source_id(self, name: str, *, fuzzy: bool = False) -> int:
+        """Resolve a source name to its id through the catalog index."""
+        source_id = self._catalog_index("sources").lookup(name, fuzzy=fuzzy)
+        if source_id is None:
+            raise ValueError(f"Unknown source name: {name}")
+        return source_id
+
+    def preset_id(self, name: str, *, fuzzy: bool = False) -> int:
+        """Resolve a preset name to its id through the catalog index."""
+        preset_id = self._catalog_index("presets").lookup(name, fuzzy=fuzzy)
+        if preset_id is None:
+            raise ValueError(f"Unknown preset name: {name}")
+        return preset_id
 
     async def invoke(
         self, method_name: str, *args: Any, require_ack: bool = False
+    ) -> None:
+        """Queue a client command and run it when its turn comes.
+
+        Returns without sending when a newer command for the same setting
+        replaced this one while it was queued.
+        """
+        await self._run_queued(
+            method_name,
+            _COMMAND_PRIORITIES.get(method_name, CommandPriority.NORMAL),
+            _COALESCE_KEYS.get(method_name),
+            lambda: self._execute(method_name, *args, require_ack=require_ack),
+        )
+
+    async def invoke_pipelined(
+        self, calls: Sequence[tuple[str, tuple[Any, ...]]]
+    ) -> list[Exception | None]:
+        """Run several commands with ACK tracking, pipelining their round trips.
+
+        Consecutive commands with a raw protocol line are written back to back
+        and their ACKs matched as they stream in, so source, preset and
+        upmixer changes are confirmed by ACK rather than by waiting for state
+        convergence. Other commands run on their own, in order. The batch
+        occupies one queue slot at the priority of its most urgent command.
+        Returns one result per call: None on success or the exception that
+        call raised.
+        """
+        if not calls:
+            return []
+        priority = min(
+            _COMMAND_PRIORITIES.get(name, CommandPriority.NORMAL) for name, _ in calls
+        )
+        results: list[Exception | None] = []
+        await self._run_queued(
+            "pipeline", priority, None, lambda: self._execute_pipelined(calls, results)
+        )
+        return results
+
+    async def _run_queued(
+        self,
+        method_name: str,
+        priority: int,
+        coalesce_key: str | None,
+        operation: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Wait for this operation's turn on the device line, then run it."""
+        entry = self._enqueue(method_name, priority, coalesce_key)
+        if self.deferring:
+            self.queue_stats.deferred += 1
+        if not self._busy:
+            self._grant_next()
+        try:
+            run = await entry.turn
+        except asyncio.CancelledError:
+            if entry.turn.cancelled():
+                self._discard(entry)
+            elif entry.turn.exception() is None and entry.turn.result():
+                self._grant_next()
+            raise
+        if not run:
+            return
+
+        wait = time.monotonic() - entry.enqueued_at
+        stats = self.queue_stats
+        stats.executed += 1
+        stats.total_wait += wait
+        stats.max_wait = max(stats.max_wait, wait)
+        stats.last_wait[method_name] = wait
+        try:
+            await operation()
+        finally:
+            self._grant_next()
+
+    def _enqueue(
+        self, method_name: str, priority: int, key: str | None
+    ) -> _QueuedCommand:
+        """Add a command to the queue, superseding a queued command it replaces."""
+        previous = self._coalescable.pop(key, None) if key is not None else None
+        if previous is not None:
+            previous.turn.set_result(False)
+            self._queued -= 1
+            self.queue_stats.coalesced += 1
+            sequence = previous.sequence
+        elif self._queued >= self._max_queued:
+            self.queue_stats.rejected += 1
+            raise HomeAssistantError(
+                f"Trinnov Altitude command queue is full ({self._max_queued}); "
+                f"dropped {method_name}"
+            )
+        else:
+            sequence = next(self._sequence)
+
+        entry = _QueuedCommand(
+            priority=priority,
+            sequence=sequence,
+            method_name=method_name,
+            enqueued_at=time.monotonic(),
+            coalesce_key=key,
+            turn=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(self._queue, entry)
+        self._queued += 1
+        if key is not None:
+            self._coalescable[key] = entry
+        self.queue_stats.enqueued += 1
+        self.queue_stats.max_depth = max(self.queue_stats.max_depth, self._queued)
+        return entry
+
+    def _grant_next(self) -> None:
+        """Hand the line to the highest-priority live command, if any."""
+        if self.deferring:
+            self._busy = False
+            return
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            if entry.turn.done():
+                continue
+            self._queued -= 1
+            if (
+                entry.coalesce_key is not None
+                and self._coalescable.get(entry.coalesce_key) is entry
+            ):
+                del self._coalescable[entry.coalesce_key]
+            self._busy = True
+            entry.turn.set_result(True)
+            return
+        self._busy = False
+
+    def _discard(self, entry: _QueuedCommand) -> None:
+        """Forget a queued command whose caller was cancelled."""
+        self._queued -= 1
+        if (
+            entry.coalesce_key is not None
+            and self._coalescable.get(entry.coalesce_key) is entry
+        ):
+            del self._coalescable[entry.coalesce_key]
+
+    async def _execute(
+        self, method_name: str, *args: Any, require_ack: bool = False
     ) -> None:
         """Invoke a client command by method name, with optional ACK wait."""
         try:
@@ -35,37 +421,108 @@ class TrinnovAltitudeCommands:
                     raise ValueError(
                         "source_set_by_name expects exactly one source name"
                     )
-                source_name = str(args[0])
-                for source_id, name in self._client.state.sources.items():
-                    if name == source_name:
-                        await self._client.source_set(source_id)
-                        return
-                raise ValueError(f"Unknown source name: {source_name}")
+                source_id = self.source_id(str(args[0]))
+                await self._timed(
+                    method_name, "converge", self._client.source_set(source_id)
+                )
+                return
 
             if method_name in self._CLIENT_CONVERGENCE_METHODS:
-                await getattr(self._client, method_name)(*args)
+                await self._timed(
+                    method_name,
+                    "converge",
+                    getattr(self._client, method_name)(*args),
+                )
                 return
 
             if require_ack:
                 line = self._build_line(method_name, args)
                 if line is not None:
-                    await self._client.command(
-                        line,
-                        wait_for_ack=True,
-                        ack_timeout=self._client.command_timeout,
-                    )
-                    if method_name == "power_off":
-                        self._client.runtime = self._client.runtime.with_changes(
-                            power=PowerState.OFF
-                        )
+                    await self._send_acked(method_name, line)
                     return
 
-            await getattr(self._client, method_name)(*args)
+            await self._timed(
+                method_name, "send", getattr(self._client, method_name)(*args)
+            )
         except NotConnectedError:
             raise
         except TrinnovAltitudeError as exc:
             raise HomeAssistantError(str(exc)) from exc
 
+    async def _timed(
+        self,
+        method_name: str,
+        kind: str,
+        call: Awaitable[Any],
+        timeout: float | None = None,
+    ) -> None:
+        """Await a client call, recording its latency or failure."""
+        started = time.monotonic()
+        try:
+            await call
+        except Exception as exc:
+            self.metrics.record_error(method_name, exc)
+            raise
+        self.metrics.record(method_name, kind, time.monotonic() - started, timeout)
+
+    async def _execute_pipelined(
+        self,
+        calls: Sequence[tuple[str, tuple[Any, ...]]],
+        results: list[Exception | None],
+    ) -> None:
+        """Execute a batch in order, pipelining runs of raw ACK commands."""
+        pending: list[tuple[str, str]] = []
+
+        async def flush() -> None:
+            # The client sends under a FIFO lock and matches ACKs in send
+            # order, so concurrent sends keep their order on the wire.
+            outcomes = await asyncio.gather(
+                *(self._send_acked(name, line) for name, line in pending),
+                return_exceptions=True,
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException) and not isinstance(
+                    outcome, Exception
+                ):
+                    raise outcome
+                results.append(_command_error(outcome))
+            pending.clear()
+
+        for method_name, args in calls:
+            try:
+                line = self._build_line(method_name, args)
+            except (TypeError, ValueError) as exc:
+                await flush()
+                results.append(exc)
+                continue
+            if line is not None:
+                pending.append((method_name, line))
+                continue
+            await flush()
+            try:
+                await self._execute(method_name, *args, require_ack=True)
+            except Exception as exc:
+                results.append(exc)
+            else:
+                results.append(None)
+        await flush()
+
+    async def _send_acked(self, method_name: str, line: str) -> None:
+        """Send one raw protocol line and wait for its ACK."""
+        timeout = self._client.command_timeout
+        await self._timed(
+            method_name,
+            "ack",
+            self._client.command(line, wait_for_ack=True, ack_timeout=timeout),
+            timeout if isinstance(timeout, int | float) else None,
+        )
+        if method_name == "power_off":
+            self._client.runtime = self._client.runtime.with_changes(
+                power=PowerState.OFF
+            )
+            if self._runtime_changed is not None:
+                self._runtime_changed()
+
     def _build_line(self, method_name: str, args: tuple[Any, ...]) -> str | None:
         """Build raw protocol line for known methods."""
         if method_name == "power_off":
@@ -75,11 +532,7 @@ class TrinnovAltitudeCommands:
         if method_name == "source_set" and len(args) == 1:
             return f"profile {int(args[0])}"
         if method_name == "source_set_by_name" and len(args) == 1:
-            source_name = str(args[0])
-            for source_id, name in self._client.state.sources.items():
-                if name == source_name:
-                    return f"profile {source_id}"
-            raise ValueError(f"Unknown source name: {source_name}")
+            return f"profile {self.source_id(str(args[0]))}"
         if method_name == "upmixer_set" and len(args) == 1:
             mode = args[0]
             mode_value = mode.value if hasattr(mode, "value") else str(mode)
@@ -89,3 +542,32 @@ class TrinnovAltitudeCommands:
             mode_value = mode.value if hasattr(mode, "value") else str(mode)
             return f"remapping_mode {mode_value}"
         return None
+
+
+def _command_error(outcome: object) -> Exception | None:
+    """Map a pipelined send outcome to the error ``invoke`` would have raised."""
+    if not isinstance(outcome, Exception):
+        return None
+    if isinstance(outcome, TrinnovAltitudeError) and not isinstance(
+        outcome, NotConnectedError
+    ):
+        error = HomeAssistantError(str(outcome))
+        error.__cause__ = outcome
+        return error
+    return outcome
+
+
+def _prefixed(prefix: str | None, message: str) -> ServiceValidationError:
+    """Build a validation error, naming the offending line in multi-line input."""
+    return ServiceValidationError(message if prefix is None else f"{prefix}: {message}")
+
+
+def describe_command_error(error: Exception) -> str:
+    """Return a user-facing description of a failed command."""
+    if isinstance(error, NotConnectedError):
+        return "Trinnov Altitude must be powered on before sending commands"
+    if isinstance(error, TimeoutError):
+        return "timed out waiting for acknowledgement"
+    if isinstance(error, TypeError):
+        return "invalid arguments"
+    return str(error) or type(error).__name__
@@ -24,7 +24,13 @@ from trinnov_altitude.exceptions import (
     MalformedMacAddressError,
 )
 
-from .const import CLIENT_ID, DOMAIN, NAME
+from .const import (
+    CLIENT_ID,
+    CONF_BACKGROUND_STARTUP,
+    CONF_PUSH_COALESCE_WINDOW,
+    DOMAIN,
+    NAME,
+)
 
 _LOGGER = logging.getLogger(__name__)
 DATA_SCHEMA = vol.Schema({vol.Required(CONF_HOST): str, vol.Optional(CONF_MAC): str})
@@ -110,7 +116,17 @@ class TrinnovAltitudeOptionsFlow(OptionsFlow):
                 self.hass.config_entries.async_schedule_reload(
                     self._config_entry.entry_id
                 )
-                return self.async_create_entry(title="", data={})
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        CONF_BACKGROUND_STARTUP: user_input.get(
+                            CONF_BACKGROUND_STARTUP, False
+                        ),
+                        CONF_PUSH_COALESCE_WINDOW: user_input.get(
+                            CONF_PUSH_COALESCE_WINDOW, 0.0
+                        ),
+                    },
+                )
 
         return self.async_show_form(
             step_id="init",
@@ -119,7 +135,19 @@ class TrinnovAltitudeOptionsFlow(OptionsFlow):
                     vol.Optional(
                         CONF_MAC,
                         default=self._config_entry.data.get(CONF_MAC, ""),
-                    ): str
+                    ): str,
+                    vol.Optional(
+                        CONF_BACKGROUND_STARTUP,
+                        default=self._config_entry.options.get(
+                            CONF_BACKGROUND_STARTUP, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_PUSH_COALESCE_WINDOW,
+                        default=self._config_entry.options.get(
+                            CONF_PUSH_COALESCE_WINDOW, 0.0
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0.0, max=1.0)),
                 }
             ),
             errors=errors,
@@ -6,11 +6,28 @@ MANUFACTURER = "Trinnov"
 MODEL = "Altitude"
 NAME = f"{MANUFACTURER} {MODEL}"
 
+CONF_BACKGROUND_STARTUP = "background_startup"
+CONF_PUSH_COALESCE_WINDOW = "push_coalesce_window"
+
 ATTR_ENTRY_ID = "entry_id"
 ATTR_SOURCE = "source"
 ATTR_PRESET_ID = "preset_id"
+ATTR_PRESET = "preset"
+ATTR_FUZZY = "fuzzy"
 ATTR_UPMIXER = "upmixer"
+ATTR_COMMANDS = "commands"
+ATTR_TIMEOUT = "timeout"
+ATTR_RESET = "reset"
+ATTR_FILENAME = "filename"
 
 SERVICE_SET_SOURCE_BY_NAME = "set_source_by_name"
 SERVICE_SET_PRESET = "set_preset"
+SERVICE_SET_PRESET_BY_NAME = "set_preset_by_name"
 SERVICE_SET_UPMIXER = "set_upmixer"
+SERVICE_SEND_BATCH = "send_batch"
+SERVICE_POWER_ON = "power_on"
+SERVICE_COMMAND_STATS = "command_stats"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+
+CAPTURE_DIRECTORY = "trinnov_altitude/captures"
@@ -3,29 +3,95 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+import time
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from trinnov_altitude.adapter import AltitudeStateAdapter, snapshot_from_state
+from trinnov_altitude.adapter import (
+    AdapterEvent,
+    AltitudeSnapshot,
+    AltitudeStateAdapter,
+    StateDelta,
+    snapshot_from_state,
+)
 from trinnov_altitude.exceptions import ConnectionFailedError, ConnectionTimeoutError
-from trinnov_altitude.lifecycle import PowerState
+from trinnov_altitude.lifecycle import AltitudeRuntimeState, PowerState
+
+from .capture import ProtocolCapture
+from .catalog import CatalogIndex
+from .commands import WAKE_DEFER_SECONDS
+from .optimistic import OptimisticOverlay
+from .retry import BootstrapRetryScheduler
+from .snapshot import TrinnovAltitudeSnapshot, versioned_snapshot
+from .timeline import BootstrapTimelineRecorder
+from .trace import ProtocolTrace
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Mapping
+    from datetime import datetime
+    from pathlib import Path
 
-    from trinnov_altitude.adapter import AltitudeSnapshot
     from trinnov_altitude.client import TrinnovAltitudeClient
     from trinnov_altitude.protocol import Message
 
+    from .cache import TrinnovAltitudeStateCache
     from .commands import TrinnovAltitudeCommands
 
 
-class TrinnovAltitudeCoordinator(DataUpdateCoordinator["AltitudeSnapshot"]):
+# Snapshot fields whose first non-empty delta marks a bootstrap phase.
+_PHASE_FIELDS = {"id": "device_id", "sources": "sources", "presets": "presets"}
+_TIMELINE_FIELDS = frozenset({"time_to_ready", "connect_duration"})
+
+
+@dataclass
+class PushStatistics:
+    """Counters describing how much work push coalescing saves."""
+
+    events_received: int = 0
+    snapshots_published: int = 0
+    listener_updates: int = 0
+    listener_updates_skipped: int = 0
+    state_writes: int = 0
+    state_writes_suppressed: int = 0
+
+    @property
+    def events_coalesced(self) -> int:
+        """Return the number of events folded into another publish."""
+        return max(self.events_received - self.snapshots_published, 0)
+
+
+@dataclass
+class StartupTimings:
+    """Per-phase startup durations in seconds; None until a phase completes."""
+
+    cache_load: float | None = None
+    client_start: float | None = None
+    wait_synced: float | None = None
+    platform_setup: float | None = None
+    setup_entry: float | None = None
+
+
+@dataclass
+class PowerOnStatistics:
+    """Counters for power-on requests sharing one wake-and-sync operation."""
+
+    requests: int = 0
+    wakes: int = 0
+    deduplicated: int = 0
+    completed: int = 0
+    last_time_to_ready: float | None = None
+
+
+class TrinnovAltitudeCoordinator(DataUpdateCoordinator[TrinnovAltitudeSnapshot]):
     """Push coordinator for Trinnov Altitude state."""
 
-    _BOOTSTRAP_RETRY_INTERVAL_SECONDS = 5.0
+    _OPTIMISTIC_TIMEOUT_SECONDS = 3.0
 
     def __init__(
         self,
@@ -33,11 +99,21 @@ class TrinnovAltitudeCoordinator(DataUpdateCoordinator["AltitudeSnapshot"]):
         client: TrinnovAltitudeClient,
         commands: TrinnovAltitudeCommands,
         stable_device_id: str,
+        push_coalesce_window: float = 0.0,
+        cache: TrinnovAltitudeStateCache | None = None,
     ) -> None:
-        """Initialize coordinator."""
+        """Initialize coordinator.
+
+        Adapter and client events are coalesced into one snapshot publish per
+        event-loop iteration, or per ``push_coalesce_window`` seconds when set.
+        When a cache is given, the last synced catalog fills the snapshot until
+        the live sync delivers it.
+        """
         super().__init__(hass, logger=client.logger, name="trinnov_altitude")
         self.client = client
         self.commands = commands
+        commands.use_catalogs(self.catalog_index)
+        commands.on_runtime_changed(self.async_publish_snapshot)
         self.stable_device_id = stable_device_id
         self._state_adapter = AltitudeStateAdapter()
         self._callback_registered = False
@@ -47,9 +123,46 @@ class TrinnovAltitudeCoordinator(DataUpdateCoordinator["AltitudeSnapshot"]):
         )
         self._running = False
         self._bootstrap_retry_task: asyncio.Task[None] | None = None
+        self.retry_scheduler = BootstrapRetryScheduler()
+        self.optimistic = OptimisticOverlay(on_confirm=self._record_echo)
+        self._optimistic_expiry: dict[str, CALLBACK_TYPE] = {}
+        self._startup_task: asyncio.Task[None] | None = None
+        # Resolves with the monotonic time the current wake reached sync.
+        self._power_on: asyncio.Future[float] | None = None
+        self._power_on_started = 0.0
+        self.power_stats = PowerOnStatistics()
+        self.bootstrap_timeline = BootstrapTimelineRecorder()
+        self.trace = ProtocolTrace()
+        self.capture: ProtocolCapture | None = None
+        self._cache = cache
+        self._snapshot: TrinnovAltitudeSnapshot | None = None
+        self._snapshot_version = 0
+        # Snapshot version each catalog index was last checked against.
+        self._catalog_indexes: dict[str, tuple[int, CatalogIndex]] = {}
+        self._push_coalesce_window = max(push_coalesce_window, 0.0)
+        self._push_scheduled = False
+        # Snapshot fields changed since the last publish; only entities that
+        # render one of them are updated. Events without deltas set
+        # ``_pending_diff`` so the publish also diffs against the last snapshot.
+        self._pending_fields: set[str] = set()
+        self._pending_diff = False
+        self._routed_fields: frozenset[str] | None = None
+        self.push_stats = PushStatistics()
+        self.startup_timings = StartupTimings()
+
+    async def async_start(
+        self, sync_timeout: float | None = 10.0, background: bool = False
+    ) -> None:
+        """Start push updates and attempt initial client bootstrap.
+
+        With ``background`` the bootstrap runs as a task and this returns as
+        soon as the initial snapshot is published.
+        """
+        if self._cache is not None:
+            started = time.monotonic()
+            await self._cache.async_load()
+            self.startup_timings.cache_load = time.monotonic() - started
 
-    async def async_start(self, sync_timeout: float | None = 10.0) -> None:
-        """Start push updates and attempt initial client bootstrap."""
         if not self._callback_registered:
             self.client.register_callback(self._handle_client_event)
             self._callback_registered = True
@@ -61,18 +174,45 @@ class TrinnovAltitudeCoordinator(DataUpdateCoordinator["AltitudeSnapshot"]):
 
         self._running = True
         # Publish initial disconnected snapshot so entities can expose turn_on/WOL.
-        self.async_set_updated_data(self._snapshot_state())
+        self.async_publish_snapshot()
+
+        if background:
+            self._startup_task = self.hass.async_create_background_task(
+                self._async_background_bootstrap(sync_timeout),
+                "trinnov_altitude startup",
+            )
+            return
+        await self._async_bootstrap(sync_timeout)
 
+    async def _async_bootstrap(self, sync_timeout: float | None) -> None:
+        """Connect and wait for sync once, handing failures to the retry loop."""
+        self.bootstrap_timeline.begin("startup")
         try:
+            started = time.monotonic()
+            self.bootstrap_timeline.mark_attempt()
             await self.client.start()
+            connected = time.monotonic()
+            self.startup_timings.client_start = connected - started
             await self.client.wait_synced(sync_timeout)
-            self.async_set_updated_data(self._snapshot_state())
+            self.startup_timings.wait_synced = time.monotonic() - connected
+            self.async_publish_snapshot()
         except (ConnectionFailedError, ConnectionTimeoutError, TimeoutError):
             self.client.logger.warning(
                 "Initial Trinnov bootstrap failed; keeping integration loaded and retrying in background."
             )
             self._schedule_bootstrap_retry(sync_timeout)
 
+    async def _async_background_bootstrap(self, sync_timeout: float | None) -> None:
+        """Run the initial bootstrap without blocking integration setup."""
+        try:
+            await self._async_bootstrap(sync_timeout)
+        except asyncio.CancelledError:
+            return
+        except Exception:
+            self.client.logger.exception(
+                "Unexpected error while starting Trinnov Altitude client"
+            )
+
     async def async_shutdown(self) -> None:
         """Stop client and deregister callback."""
         if (
@@ -82,6 +222,14 @@ class TrinnovAltitudeCoordinator(DataUpdateCoordinator["AltitudeSnapshot"]):
         ):
             return
 
+        for field_name in list(self._optimistic_expiry):
+            self._cancel_optimistic_expiry(field_name)
+        self.commands.release_deferred()
+        if self._power_on is not None and not self._power_on.done():
+            self._power_on.cancel()
+        if self._startup_task is not None:
+            self._startup_task.cancel()
+            self._startup_task = None
         if self._bootstrap_retry_task is not None:
             self._bootstrap_retry_task.cancel()
             self._bootstrap_retry_task = None
@@ -98,46 +246,337 @@ class TrinnovAltitudeCoordinator(DataUpdateCoordinator["AltitudeSnapshot"]):
             self._adapter_callback_handle = None
         await self.client.stop()
         self._running = False
+        await self.async_stop_capture()
+
+    async def async_start_capture(self, path: Path) -> ProtocolCapture:
+        """Start appending client events to a capture file at ``path``."""
+        if self.capture is not None:
+            raise HomeAssistantError(
+                f"Trinnov Altitude is already capturing to {self.capture.path}"
+            )
+        capture = ProtocolCapture(self.hass, path, self.stable_device_id)
+        await capture.async_open()
+        self.capture = capture
+        return capture
+
+    async def async_stop_capture(self) -> ProtocolCapture | None:
+        """Stop capturing and close the file; None when no capture was running."""
+        capture, self.capture = self.capture, None
+        if capture is not None:
+            await capture.async_close()
+        return capture
 
-    async def _async_update_data(self) -> AltitudeSnapshot:
+    async def _async_update_data(self) -> TrinnovAltitudeSnapshot:
         """Return latest state snapshot."""
-        return self._snapshot_state()
+        return self.snapshot
+
+    @property
+    def snapshot(self) -> TrinnovAltitudeSnapshot:
+        """Return the current snapshot, building it at most once per state change."""
+        if self._snapshot is None:
+            snapshot = snapshot_from_state(self.client.state, self.client.runtime)
+            if self._cache is not None:
+                if snapshot.synced:
+                    self._cache.async_update(snapshot)
+                elif self._cache.state is not None:
+                    snapshot = self._cache.state.fill(snapshot)
+            if self.optimistic:
+                for field_name in self.optimistic.reconcile(snapshot):
+                    self._cancel_optimistic_expiry(field_name)
+                snapshot = self.optimistic.apply(snapshot)
+            self._snapshot_version += 1
+            last = self.bootstrap_timeline.last
+            self._snapshot = versioned_snapshot(
+                snapshot,
+                self._snapshot_version,
+                time_to_ready=None if last is None else last.time_to_ready,
+                connect_duration=None if last is None else last.connect_duration,
+            )
+        return self._snapshot
+
+    @property
+    def snapshot_version(self) -> int:
+        """Return the version of the current snapshot."""
+        return self.snapshot.snapshot_version
+
+    def catalog_index(
+        self, name: str, snapshot: TrinnovAltitudeSnapshot | None = None
+    ) -> CatalogIndex:
+        """Return the name index for the ``sources`` or ``presets`` catalog.
+
+        Reads ``snapshot``, or the current snapshot when omitted. The index is
+        compared with the catalog once per snapshot version and rebuilt only
+        when the catalog changed.
+        """
+        if snapshot is None:
+            snapshot = self.snapshot
+        version = snapshot.snapshot_version
+        cached = self._catalog_indexes.get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        catalog = getattr(snapshot, name)
+        if cached is not None and cached[1].catalog == catalog:
+            index = cached[1]
+        else:
+            index = CatalogIndex(catalog)
+        self._catalog_indexes[name] = (version, index)
+        return index
+
+    @callback
+    def invalidate_snapshot(self) -> None:
+        """Mark client state as changed so the next read builds a new snapshot."""
+        self._snapshot = None
+
+    @callback
+    def async_publish_snapshot(self) -> None:
+        """Rebuild the snapshot from client state and notify every entity."""
+        self.invalidate_snapshot()
+        self._handle_client_ready()
+        self.async_set_updated_data(self.snapshot)
 
-    def _snapshot_state(self) -> AltitudeSnapshot:
-        """Create a stable snapshot for entity reads."""
-        return snapshot_from_state(self.client.state, self.client.runtime)
+    async def async_set_volume(self, db: float) -> None:
+        """Send a volume change, showing the target until the device confirms it."""
+        await self.async_invoke_optimistic({"volume": db}, "volume_set", db)
+
+    async def async_invoke_optimistic(
+        self,
+        values: Mapping[str, Any],
+        method_name: str,
+        *args: Any,
+        require_ack: bool = False,
+    ) -> None:
+        """Run a command, showing its intended snapshot values straight away.
+
+        The values stay in the snapshot until the device reports them, and are
+        rolled back if the command fails or dropped if no confirming state
+        arrives within ``_OPTIMISTIC_TIMEOUT_SECONDS`` of the command finishing.
+        """
+        tokens = self.optimistic.set_many(values, method_name)
+        for field_name in tokens:
+            self._cancel_optimistic_expiry(field_name)
+        self._publish_fields(tokens)
+        try:
+            await self.commands.invoke(method_name, *args, require_ack=require_ack)
+        except Exception:
+            rolled_back = [
+                field_name
+                for field_name, token in tokens.items()
+                if self.optimistic.rollback(field_name, token)
+            ]
+            if rolled_back:
+                self._publish_fields(rolled_back)
+            raise
+        for field_name, token in tokens.items():
+            if self.optimistic.is_pending(field_name, token):
+                self._optimistic_expiry[field_name] = async_call_later(
+                    self.hass,
+                    self._OPTIMISTIC_TIMEOUT_SECONDS,
+                    partial(self._async_expire_optimistic, field_name, token),
+                )
+
+    @callback
+    def _publish_fields(self, field_names: Iterable[str]) -> None:
+        """Publish a rebuilt snapshot to listeners of the given fields.
+
+        A queued push that still has to diff lifecycle events would compare
+        against this snapshot, so every other field it changed is handed to
+        that push instead.
+        """
+        routed = frozenset(field_names)
+        self.invalidate_snapshot()
+        snapshot = self.snapshot
+        if self._pending_diff and self.data is not None:
+            self._pending_fields.update(
+                snapshot_changed_fields(self.data, snapshot) - routed
+            )
+        self._routed_fields = routed
+        self.async_set_updated_data(snapshot)
+
+    @callback
+    def _async_expire_optimistic(
+        self, field_name: str, token: int, _now: datetime
+    ) -> None:
+        """Fall back to the reported value when the device never confirmed."""
+        self._optimistic_expiry.pop(field_name, None)
+        if self.optimistic.expire(field_name, token):
+            self._publish_fields((field_name,))
+
+    def _cancel_optimistic_expiry(self, field_name: str) -> None:
+        if (cancel := self._optimistic_expiry.pop(field_name, None)) is not None:
+            cancel()
+
+    def _record_echo(self, method_name: str, latency: float) -> None:
+        """Record how long the device took to echo a command's values."""
+        self.commands.metrics.record(method_name, "echo", latency)
 
     @property
     def power_status(self) -> PowerState:
         """Return lifecycle state for primary power entities."""
-        return self._snapshot_state().runtime.power
+        return self.snapshot.runtime.power
 
     async def async_power_on(self, sync_timeout: float | None = 10.0) -> None:
-        """Wake the processor and actively bootstrap until protocol state is ready."""
+        """Wake the processor and actively bootstrap until protocol state is ready.
+
+        Every entry point shares one wake: while it is in flight, further
+        calls join it instead of sending another Wake-on-LAN burst. Commands
+        issued until the processor syncs are held and then flushed.
+        """
+        self._start_power_on(sync_timeout)
+
+    async def async_power_on_and_wait(
+        self,
+        timeout: float = WAKE_DEFER_SECONDS,
+        sync_timeout: float | None = 10.0,
+    ) -> float:
+        """Power on, or join the wake in flight, and wait until it is synced.
+
+        Returns this caller's time to ready in seconds.
+        """
+        requested = time.monotonic()
+        ready = self._start_power_on(sync_timeout)
+        try:
+            ready_at = await asyncio.wait_for(asyncio.shield(ready), timeout)
+        except TimeoutError as exc:
+            raise HomeAssistantError(
+                f"Trinnov Altitude did not become ready within {timeout:g} seconds"
+            ) from exc
+        return max(ready_at - requested, 0.0)
+
+    @callback
+    def _start_power_on(self, sync_timeout: float | None) -> asyncio.Future[float]:
+        """Return the wake in flight, starting one if none is."""
+        self.power_stats.requests += 1
+        if self._power_on is not None and self._power_on_in_flight:
+            self.power_stats.deduplicated += 1
+            return self._power_on
         self.client.power_on()
-        self.async_set_updated_data(self._snapshot_state())
+        self.power_stats.wakes += 1
+        if not self._client_synced:
+            self.bootstrap_timeline.begin("wake", restart=True)
+            self.bootstrap_timeline.mark("wol_sent")
+        self._power_on_started = time.monotonic()
+        self._power_on = ready = self.hass.loop.create_future()
+        if not self._client_synced:
+            self.commands.defer_until_ready()
+        self.async_publish_snapshot()
+        self.retry_scheduler.wake()
         if not self._client_synced:
             self._schedule_bootstrap_retry(sync_timeout)
+        return ready
+
+    @property
+    def _power_on_in_flight(self) -> bool:
+        """Return whether a wake is still waiting for sync within its deadline."""
+        return (
+            self._power_on is not None
+            and not self._power_on.done()
+            and time.monotonic() - self._power_on_started < WAKE_DEFER_SECONDS
+        )
 
     @property
     def _client_synced(self) -> bool:
         """Return whether the client has completed protocol bootstrap."""
         return bool(getattr(self.client.state, "synced", False))
 
-    def _handle_client_event(self, event: str, _message: object | None = None) -> None:
+    def _handle_client_ready(self) -> bool:
+        """Finish the wake in flight and flush held commands once synced.
+
+        Returns whether a bootstrap timeline completed, which changes the
+        snapshot's bootstrap durations.
+        """
+        if not self._client_synced:
+            return False
+        if self.commands.deferring:
+            self.commands.release_deferred()
+        if self._power_on is not None and not self._power_on.done():
+            ready_at = time.monotonic()
+            self._power_on.set_result(ready_at)
+            self.power_stats.completed += 1
+            self.power_stats.last_time_to_ready = ready_at - self._power_on_started
+        timeline = self.bootstrap_timeline.finish()
+        if timeline is None:
+            return False
+        self.client.logger.debug(
+            "Trinnov Altitude ready after %.2fs: %s",
+            timeline.time_to_ready,
+            timeline.as_dict(),
+        )
+        self.invalidate_snapshot()
+        return True
+
+    def _handle_client_event(self, event: str, message: Message | None = None) -> None:
         """Forward connection lifecycle events into coordinator updates."""
+        self.trace.record(event, message)
+        if self.capture is not None:
+            self.capture.record(event, message, self.client.runtime)
+        if event == "connected":
+            self.bootstrap_timeline.mark("connected")
         if event in {"connected", "disconnected", "runtime_changed"}:
-            self.hass.add_job(self._async_push_update)
+            # Lifecycle events carry no deltas; diff against the last publish.
+            self.invalidate_snapshot()
+            self._pending_diff = True
+            self._schedule_push_update()
 
     def _handle_adapter_update(
-        self, _snapshot: object, _deltas: object, _events: object
+        self, _snapshot: object, deltas: list[StateDelta], events: list[AdapterEvent]
     ) -> None:
         """Forward adapter updates into coordinator snapshots."""
+        for event in events:
+            self.trace.record("adapter", event)
+        self.invalidate_snapshot()
+        for delta in deltas:
+            if (phase := _PHASE_FIELDS.get(delta.field)) is not None and delta.new:
+                self.bootstrap_timeline.mark(phase)
+        if deltas:
+            self._pending_fields.update(delta_fields(deltas))
+        else:
+            self._pending_diff = True
+        self._schedule_push_update()
+
+    def _schedule_push_update(self) -> None:
+        """Queue one publish for any number of events in the same burst."""
+        self.push_stats.events_received += 1
+        if self._push_scheduled:
+            return
+        self._push_scheduled = True
         self.hass.add_job(self._async_push_update)
 
     async def _async_push_update(self) -> None:
         """Publish latest client state to entities."""
-        self.async_set_updated_data(self._snapshot_state())
+        if self._push_coalesce_window:
+            await asyncio.sleep(self._push_coalesce_window)
+        self._push_scheduled = False
+        if self._handle_client_ready():
+            self._pending_fields.update(_TIMELINE_FIELDS)
+        snapshot = self.snapshot
+        changed: set[str] | None = self._pending_fields
+        if self._pending_diff:
+            changed = (
+                None
+                if self.data is None
+                else changed | snapshot_changed_fields(self.data, snapshot)
+            )
+        self._pending_fields = set()
+        self._pending_diff = False
+        self.push_stats.snapshots_published += 1
+        self._routed_fields = None if changed is None else frozenset(changed)
+        self.async_set_updated_data(snapshot)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only listeners whose snapshot fields changed in this publish.
+
+        Listeners registered without a context read arbitrary state and are
+        always notified, as are all listeners for unrouted publishes.
+        """
+        changed = self._routed_fields
+        self._routed_fields = None
+        for update_callback, context in list(self._listeners.values()):
+            if changed is None or context is None or not changed.isdisjoint(context):
+                self.push_stats.listener_updates += 1
+                update_callback()
+            else:
+                self.push_stats.listener_updates_skipped += 1
 
     def _schedule_bootstrap_retry(self, sync_timeout: float | None) -> None:
         """Start background bootstrap retries if one is not already running."""
@@ -157,14 +596,60 @@ class TrinnovAltitudeCoordinator(DataUpdateCoordinator["AltitudeSnapshot"]):
         """Retry bootstrap so offline or half-synced devices recover automatically."""
         try:
             while self._running and not self._client_synced:
+                self.bootstrap_timeline.begin("reconnect")
+                self.bootstrap_timeline.mark_attempt()
                 try:
                     await self.client.start()
                     await self.client.wait_synced(sync_timeout)
                     if self._client_synced:
-                        self.async_set_updated_data(self._snapshot_state())
+                        self.retry_scheduler.reset()
+                        self.async_publish_snapshot()
                         return
                 except (ConnectionFailedError, ConnectionTimeoutError, TimeoutError):
                     pass
-                await asyncio.sleep(self._BOOTSTRAP_RETRY_INTERVAL_SECONDS)
+                await self.retry_scheduler.async_wait(self.retry_scheduler.next_delay())
         except asyncio.CancelledError:
             return
+
+
+def delta_fields(deltas: Iterable[StateDelta]) -> set[str]:
+    """Return routing keys for adapter deltas, expanding runtime subfields."""
+    changed: set[str] = set()
+    for delta in deltas:
+        if delta.field == "runtime":
+            changed.update(_runtime_changed_fields(delta.old, delta.new))
+        else:
+            changed.add(delta.field)
+    return changed
+
+
+def snapshot_changed_fields(
+    previous: AltitudeSnapshot, current: AltitudeSnapshot
+) -> set[str]:
+    """Return routing keys for every field that differs between two snapshots."""
+    changed: set[str] = set()
+    for field_def in fields(AltitudeSnapshot):
+        name = field_def.name
+        old = getattr(previous, name)
+        new = getattr(current, name)
+        if old == new:
+            continue
+        if name == "runtime":
+            changed.update(_runtime_changed_fields(old, new))
+        else:
+            changed.add(name)
+    return changed
+
+
+def _runtime_changed_fields(old: object, new: object) -> set[str]:
+    if not isinstance(old, AltitudeRuntimeState) or not isinstance(
+        new, AltitudeRuntimeState
+    ):
+        return {
+            f"runtime.{field_def.name}" for field_def in fields(AltitudeRuntimeState)
+        }
+    return {
+        f"runtime.{field_def.name}"
+        for field_def in fields(AltitudeRuntimeState)
+        if getattr(old, field_def.name) != getattr(new, field_def.name)
+    }
@@ -0,0 +1,82 @@
+"""Diagnostics support for Trinnov Altitude integration."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_MAC
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import TrinnovAltitudeIntegrationData
+
+TO_REDACT = {CONF_HOST, CONF_MAC}
+
+
+def _stats(stats: Any, *properties: str) -> dict[str, Any]:
+    """Return a statistics dataclass as a dict, including derived properties."""
+    return {**asdict(stats), **{name: getattr(stats, name) for name in properties}}
+
+
+def _snapshot(snapshot: Any) -> dict[str, Any]:
+    """Return the snapshot as a dict without the raw connection error text.
+
+    The message of a connection error is the socket error string, which
+    names the address that could not be reached; its kind is kept.
+    """
+    data = asdict(snapshot)
+    if (last_error := data["runtime"]["last_error"]) is not None:
+        last_error["message"] = REDACTED
+    return data
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data: TrinnovAltitudeIntegrationData = hass.data[DOMAIN][entry.entry_id]
+    coordinator = data.coordinator
+    commands = data.commands
+    timeline = coordinator.bootstrap_timeline
+    trace = coordinator.trace
+    now = time.monotonic()
+
+    return async_redact_data(
+        {
+            "entry": {"data": dict(entry.data), "options": dict(entry.options)},
+            "coordinator": {
+                "push": _stats(coordinator.push_stats, "events_coalesced"),
+                "startup": asdict(coordinator.startup_timings),
+                "power_on": asdict(coordinator.power_stats),
+                "optimistic": _stats(coordinator.optimistic.stats, "average_latency"),
+                "bootstrap": {
+                    "current": timeline.current and timeline.current.as_dict(),
+                    "history": [item.as_dict() for item in timeline.history],
+                },
+            },
+            "retry_scheduler": {
+                "attempts": coordinator.retry_scheduler.attempts,
+                "delay": coordinator.retry_scheduler.delay,
+                "waking": coordinator.retry_scheduler.waking,
+            },
+            "commands": {
+                "queue_depth": commands.queue_depth,
+                "deferring": commands.deferring,
+                "queue": _stats(commands.queue_stats, "average_wait"),
+                "methods": commands.metrics.as_dict(),
+            },
+            "snapshot": _snapshot(coordinator.snapshot),
+            "trace": {
+                "capacity": trace.capacity,
+                "recorded": trace.recorded,
+                "entries": [
+                    {"age": now - item["monotonic"], **item} for item in trace.entries()
+                ],
+            },
+        },
+        TO_REDACT,
+    )
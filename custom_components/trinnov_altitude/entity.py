@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -12,10 +14,12 @@ from .const import DOMAIN, MANUFACTURER, MODEL, NAME
 from .coordinator import TrinnovAltitudeCoordinator
 
 if TYPE_CHECKING:
-    from trinnov_altitude.adapter import AltitudeSnapshot
+    from collections.abc import Callable
+
     from trinnov_altitude.client import TrinnovAltitudeClient
 
     from .commands import TrinnovAltitudeCommands
+    from .snapshot import TrinnovAltitudeSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,10 +29,20 @@ class TrinnovAltitudeEntity(CoordinatorEntity[TrinnovAltitudeCoordinator]):
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    # Snapshot fields this entity renders; None subscribes to every update.
+    _snapshot_fields: frozenset[str] | None = None
 
-    def __init__(self, coordinator: TrinnovAltitudeCoordinator) -> None:
+    def __init__(
+        self,
+        coordinator: TrinnovAltitudeCoordinator,
+        snapshot_fields: frozenset[str] | None = None,
+    ) -> None:
         """Initialize entity."""
-        super().__init__(coordinator)
+        if snapshot_fields is None:
+            snapshot_fields = self._snapshot_fields
+        super().__init__(coordinator, snapshot_fields)
+        self._rendered_values = _values_getter(snapshot_fields)
+        self._written_values: tuple[Any, ...] | None = None
         self._client: TrinnovAltitudeClient = coordinator.client
         self._commands: TrinnovAltitudeCommands = coordinator.commands
 
@@ -40,20 +54,58 @@ class TrinnovAltitudeEntity(CoordinatorEntity[TrinnovAltitudeCoordinator]):
             name=f"{NAME} ({host})",
             model=MODEL,
             manufacturer=MANUFACTURER,
-            sw_version=self._client.state.version,
+            sw_version=coordinator.snapshot.version,
             configuration_url=f"http://{self._client.host}",
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the values this entity renders changed.
+
+        The values are the entity's snapshot fields and availability, read
+        without computing the state; entities rendering every field always
+        write.
+        """
+        values = None
+        if self._rendered_values is not None:
+            values = (self.available, self._rendered_values(self._state))
+        stats = self.coordinator.push_stats
+        if values is not None and values == self._written_values:
+            stats.state_writes_suppressed += 1
+            return
+        stats.state_writes += 1
+        self.async_write_ha_state()
+        self._written_values = values
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state, forgetting the values of the last coordinator write.
+
+        Writes from actions or availability changes may render more than the
+        snapshot fields, so the next coordinator update always writes.
+        """
+        self._written_values = None
+        super().async_write_ha_state()
+
     @property
-    def _state(self) -> AltitudeSnapshot:
+    def _state(self) -> TrinnovAltitudeSnapshot:
         """Return latest coordinator-backed state."""
         if self.coordinator.data is not None:
             return self.coordinator.data
-        return self._client.snapshot
+        return self.coordinator.snapshot
 
     @property
-    def _snapshot_state(self) -> AltitudeSnapshot:
+    def _snapshot_state(self) -> TrinnovAltitudeSnapshot:
         """Return latest coordinator-backed snapshot."""
-        if self.coordinator.data is not None:
-            return self.coordinator.data
-        return self._client.snapshot
+        return self._state
+
+
+def _values_getter(
+    snapshot_fields: frozenset[str] | None,
+) -> Callable[[object], Any] | None:
+    """Return a reader of the given snapshot fields, dotted paths included."""
+    if snapshot_fields is None:
+        return None
+    if not snapshot_fields:
+        return lambda _snapshot: ()
+    return attrgetter(*sorted(snapshot_fields))
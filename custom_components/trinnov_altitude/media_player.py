@@ -51,10 +51,21 @@ class TrinnovAltitudeMediaPlayer(TrinnovAltitudeEntity, MediaPlayerEntity):
         | MediaPlayerEntityFeature.VOLUME_SET
         | MediaPlayerEntityFeature.VOLUME_STEP
     )
+    _snapshot_fields = frozenset(
+        {
+            "runtime.power",
+            "runtime.transport",
+            "mute",
+            "source",
+            "source_format",
+            "sources",
+            "volume",
+        }
+    )
 
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
-        await self._commands.invoke("mute_set", mute)
+        await self.coordinator.async_invoke_optimistic({"mute": mute}, "mute_set", mute)
 
     async def async_select_source(self, source: str) -> None:
         """Select source."""
@@ -78,7 +89,6 @@ class TrinnovAltitudeMediaPlayer(TrinnovAltitudeEntity, MediaPlayerEntity):
     async def async_turn_off(self) -> None:
         """Power off command."""
         await self._commands.invoke("power_off", require_ack=True)
-        self.coordinator.async_set_updated_data(self.coordinator._snapshot_state())
 
     async def async_volume_up(self) -> None:
         """Turn volume up for media player."""
@@ -90,7 +100,7 @@ class TrinnovAltitudeMediaPlayer(TrinnovAltitudeEntity, MediaPlayerEntity):
 
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
-        await self._commands.invoke("volume_set", level_to_db(volume))
+        await self.coordinator.async_set_volume(level_to_db(volume))
 
     @property
     def available(self) -> bool:
@@ -115,9 +125,10 @@ class TrinnovAltitudeMediaPlayer(TrinnovAltitudeEntity, MediaPlayerEntity):
     @property
     def volume_level(self) -> float | None:
         """Volume level of the media player, range 0..1."""
-        if self._state.volume is None:
+        volume = self._state.volume
+        if volume is None:
             return None
-        return db_to_level(self._state.volume)
+        return db_to_level(volume)
 
     @property
     def state(self) -> MediaPlayerState:
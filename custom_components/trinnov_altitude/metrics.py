@@ -0,0 +1,159 @@
+"""Per-method command latency histograms for the Trinnov Altitude integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+
+from trinnov_altitude.exceptions import CommandConvergenceTimeoutError
+
+# Upper bounds, in seconds, of the latency buckets; a final bucket is unbounded.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# ACKs slower than this share of the client's command timeout count as near misses.
+NEAR_TIMEOUT_RATIO = 0.8
+
+# How a command's latency was measured: until the client call returned, until
+# its ACK arrived, until a client call that waits for the device to report
+# the requested state returned, or until an optimistic value shown for the
+# command was confirmed by the device.
+LATENCY_KINDS = ("send", "ack", "converge", "echo")
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; memory does not grow with samples."""
+
+    __slots__ = ("count", "counts", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add one latency sample."""
+        self.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        """Return the mean latency."""
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(LATENCY_BUCKETS, self.counts, strict=False):
+            seen += bucket_count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the histogram summary and bucket counts."""
+        buckets = {
+            f"le_{bound:g}": bucket_count
+            for bound, bucket_count in zip(LATENCY_BUCKETS, self.counts, strict=False)
+        }
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 4),
+            "p50": round(self.quantile(0.5), 4),
+            "p95": round(self.quantile(0.95), 4),
+            "max": round(self.max, 4),
+            "buckets": buckets,
+        }
+
+
+@dataclass
+class MethodMetrics:
+    """Outcome counters and latency histograms for one command method.
+
+    ``calls`` counts every invocation that finished, successfully or not, so
+    it equals ``errors`` and ``timeouts`` plus the ``send``, ``ack`` and
+    ``converge`` samples. ``echo`` samples observe a call already counted,
+    and only exist for commands that showed an optimistic value.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    near_timeouts: int = 0
+    latency: dict[str, LatencyHistogram] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the counters and the histograms recorded so far."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "near_timeouts": self.near_timeouts,
+            "latency": {
+                kind: self.latency[kind].as_dict()
+                for kind in LATENCY_KINDS
+                if kind in self.latency
+            },
+        }
+
+
+class CommandMetrics:
+    """Latency and outcome metrics keyed by command method name."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.methods: dict[str, MethodMetrics] = {}
+
+    def _method(self, method_name: str) -> MethodMetrics:
+        metrics = self.methods.get(method_name)
+        if metrics is None:
+            metrics = self.methods[method_name] = MethodMetrics()
+        return metrics
+
+    def record(
+        self,
+        method_name: str,
+        kind: str,
+        seconds: float,
+        timeout: float | None = None,
+    ) -> None:
+        """Record a completed command's latency.
+
+        ``timeout`` is the deadline the call ran under; calls finishing close
+        to it are counted as near timeouts.
+        """
+        metrics = self._method(method_name)
+        # An echo confirms a call counted when it finished.
+        if kind != "echo":
+            metrics.calls += 1
+        histogram = metrics.latency.get(kind)
+        if histogram is None:
+            histogram = metrics.latency[kind] = LatencyHistogram()
+        histogram.record(seconds)
+        if timeout and seconds >= timeout * NEAR_TIMEOUT_RATIO:
+            metrics.near_timeouts += 1
+
+    def record_error(self, method_name: str, error: BaseException) -> None:
+        """Record a failed command, counting timeouts separately."""
+        metrics = self._method(method_name)
+        metrics.calls += 1
+        if isinstance(error, TimeoutError | CommandConvergenceTimeoutError):
+            metrics.timeouts += 1
+        else:
+            metrics.errors += 1
+
+    def reset(self) -> None:
+        """Forget everything recorded so far."""
+        self.methods.clear()
+
+    def as_dict(self) -> dict[str, dict[str, object]]:
+        """Return the metrics of every method, sorted by name."""
+        return {name: self.methods[name].as_dict() for name in sorted(self.methods)}
@@ -37,6 +37,7 @@ class TrinnovAltitudeVolumeNumber(TrinnovAltitudeEntity, NumberEntity):
     _attr_native_unit_of_measurement = UnitOfSoundPressure.DECIBEL
     _attr_translation_key = "volume"
     _attr_name = "Volume"
+    _snapshot_fields = frozenset({"volume"})
 
     def __init__(self, coordinator: TrinnovAltitudeCoordinator) -> None:
         """Initialize number entity."""
@@ -45,9 +46,9 @@ class TrinnovAltitudeVolumeNumber(TrinnovAltitudeEntity, NumberEntity):
 
     @property
     def native_value(self) -> float | None:
-        """Return the current volume in dB."""
+        """Return the current volume in dB, or the target while it is pending."""
         return self._state.volume
 
     async def async_set_native_value(self, value: float) -> None:
         """Set the volume to the specified dB level."""
-        await self._commands.invoke("volume_set", value)
+        await self.coordinator.async_set_volume(value)
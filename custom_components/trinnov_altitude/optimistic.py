@@ -0,0 +1,155 @@
+"""Optimistic snapshot overlay for commands awaiting device confirmation."""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .catalog import normalize_name
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from trinnov_altitude.adapter import AltitudeSnapshot
+
+_SnapshotT = TypeVar("_SnapshotT", bound="AltitudeSnapshot")
+
+# Reported volumes are rounded by the device, so floats confirm within a margin.
+FLOAT_TOLERANCE = 0.05
+
+
+@dataclass
+class OptimisticStatistics:
+    """Outcomes and confirmation latency of optimistic values."""
+
+    issued: int = 0
+    confirmed: int = 0
+    rolled_back: int = 0
+    expired: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    last_latency: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def average_latency(self) -> float:
+        """Return the mean time from issuing a value to its confirmation."""
+        return self.total_latency / self.confirmed if self.confirmed else 0.0
+
+
+@dataclass(frozen=True)
+class _PendingValue:
+    value: Any
+    command: str
+    issued_at: float
+    token: int
+    group: int
+
+
+class OptimisticOverlay:
+    """Intended snapshot values shown until the device echoes them.
+
+    Each field holds at most one pending value; setting a field again replaces
+    it, and the token returned by ``set`` lets a caller roll back or expire
+    only the value it issued. Values set together by ``set_many`` belong to
+    one command; ``on_confirm`` receives that command and its confirmation
+    latency once, when the last of its values still shown is confirmed.
+    """
+
+    def __init__(self, on_confirm: Callable[[str, float], None] | None = None) -> None:
+        """Initialize an empty overlay."""
+        self._on_confirm = on_confirm
+        self._pending: dict[str, _PendingValue] = {}
+        self._tokens = itertools.count(1)
+        self.stats = OptimisticStatistics()
+
+    def __bool__(self) -> bool:
+        """Return whether any value is awaiting confirmation."""
+        return bool(self._pending)
+
+    @property
+    def fields(self) -> frozenset[str]:
+        """Return the snapshot fields with a pending value."""
+        return frozenset(self._pending)
+
+    def set(self, field_name: str, value: Any, command: str) -> int:
+        """Show ``value`` for a field until confirmed, returning its token."""
+        return self.set_many({field_name: value}, command)[field_name]
+
+    def set_many(self, values: Mapping[str, Any], command: str) -> dict[str, int]:
+        """Show the values one command sets, returning a token per field."""
+        issued_at = time.monotonic()
+        tokens = {field_name: next(self._tokens) for field_name in values}
+        group = min(tokens.values(), default=0)
+        for field_name, value in values.items():
+            self._pending[field_name] = _PendingValue(
+                value, command, issued_at, tokens[field_name], group
+            )
+        self.stats.issued += len(tokens)
+        return tokens
+
+    def is_pending(self, field_name: str, token: int) -> bool:
+        """Return whether the value issued with ``token`` is still shown."""
+        pending = self._pending.get(field_name)
+        return pending is not None and pending.token == token
+
+    def apply(self, snapshot: _SnapshotT) -> _SnapshotT:
+        """Return ``snapshot`` with every pending value applied."""
+        if not self._pending:
+            return snapshot
+        return dataclasses.replace(
+            snapshot,
+            **{name: pending.value for name, pending in self._pending.items()},
+        )
+
+    def reconcile(self, snapshot: AltitudeSnapshot) -> set[str]:
+        """Confirm pending values the reported snapshot now matches."""
+        confirmed: set[str] = set()
+        completed: dict[int, tuple[str, float]] = {}
+        for name, pending in list(self._pending.items()):
+            if not values_match(pending.value, getattr(snapshot, name)):
+                continue
+            del self._pending[name]
+            latency = time.monotonic() - pending.issued_at
+            stats = self.stats
+            stats.confirmed += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+            stats.last_latency[pending.command] = latency
+            completed[pending.group] = (pending.command, latency)
+            confirmed.add(name)
+        if self._on_confirm is not None and completed:
+            still_pending = {pending.group for pending in self._pending.values()}
+            for group, (command, latency) in completed.items():
+                if group not in still_pending:
+                    self._on_confirm(command, latency)
+        return confirmed
+
+    def rollback(self, field_name: str, token: int) -> bool:
+        """Drop a value whose command failed; False if it was already replaced."""
+        if not self.is_pending(field_name, token):
+            return False
+        del self._pending[field_name]
+        self.stats.rolled_back += 1
+        return True
+
+    def expire(self, field_name: str, token: int) -> bool:
+        """Drop a value the device never confirmed; False if already resolved."""
+        if not self.is_pending(field_name, token):
+            return False
+        del self._pending[field_name]
+        self.stats.expired += 1
+        return True
+
+
+def values_match(intended: Any, reported: Any) -> bool:
+    """Return whether a reported value confirms an intended one."""
+    if intended is None or reported is None:
+        return intended is reported
+    if isinstance(intended, float) and isinstance(reported, int | float):
+        return abs(reported - intended) < FLOAT_TOLERANCE
+    if isinstance(intended, str) and isinstance(reported, str):
+        return normalize_name(intended) == normalize_name(reported)
+    return intended == reported
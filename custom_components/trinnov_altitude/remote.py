@@ -5,18 +5,18 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from homeassistant.components.remote import RemoteEntity, RemoteEntityFeature
+from homeassistant.components.remote import (
+    ATTR_DELAY_SECS,
+    RemoteEntity,
+    RemoteEntityFeature,
+)
 from homeassistant.exceptions import HomeAssistantError
 
-from trinnov_altitude.command_bridge import (
-    ACK_REQUIRED_COMMANDS,
-    VALID_COMMANDS,
-    normalize_args,
-    parse_command,
-)
+from trinnov_altitude.command_bridge import ACK_REQUIRED_COMMANDS
 from trinnov_altitude.exceptions import NoMacAddressError, NotConnectedError
 from trinnov_altitude.lifecycle import ControlHealth
 
+from .commands import describe_command_error
 from .const import DOMAIN
 from .entity import TrinnovAltitudeEntity
 from .models import TrinnovAltitudeIntegrationData
@@ -46,6 +46,7 @@ class TrinnovAltitudeRemote(TrinnovAltitudeEntity, RemoteEntity):
 
     _attr_name = None
     _attr_supported_features = RemoteEntityFeature.ACTIVITY
+    _snapshot_fields = frozenset({"runtime.control", "source", "sources"})
 
     @property
     def activity_list(self) -> list[str] | None:
@@ -82,8 +83,7 @@ class TrinnovAltitudeRemote(TrinnovAltitudeEntity, RemoteEntity):
                 self._client.connected,
                 self._state.synced,
             )
-            self._client.power_on()
-            self.coordinator.async_set_updated_data(self.coordinator._snapshot_state())
+            await self.coordinator.async_power_on()
         except NoMacAddressError as exc:
             raise HomeAssistantError(
                 "Trinnov Altitude is not configured with a mac address, which is required to power it on."
@@ -92,25 +92,32 @@ class TrinnovAltitudeRemote(TrinnovAltitudeEntity, RemoteEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the device off."""
         await self._commands.invoke("power_off", require_ack=True)
-        self.coordinator.async_set_updated_data(self.coordinator._snapshot_state())
 
     async def async_send_command(self, command: Iterable[str], **kwargs: Any) -> None:
-        """Send a command to a device."""
-        for cmd in command:
-            method_name: str | None = None
-            try:
-                parsed = parse_command(cmd)
-                method_name = parsed.method_name
-
-                if method_name not in VALID_COMMANDS:
-                    raise HomeAssistantError(
-                        f"'{method_name}' is not a valid Trinnov Altitude command"
-                    )
+        """Send a command to a device.
+
+        The whole list is validated before anything is sent. With
+        ``delay_secs: 0`` the commands are written as one pipelined batch.
+        """
+        calls = self._commands.parse_command_lines(command)
+        if kwargs.get(ATTR_DELAY_SECS) == 0 and len(calls) > 1:
+            results = await self._commands.invoke_pipelined(calls)
+            failures = [
+                f"{method_name}: {describe_command_error(error)}"
+                for (method_name, _), error in zip(calls, results, strict=True)
+                if error is not None
+            ]
+            if failures:
+                raise HomeAssistantError(
+                    "Trinnov Altitude batch failed for " + "; ".join(failures)
+                )
+            return
 
-                typed_args = normalize_args(method_name, parsed.args)
+        for method_name, args in calls:
+            try:
                 await self._commands.invoke(
                     method_name,
-                    *typed_args,
+                    *args,
                     require_ack=method_name in ACK_REQUIRED_COMMANDS,
                 )
             except NotConnectedError as exc:
@@ -119,7 +126,7 @@ class TrinnovAltitudeRemote(TrinnovAltitudeEntity, RemoteEntity):
                 ) from exc
             except TypeError as exc:
                 raise HomeAssistantError(
-                    f"Invalid arguments for command '{method_name or cmd}'. Expected format: <command> <arg1> <arg2> ..."
+                    f"Invalid arguments for command '{method_name}'. Expected format: <command> <arg1> <arg2> ..."
                 ) from exc
             except ValueError as exc:
                 raise HomeAssistantError(str(exc)) from exc
@@ -2,11 +2,39 @@
 
 from __future__ import annotations
 
-from trinnov_altitude.const import UpmixerMode
+from functools import lru_cache
 
+from trinnov_altitude.const import UpmixerMode
 
-def resolve_source_name(state: object) -> str | None:
-    """Return current source name with index fallback when labels are absent."""
+from .catalog import CatalogIndex, catalog_from_value
+
+# Snapshot fields read by each resolver, used for coordinator update routing.
+SOURCE_NAME_FIELDS = frozenset({"source", "current_source_index", "sources"})
+PRESET_NAME_FIELDS = frozenset({"preset", "current_preset_index", "presets"})
+UPMIXER_FIELDS = frozenset({"upmixer", "active_upmixer"})
+
+_UPMIXER_VALUES = frozenset(mode.value for mode in UpmixerMode)
+# Raw spellings of every known mode mapped straight to the normalized value.
+_UPMIXER_ALIASES = {
+    alias: mode.value
+    for mode in UpmixerMode
+    for alias in (
+        mode.value,
+        mode.value.upper(),
+        mode.value.title(),
+        mode.value.replace(" ", "_"),
+        mode.value.replace(" ", "_").upper(),
+    )
+}
+
+
+def resolve_source_name(
+    state: object, sources: CatalogIndex | None = None
+) -> str | None:
+    """Return current source name with index fallback when labels are absent.
+
+    Callers that resolve repeatedly pass the index of the state's sources.
+    """
     source = getattr(state, "source", None)
     if source:
         return str(source)
@@ -15,17 +43,18 @@ def resolve_source_name(state: object) -> str | None:
     if not isinstance(index, int) or index < 0:
         return None
 
-    sources = _indexed_values(getattr(state, "sources", {}))
-    if index in sources:
-        value = sources.get(index)
-        if value:
-            return str(value)
+    if sources is None:
+        sources = CatalogIndex(catalog_from_value(getattr(state, "sources", ())))
+    return sources.name_for(index) or f"Source {index}"
 
-    return f"Source {index}"
 
+def resolve_preset_name(
+    state: object, presets: CatalogIndex | None = None
+) -> str | None:
+    """Return current preset name with index fallback when labels are absent.
 
-def resolve_preset_name(state: object) -> str | None:
-    """Return current preset name with index fallback when labels are absent."""
+    Callers that resolve repeatedly pass the index of the state's presets.
+    """
     preset = getattr(state, "preset", None)
     if preset:
         return str(preset)
@@ -34,13 +63,9 @@ def resolve_preset_name(state: object) -> str | None:
     if not isinstance(index, int) or index < 0:
         return None
 
-    presets = _indexed_values(getattr(state, "presets", {}))
-    if index in presets:
-        value = presets.get(index)
-        if value:
-            return str(value)
-
-    return f"Preset {index}"
+    if presets is None:
+        presets = CatalogIndex(catalog_from_value(getattr(state, "presets", ())))
+    return presets.name_for(index) or f"Preset {index}"
 
 
 def resolve_upmixer_value(state: object) -> str | None:
@@ -51,27 +76,15 @@ def resolve_upmixer_value(state: object) -> str | None:
     if upmixer is None:
         return None
 
-    normalized = str(upmixer).strip().lower().replace("_", " ")
-    known = {mode.value for mode in UpmixerMode}
-    if normalized in known:
+    raw = upmixer if isinstance(upmixer, str) else str(upmixer)
+    if (known := _UPMIXER_ALIASES.get(raw)) is not None:
+        return known
+    return _normalize_upmixer(raw)
+
+
+@lru_cache(maxsize=32)
+def _normalize_upmixer(raw: str) -> str:
+    normalized = raw.strip().lower().replace("_", " ")
+    if normalized in _UPMIXER_VALUES:
         return normalized
-    return str(upmixer).strip()
-
-
-def _indexed_values(value: object) -> dict[int, str]:
-    if isinstance(value, dict):
-        out: dict[int, str] = {}
-        for key, item in value.items():
-            if isinstance(key, int):
-                out[key] = str(item)
-        return out
-    if isinstance(value, tuple):
-        out: dict[int, str] = {}
-        for item in value:
-            if not isinstance(item, tuple) or len(item) != 2:
-                continue
-            key, entry = item
-            if isinstance(key, int):
-                out[key] = str(entry)
-        return out
-    return {}
+    return raw.strip()
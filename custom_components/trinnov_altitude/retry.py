@@ -0,0 +1,88 @@
+"""Bootstrap retry pacing for the Trinnov Altitude coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import random
+import time
+
+INITIAL_DELAY_SECONDS = 5.0
+MAX_DELAY_SECONDS = 300.0
+BACKOFF_MULTIPLIER = 2.0
+JITTER_RATIO = 0.2
+WAKE_DELAY_SECONDS = 1.0
+WAKE_WINDOW_SECONDS = 120.0
+
+
+class BootstrapRetryScheduler:
+    """Pace bootstrap retries with capped exponential backoff and jitter.
+
+    A wake request switches to a fast fixed cadence for a bounded window so
+    time-to-ready after Wake-on-LAN is not penalized by an accumulated backoff.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = INITIAL_DELAY_SECONDS,
+        max_delay: float = MAX_DELAY_SECONDS,
+        multiplier: float = BACKOFF_MULTIPLIER,
+        jitter: float = JITTER_RATIO,
+        wake_delay: float = WAKE_DELAY_SECONDS,
+        wake_window: float = WAKE_WINDOW_SECONDS,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._multiplier = multiplier
+        self._jitter = jitter
+        self._wake_delay = wake_delay
+        self._wake_window = wake_window
+        self._wake_deadline: float | None = None
+        self._wake_event = asyncio.Event()
+        self.attempts = 0
+        self.delay = 0.0
+        self._backoff = 0.0
+
+    @property
+    def waking(self) -> bool:
+        """Return whether the fast post-wake cadence is active."""
+        return (
+            self._wake_deadline is not None and time.monotonic() < self._wake_deadline
+        )
+
+    def next_delay(self) -> float:
+        """Record a failed attempt and return how long to wait before the next."""
+        self.attempts += 1
+        if self.waking:
+            self.delay = self._wake_delay
+            return self.delay
+        # Grow the previous backoff rather than raising the multiplier to the
+        # attempt count, which overflows after a few days of retries.
+        backoff = self._backoff = min(
+            self._max_delay,
+            self._backoff * self._multiplier if self._backoff else self._initial_delay,
+        )
+        spread = backoff * self._jitter
+        self.delay = min(
+            self._max_delay, max(0.0, backoff + random.uniform(-spread, spread))
+        )
+        return self.delay
+
+    def wake(self) -> None:
+        """Reset the backoff and interrupt any pending wait."""
+        self._wake_deadline = time.monotonic() + self._wake_window
+        self.reset()
+        self._wake_event.set()
+
+    def reset(self) -> None:
+        """Forget accumulated backoff after a successful bootstrap."""
+        self.attempts = 0
+        self.delay = 0.0
+        self._backoff = 0.0
+
+    async def async_wait(self, delay: float) -> None:
+        """Sleep for ``delay`` seconds, returning early if a wake is requested."""
+        self._wake_event.clear()
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._wake_event.wait(), delay)
@@ -13,13 +13,25 @@ from .const import DOMAIN
 from .coordinator import TrinnovAltitudeCoordinator
 from .entity import TrinnovAltitudeEntity
 from .models import TrinnovAltitudeIntegrationData
-from .resolvers import resolve_preset_name, resolve_source_name, resolve_upmixer_value
+from .resolvers import (
+    PRESET_NAME_FIELDS,
+    SOURCE_NAME_FIELDS,
+    UPMIXER_FIELDS,
+    resolve_preset_name,
+    resolve_source_name,
+    resolve_upmixer_value,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+    from .catalog import CatalogIndex
+
+_UPMIXER_MODES = {mode.value: mode for mode in UpmixerMode}
+_UPMIXER_OPTIONS = list(_UPMIXER_MODES)
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -35,52 +47,83 @@ async def async_setup_entry(
     )
 
 
+class _CatalogOptions:
+    """Select options for one catalog, rebuilt only when the catalog changes.
+
+    The coordinator hands out the same index until the catalog changes, so an
+    identity check is enough.
+    """
+
+    def __init__(self, fallback_label: str) -> None:
+        self._fallback_label = fallback_label
+        self._index: int | None = None
+        self.catalog_index: CatalogIndex | None = None
+        self.ids: dict[str, int] = {}
+        self.options: list[str] = []
+
+    def refresh(self, catalog_index: CatalogIndex, index: object) -> _CatalogOptions:
+        """Bring the options up to date with the catalog and current index."""
+        if not isinstance(index, int) or index < 0:
+            index = None
+        if catalog_index is not self.catalog_index or index != self._index:
+            self._rebuild(catalog_index, index)
+        return self
+
+    def _rebuild(self, catalog_index: CatalogIndex, index: int | None) -> None:
+        ids = dict(catalog_index.names)
+        if index is not None and index not in ids.values():
+            ids[f"{self._fallback_label} {index}"] = index
+        self.catalog_index = catalog_index
+        self._index = index
+        self.ids = ids
+        self.options = list(ids)
+
+
 class TrinnovAltitudeSourceSelect(TrinnovAltitudeEntity, SelectEntity):
     """Representation of a Trinnov Altitude source select entity."""
 
     _attr_translation_key = "source"
     _attr_name = "Source"
+    _snapshot_fields = SOURCE_NAME_FIELDS
 
     def __init__(self, coordinator: TrinnovAltitudeCoordinator) -> None:
         """Initialize select entity."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{self._attr_unique_id}-source-select"
+        self._source_options = _CatalogOptions("Source")
 
     @property
     def current_option(self) -> str | None:
         """Return the current source."""
-        return resolve_source_name(self._state)
+        return resolve_source_name(self._state, self._source_choices().catalog_index)
 
     @property
     def options(self) -> list[str]:
         """Return the list of available sources."""
-        sources = self._source_options()
-        return list(sources.keys())
+        return self._source_choices().options
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected source."""
-        source_options = self._source_options()
-        source_id = source_options.get(option)
+        source_id = self._source_choices().ids.get(option)
         if source_id is None:
             raise HomeAssistantError(f"Unknown source option: {option}")
         try:
-            await self._commands.invoke("source_set", source_id, require_ack=True)
+            await self.coordinator.async_invoke_optimistic(
+                {"current_source_index": source_id, "source": option},
+                "source_set",
+                source_id,
+                require_ack=True,
+            )
         except ValueError as exc:
             raise HomeAssistantError(str(exc)) from exc
 
-    def _source_options(self) -> dict[str, int]:
-        """Build stable source options keyed by display name."""
-        options: dict[str, int] = {}
-        sources = getattr(self._state, "sources", {})
-        if isinstance(sources, tuple):
-            for source_id, source_name in sources:
-                options[str(source_name)] = int(source_id)
-
-        index = getattr(self._state, "current_source_index", None)
-        if isinstance(index, int) and index >= 0 and index not in options.values():
-            options[f"Source {index}"] = index
-
-        return options
+    def _source_choices(self) -> _CatalogOptions:
+        """Return source options for the current catalog."""
+        state = self._state
+        return self._source_options.refresh(
+            self.coordinator.catalog_index("sources", state),
+            getattr(state, "current_source_index", None),
+        )
 
 
 class TrinnovAltitudePresetSelect(TrinnovAltitudeEntity, SelectEntity):
@@ -88,44 +131,43 @@ class TrinnovAltitudePresetSelect(TrinnovAltitudeEntity, SelectEntity):
 
     _attr_translation_key = "preset"
     _attr_name = "Preset"
+    _snapshot_fields = PRESET_NAME_FIELDS
 
     def __init__(self, coordinator: TrinnovAltitudeCoordinator) -> None:
         """Initialize select entity."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{self._attr_unique_id}-preset-select"
+        self._preset_options = _CatalogOptions("Preset")
 
     @property
     def current_option(self) -> str | None:
         """Return the current preset."""
-        return resolve_preset_name(self._state)
+        return resolve_preset_name(self._state, self._preset_choices().catalog_index)
 
     @property
     def options(self) -> list[str]:
         """Return the list of available presets."""
-        presets = self._preset_options()
-        return list(presets.keys())
+        return self._preset_choices().options
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected preset."""
-        preset_options = self._preset_options()
-        preset_id = preset_options.get(option)
+        preset_id = self._preset_choices().ids.get(option)
         if preset_id is None:
             raise HomeAssistantError(f"Unknown preset option: {option}")
-        await self._commands.invoke("preset_set", preset_id, require_ack=True)
-
-    def _preset_options(self) -> dict[str, int]:
-        """Build stable preset options keyed by display name."""
-        options: dict[str, int] = {}
-        presets = getattr(self._state, "presets", {})
-        if isinstance(presets, tuple):
-            for preset_id, preset_name in presets:
-                options[str(preset_name)] = int(preset_id)
-
-        index = getattr(self._state, "current_preset_index", None)
-        if isinstance(index, int) and index >= 0 and index not in options.values():
-            options[f"Preset {index}"] = index
-
-        return options
+        await self.coordinator.async_invoke_optimistic(
+            {"current_preset_index": preset_id, "preset": option},
+            "preset_set",
+            preset_id,
+            require_ack=True,
+        )
+
+    def _preset_choices(self) -> _CatalogOptions:
+        """Return preset options for the current catalog."""
+        state = self._state
+        return self._preset_options.refresh(
+            self.coordinator.catalog_index("presets", state),
+            getattr(state, "current_preset_index", None),
+        )
 
 
 class TrinnovAltitudeUpmixerSelect(TrinnovAltitudeEntity, SelectEntity):
@@ -133,6 +175,7 @@ class TrinnovAltitudeUpmixerSelect(TrinnovAltitudeEntity, SelectEntity):
 
     _attr_translation_key = "upmixer"
     _attr_name = "Upmixer"
+    _snapshot_fields = UPMIXER_FIELDS
 
     def __init__(self, coordinator: TrinnovAltitudeCoordinator) -> None:
         """Initialize select entity."""
@@ -147,16 +190,16 @@ class TrinnovAltitudeUpmixerSelect(TrinnovAltitudeEntity, SelectEntity):
     @property
     def options(self) -> list[str]:
         """Return the list of available upmixer modes."""
-        options = [mode.value for mode in UpmixerMode]
         current = resolve_upmixer_value(self._state)
-        if current and current not in options:
-            options.append(current)
-        return options
+        if current and current not in _UPMIXER_MODES:
+            return [*_UPMIXER_OPTIONS, current]
+        return _UPMIXER_OPTIONS
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected upmixer."""
-        for mode in UpmixerMode:
-            if mode.value == option:
-                await self._commands.invoke("upmixer_set", mode, require_ack=True)
-                return
-        raise HomeAssistantError(f"Unknown upmixer option: {option}")
+        mode = _UPMIXER_MODES.get(option)
+        if mode is None:
+            raise HomeAssistantError(f"Unknown upmixer option: {option}")
+        await self.coordinator.async_invoke_optimistic(
+            {"upmixer": mode.value}, "upmixer_set", mode, require_ack=True
+        )
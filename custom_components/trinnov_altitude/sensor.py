@@ -9,8 +9,9 @@ from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
+    SensorStateClass,
 )
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, UnitOfTime
 
 from trinnov_altitude.lifecycle import (
     ControlHealth,
@@ -23,7 +24,14 @@ from .const import DOMAIN
 from .coordinator import TrinnovAltitudeCoordinator
 from .entity import TrinnovAltitudeEntity
 from .models import TrinnovAltitudeIntegrationData
-from .resolvers import resolve_preset_name, resolve_source_name, resolve_upmixer_value
+from .resolvers import (
+    PRESET_NAME_FIELDS,
+    SOURCE_NAME_FIELDS,
+    UPMIXER_FIELDS,
+    resolve_preset_name,
+    resolve_source_name,
+    resolve_upmixer_value,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -35,12 +43,16 @@ if TYPE_CHECKING:
 
     from trinnov_altitude.adapter import AltitudeSnapshot
 
+    from .snapshot import TrinnovAltitudeSnapshot
+
 
 @dataclass(frozen=True, kw_only=True)
 class TrinnovAltitudeSensorEntityDescription(SensorEntityDescription):
     """Describes Trinnov Altitude sensor entity."""
 
-    value_fn: Callable[[AltitudeSnapshot], StateType]
+    value_fn: Callable[[TrinnovAltitudeSnapshot], StateType]
+    icon_fn: Callable[[TrinnovAltitudeSnapshot], str | None] | None = None
+    snapshot_fields: frozenset[str] | None = None
 
 
 POWER_STATUS_ICONS = {
@@ -51,6 +63,18 @@ POWER_STATUS_ICONS = {
 }
 
 
+def _last_error_message(state: AltitudeSnapshot) -> str | None:
+    """Return the message of the last runtime error, if any."""
+    error = state.runtime.last_error
+    return error.message if error is not None else None
+
+
+def _last_error_kind(state: AltitudeSnapshot) -> str | None:
+    """Return the kind of the last runtime error, if any."""
+    error = state.runtime.last_error
+    return error.kind.value if error is not None else None
+
+
 SENSORS: tuple[TrinnovAltitudeSensorEntityDescription, ...] = (
     TrinnovAltitudeSensorEntityDescription(
         key="power_status",
@@ -58,13 +82,16 @@ SENSORS: tuple[TrinnovAltitudeSensorEntityDescription, ...] = (
         name="Power Status",
         device_class=SensorDeviceClass.ENUM,
         options=[status.value for status in PowerState],
-        value_fn=lambda _state: PowerState.UNKNOWN,
+        value_fn=lambda state: state.runtime.power.value,
+        icon_fn=lambda state: POWER_STATUS_ICONS.get(state.runtime.power),
+        snapshot_fields=frozenset({"runtime.power"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="audiosync",
         translation_key="audiosync",
         name="Audiosync",
         value_fn=lambda state: state.audiosync,
+        snapshot_fields=frozenset({"audiosync"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="connection_status",
@@ -73,7 +100,8 @@ SENSORS: tuple[TrinnovAltitudeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
         options=[status.value for status in TransportState],
-        value_fn=lambda _state: TransportState.DISCONNECTED,
+        value_fn=lambda state: state.runtime.transport.value,
+        snapshot_fields=frozenset({"runtime.transport"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="sync_status",
@@ -82,7 +110,8 @@ SENSORS: tuple[TrinnovAltitudeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
         options=[status.value for status in SyncState],
-        value_fn=lambda _state: SyncState.UNSYNCED,
+        value_fn=lambda state: state.runtime.sync.value,
+        snapshot_fields=frozenset({"runtime.sync"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="control_health",
@@ -91,21 +120,48 @@ SENSORS: tuple[TrinnovAltitudeSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.ENUM,
         entity_category=EntityCategory.DIAGNOSTIC,
         options=[status.value for status in ControlHealth],
-        value_fn=lambda _state: ControlHealth.UNAVAILABLE,
+        value_fn=lambda state: state.runtime.control.value,
+        snapshot_fields=frozenset({"runtime.control"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="last_error",
         translation_key="last_error",
         name="Last Error",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda _state: None,
+        value_fn=_last_error_message,
+        snapshot_fields=frozenset({"runtime.last_error"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="last_error_kind",
         translation_key="last_error_kind",
         name="Last Error Kind",
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda _state: None,
+        value_fn=_last_error_kind,
+        snapshot_fields=frozenset({"runtime.last_error"}),
+    ),
+    TrinnovAltitudeSensorEntityDescription(
+        key="time_to_ready",
+        translation_key="time_to_ready",
+        name="Last Time to Ready",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=1,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda state: state.time_to_ready,
+        snapshot_fields=frozenset({"time_to_ready"}),
+    ),
+    TrinnovAltitudeSensorEntityDescription(
+        key="connect_duration",
+        translation_key="connect_duration",
+        name="Last Connect Duration",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda state: state.connect_duration,
+        snapshot_fields=frozenset({"connect_duration"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="version",
@@ -113,6 +169,7 @@ SENSORS: tuple[TrinnovAltitudeSensorEntityDescription, ...] = (
         name="Version",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda state: state.version,
+        snapshot_fields=frozenset({"version"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="device_id",
@@ -120,42 +177,49 @@ SENSORS: tuple[TrinnovAltitudeSensorEntityDescription, ...] = (
         name="Device ID",
         entity_category=EntityCategory.DIAGNOSTIC,
         value_fn=lambda state: state.id,
+        snapshot_fields=frozenset({"id"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="decoder",
         translation_key="decoder",
         name="Decoder",
         value_fn=lambda state: state.decoder,
+        snapshot_fields=frozenset({"decoder"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="preset",
         translation_key="preset",
         name="Preset",
         value_fn=resolve_preset_name,
+        snapshot_fields=PRESET_NAME_FIELDS,
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="source",
         translation_key="source",
         name="Source",
         value_fn=resolve_source_name,
+        snapshot_fields=SOURCE_NAME_FIELDS,
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="source_format",
         translation_key="source_format",
         name="Source Format",
         value_fn=lambda state: state.source_format,
+        snapshot_fields=frozenset({"source_format"}),
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="upmixer",
         translation_key="upmixer",
         name="Upmixer",
         value_fn=resolve_upmixer_value,
+        snapshot_fields=UPMIXER_FIELDS,
     ),
     TrinnovAltitudeSensorEntityDescription(
         key="volume",
         translation_key="volume",
         name="Volume",
         value_fn=lambda state: state.volume,
+        snapshot_fields=frozenset({"volume"}),
     ),
 )
 
@@ -181,32 +245,27 @@ class TrinnovAltitudeSensor(TrinnovAltitudeEntity, SensorEntity):
         entity_description: TrinnovAltitudeSensorEntityDescription,
     ) -> None:
         """Initialize sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entity_description.snapshot_fields)
         self.entity_description = entity_description
         self._attr_unique_id = f"{self._attr_unique_id}-{entity_description.key}"
+        self._value_fn = entity_description.value_fn
+        self._icon_fn = entity_description.icon_fn
+        self._rendered: tuple[int, StateType, str | None] | None = None
 
     @property
     def native_value(self) -> StateType:
         """Return value of sensor."""
-        if self.entity_description.key == "power_status":
-            return self.coordinator.power_status.value
-        if self.entity_description.key == "connection_status":
-            return self._snapshot_state.runtime.transport.value
-        if self.entity_description.key == "sync_status":
-            return self._snapshot_state.runtime.sync.value
-        if self.entity_description.key == "control_health":
-            return self._snapshot_state.runtime.control.value
-        if self.entity_description.key == "last_error":
-            error = self._snapshot_state.runtime.last_error
-            return error.message if error is not None else None
-        if self.entity_description.key == "last_error_kind":
-            error = self._snapshot_state.runtime.last_error
-            return error.kind.value if error is not None else None
-        return self.entity_description.value_fn(self._state)
+        return self._render()[0]
 
     @property
     def icon(self) -> str | None:
-        """Return dynamic icon for power_status sensor."""
-        if self.entity_description.key == "power_status":
-            return POWER_STATUS_ICONS.get(self.coordinator.power_status)
-        return None
+        """Return dynamic icon for sensors that define one."""
+        return self._render()[1]
+
+    def _render(self) -> tuple[StateType, str | None]:
+        """Return value and icon, computed at most once per snapshot version."""
+        state = self._state
+        if self._rendered is None or self._rendered[0] != state.snapshot_version:
+            icon = self._icon_fn(state) if self._icon_fn is not None else None
+            self._rendered = (state.snapshot_version, self._value_fn(state), icon)
+        return self._rendered[1], self._rendered[2]
@@ -2,23 +2,47 @@
 
 from __future__ import annotations
 
+from dataclasses import asdict
+from pathlib import Path
+
 import voluptuous as vol
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 
 from trinnov_altitude.command_bridge import parse_upmixer_mode
 from trinnov_altitude.const import UpmixerMode
+from trinnov_altitude.exceptions import NoMacAddressError
 
+from .commands import WAKE_DEFER_SECONDS, describe_command_error
 from .const import (
+    ATTR_COMMANDS,
     ATTR_ENTRY_ID,
+    ATTR_FILENAME,
+    ATTR_FUZZY,
+    ATTR_PRESET,
     ATTR_PRESET_ID,
+    ATTR_RESET,
     ATTR_SOURCE,
+    ATTR_TIMEOUT,
     ATTR_UPMIXER,
+    CAPTURE_DIRECTORY,
     DOMAIN,
+    SERVICE_COMMAND_STATS,
+    SERVICE_POWER_ON,
+    SERVICE_SEND_BATCH,
     SERVICE_SET_PRESET,
+    SERVICE_SET_PRESET_BY_NAME,
     SERVICE_SET_SOURCE_BY_NAME,
     SERVICE_SET_UPMIXER,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
 )
 from .models import TrinnovAltitudeIntegrationData
 
@@ -58,11 +82,30 @@ async def _async_set_source_by_name(hass: HomeAssistant, call: ServiceCall) -> N
     source = call.data[ATTR_SOURCE]
     data = _resolve_entry_data(hass, entry_id)
     try:
-        await data.commands.invoke("source_set_by_name", source, require_ack=True)
+        if call.data[ATTR_FUZZY]:
+            # Names resolve against the live catalog, which a waking
+            # processor has not sent yet.
+            await data.commands.async_wait_until_ready()
+            source_id = data.commands.source_id(source, fuzzy=True)
+            await data.commands.invoke("source_set", source_id, require_ack=True)
+        else:
+            await data.commands.invoke("source_set_by_name", source, require_ack=True)
     except ValueError as exc:
         raise ServiceValidationError(str(exc)) from exc
 
 
+async def _async_set_preset_by_name(hass: HomeAssistant, call: ServiceCall) -> None:
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    preset = call.data[ATTR_PRESET]
+    data = _resolve_entry_data(hass, entry_id)
+    await data.commands.async_wait_until_ready()
+    try:
+        preset_id = data.commands.preset_id(preset, fuzzy=call.data[ATTR_FUZZY])
+    except ValueError as exc:
+        raise ServiceValidationError(str(exc)) from exc
+    await data.commands.invoke("preset_set", preset_id, require_ack=True)
+
+
 async def _async_set_preset(hass: HomeAssistant, call: ServiceCall) -> None:
     entry_id = call.data.get(ATTR_ENTRY_ID)
     preset_id = call.data[ATTR_PRESET_ID]
@@ -87,13 +130,111 @@ async def _async_set_upmixer(hass: HomeAssistant, call: ServiceCall) -> None:
     await data.commands.invoke("upmixer_set", mode, require_ack=True)
 
 
+async def _async_send_batch(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    lines: list[str] = call.data[ATTR_COMMANDS]
+    data = _resolve_entry_data(hass, entry_id)
+    calls = data.commands.parse_command_lines(lines)
+    results = await data.commands.invoke_pipelined(calls)
+    outcomes = list(zip(lines, results, strict=True))
+    if not call.return_response:
+        # Without a response variable the caller can only learn of failures
+        # from an error.
+        failures = [
+            f"{line!r}: {describe_command_error(error)}"
+            for line, error in outcomes
+            if error is not None
+        ]
+        if failures:
+            raise HomeAssistantError(
+                f"{len(failures)} of {len(lines)} Trinnov Altitude commands "
+                f"failed: {'; '.join(failures)}"
+            )
+        return None
+    return {
+        "results": [
+            {
+                "command": line,
+                "success": error is None,
+                "error": None if error is None else describe_command_error(error),
+            }
+            for line, error in outcomes
+        ]
+    }
+
+
+async def _async_power_on(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    data = _resolve_entry_data(hass, entry_id)
+    try:
+        time_to_ready = await data.coordinator.async_power_on_and_wait(
+            call.data[ATTR_TIMEOUT]
+        )
+    except NoMacAddressError as exc:
+        raise HomeAssistantError(
+            "Trinnov Altitude is not configured with a mac address, which is required to power it on."
+        ) from exc
+    return {"time_to_ready": round(time_to_ready, 3)}
+
+
+async def _async_command_stats(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    commands = _resolve_entry_data(hass, entry_id).commands
+    queue = asdict(commands.queue_stats)
+    queue["average_wait"] = commands.queue_stats.average_wait
+    response: ServiceResponse = {
+        "methods": commands.metrics.as_dict(),
+        "queue": queue,
+    }
+    if call.data[ATTR_RESET]:
+        commands.metrics.reset()
+    return response
+
+
+async def _async_start_capture(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    coordinator = _resolve_entry_data(hass, entry_id).coordinator
+    filename = call.data.get(ATTR_FILENAME) or (
+        f"{coordinator.stable_device_id}-{dt_util.utcnow():%Y%m%dT%H%M%S}.jsonl"
+    )
+    capture = await coordinator.async_start_capture(
+        Path(hass.config.path(CAPTURE_DIRECTORY, filename))
+    )
+    return {"path": str(capture.path)}
+
+
+async def _async_stop_capture(
+    hass: HomeAssistant, call: ServiceCall
+) -> ServiceResponse:
+    entry_id = call.data.get(ATTR_ENTRY_ID)
+    capture = await _resolve_entry_data(hass, entry_id).coordinator.async_stop_capture()
+    if capture is None:
+        raise HomeAssistantError("Trinnov Altitude is not capturing")
+    return {"path": str(capture.path), "records": capture.records}
+
+
 def async_setup_services(hass: HomeAssistant) -> None:
     """Register domain services once."""
     if hass.data.get(SERVICES_DATA_KEY):
         return
 
     schema_source = vol.Schema(
-        {vol.Optional(ATTR_ENTRY_ID): cv.string, vol.Required(ATTR_SOURCE): cv.string}
+        {
+            vol.Optional(ATTR_ENTRY_ID): cv.string,
+            vol.Required(ATTR_SOURCE): cv.string,
+            vol.Optional(ATTR_FUZZY, default=False): cv.boolean,
+        }
+    )
+    schema_preset_name = vol.Schema(
+        {
+            vol.Optional(ATTR_ENTRY_ID): cv.string,
+            vol.Required(ATTR_PRESET): cv.string,
+            vol.Optional(ATTR_FUZZY, default=False): cv.boolean,
+        }
     )
     schema_preset = vol.Schema(
         {
@@ -105,15 +246,69 @@ def async_setup_services(hass: HomeAssistant) -> None:
         {vol.Optional(ATTR_ENTRY_ID): cv.string, vol.Required(ATTR_UPMIXER): cv.string}
     )
 
+    schema_batch = vol.Schema(
+        {
+            vol.Optional(ATTR_ENTRY_ID): cv.string,
+            vol.Required(ATTR_COMMANDS): vol.All(
+                cv.ensure_list, [cv.string], vol.Length(min=1)
+            ),
+        }
+    )
+
+    schema_power_on = vol.Schema(
+        {
+            vol.Optional(ATTR_ENTRY_ID): cv.string,
+            vol.Optional(ATTR_TIMEOUT, default=WAKE_DEFER_SECONDS): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=600)
+            ),
+        }
+    )
+
+    schema_command_stats = vol.Schema(
+        {
+            vol.Optional(ATTR_ENTRY_ID): cv.string,
+            vol.Optional(ATTR_RESET, default=False): cv.boolean,
+        }
+    )
+
+    schema_start_capture = vol.Schema(
+        {
+            vol.Optional(ATTR_ENTRY_ID): cv.string,
+            # A bare file name: captures always land in the capture directory.
+            vol.Optional(ATTR_FILENAME): vol.All(
+                cv.string, vol.Match(r"^[\w.-]+$"), vol.NotIn([".", ".."])
+            ),
+        }
+    )
+    schema_stop_capture = vol.Schema({vol.Optional(ATTR_ENTRY_ID): cv.string})
+
     async def handle_set_source_by_name(call: ServiceCall) -> None:
         await _async_set_source_by_name(hass, call)
 
+    async def handle_set_preset_by_name(call: ServiceCall) -> None:
+        await _async_set_preset_by_name(hass, call)
+
     async def handle_set_preset(call: ServiceCall) -> None:
         await _async_set_preset(hass, call)
 
     async def handle_set_upmixer(call: ServiceCall) -> None:
         await _async_set_upmixer(hass, call)
 
+    async def handle_send_batch(call: ServiceCall) -> ServiceResponse:
+        return await _async_send_batch(hass, call)
+
+    async def handle_power_on(call: ServiceCall) -> ServiceResponse:
+        return await _async_power_on(hass, call)
+
+    async def handle_command_stats(call: ServiceCall) -> ServiceResponse:
+        return await _async_command_stats(hass, call)
+
+    async def handle_start_capture(call: ServiceCall) -> ServiceResponse:
+        return await _async_start_capture(hass, call)
+
+    async def handle_stop_capture(call: ServiceCall) -> ServiceResponse:
+        return await _async_stop_capture(hass, call)
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_SOURCE_BY_NAME,
@@ -126,12 +321,53 @@ def async_setup_services(hass: HomeAssistant) -> None:
         handle_set_preset,
         schema=schema_preset,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_PRESET_BY_NAME,
+        handle_set_preset_by_name,
+        schema=schema_preset_name,
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_UPMIXER,
         handle_set_upmixer,
         schema=schema_upmixer,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_BATCH,
+        handle_send_batch,
+        schema=schema_batch,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_POWER_ON,
+        handle_power_on,
+        schema=schema_power_on,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_COMMAND_STATS,
+        handle_command_stats,
+        schema=schema_command_stats,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_CAPTURE,
+        handle_start_capture,
+        schema=schema_start_capture,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CAPTURE,
+        handle_stop_capture,
+        schema=schema_stop_capture,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     hass.data[SERVICES_DATA_KEY] = True
 
 
@@ -141,5 +377,11 @@ def async_unload_services(hass: HomeAssistant) -> None:
         return
     hass.services.async_remove(DOMAIN, SERVICE_SET_SOURCE_BY_NAME)
     hass.services.async_remove(DOMAIN, SERVICE_SET_PRESET)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_PRESET_BY_NAME)
     hass.services.async_remove(DOMAIN, SERVICE_SET_UPMIXER)
+    hass.services.async_remove(DOMAIN, SERVICE_SEND_BATCH)
+    hass.services.async_remove(DOMAIN, SERVICE_POWER_ON)
+    hass.services.async_remove(DOMAIN, SERVICE_COMMAND_STATS)
+    hass.services.async_remove(DOMAIN, SERVICE_START_CAPTURE)
+    hass.services.async_remove(DOMAIN, SERVICE_STOP_CAPTURE)
     hass.data.pop(SERVICES_DATA_KEY, None)
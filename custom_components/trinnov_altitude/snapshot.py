@@ -0,0 +1,35 @@
+"""Versioned state snapshots for Trinnov Altitude."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from trinnov_altitude.adapter import AltitudeSnapshot
+
+
+@dataclass(frozen=True)
+class TrinnovAltitudeSnapshot(AltitudeSnapshot):
+    """Immutable coordinator snapshot stamped with a monotonic version.
+
+    Also carries the durations of the last completed bootstrap.
+    """
+
+    snapshot_version: int = 0
+    time_to_ready: float | None = None
+    connect_duration: float | None = None
+
+
+def versioned_snapshot(
+    snapshot: AltitudeSnapshot,
+    snapshot_version: int,
+    *,
+    time_to_ready: float | None = None,
+    connect_duration: float | None = None,
+) -> TrinnovAltitudeSnapshot:
+    """Return ``snapshot`` stamped with ``snapshot_version``."""
+    return TrinnovAltitudeSnapshot(
+        **vars(snapshot),
+        snapshot_version=snapshot_version,
+        time_to_ready=time_to_ready,
+        connect_duration=connect_duration,
+    )
@@ -27,6 +27,7 @@ class TrinnovAltitudeSwitchEntityDescription(SwitchEntityDescription):
     value_fn: Callable[[TrinnovAltitudeSwitch], bool]
     turn_on_fn: Callable[[TrinnovAltitudeSwitch], Coroutine[Any, Any, None]]
     turn_off_fn: Callable[[TrinnovAltitudeSwitch], Coroutine[Any, Any, None]]
+    snapshot_fields: frozenset[str] | None = None
 
 
 SWITCHES: tuple[TrinnovAltitudeSwitchEntityDescription, ...] = (
@@ -35,24 +36,31 @@ SWITCHES: tuple[TrinnovAltitudeSwitchEntityDescription, ...] = (
         translation_key="mute",
         name="Mute",
         value_fn=lambda entity: entity._state.mute or False,
-        turn_on_fn=lambda entity: entity._commands.invoke("mute_on"),
-        turn_off_fn=lambda entity: entity._commands.invoke("mute_off"),
+        turn_on_fn=lambda entity: entity._invoke_optimistic("mute", True, "mute_on"),
+        turn_off_fn=lambda entity: entity._invoke_optimistic("mute", False, "mute_off"),
+        snapshot_fields=frozenset({"mute"}),
     ),
     TrinnovAltitudeSwitchEntityDescription(
         key="dim",
         translation_key="dim",
         name="Dim",
         value_fn=lambda entity: entity._state.dim or False,
-        turn_on_fn=lambda entity: entity._commands.invoke("dim_on"),
-        turn_off_fn=lambda entity: entity._commands.invoke("dim_off"),
+        turn_on_fn=lambda entity: entity._invoke_optimistic("dim", True, "dim_on"),
+        turn_off_fn=lambda entity: entity._invoke_optimistic("dim", False, "dim_off"),
+        snapshot_fields=frozenset({"dim"}),
     ),
     TrinnovAltitudeSwitchEntityDescription(
         key="bypass",
         translation_key="bypass",
         name="Bypass",
         value_fn=lambda entity: entity._state.bypass or False,
-        turn_on_fn=lambda entity: entity._commands.invoke("bypass_on"),
-        turn_off_fn=lambda entity: entity._commands.invoke("bypass_off"),
+        turn_on_fn=lambda entity: entity._invoke_optimistic(
+            "bypass", True, "bypass_on"
+        ),
+        turn_off_fn=lambda entity: entity._invoke_optimistic(
+            "bypass", False, "bypass_off"
+        ),
+        snapshot_fields=frozenset({"bypass"}),
     ),
 )
 
@@ -78,7 +86,7 @@ class TrinnovAltitudeSwitch(TrinnovAltitudeEntity, SwitchEntity):
         entity_description: TrinnovAltitudeSwitchEntityDescription,
     ) -> None:
         """Initialize switch."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entity_description.snapshot_fields)
         self.entity_description = entity_description
         self._attr_unique_id = f"{self._attr_unique_id}-{entity_description.key}"
 
@@ -94,3 +102,7 @@ class TrinnovAltitudeSwitch(TrinnovAltitudeEntity, SwitchEntity):
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         await self.entity_description.turn_off_fn(self)
+
+    async def _invoke_optimistic(self, field: str, value: bool, method: str) -> None:
+        """Run a switch command, showing the new state until the device echoes it."""
+        await self.coordinator.async_invoke_optimistic({field: value}, method)
@@ -0,0 +1,98 @@
+"""Bootstrap phase timeline for the Trinnov Altitude coordinator."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+HISTORY_SIZE = 20
+
+PHASES = ("wol_sent", "connected", "device_id", "sources", "presets", "synced")
+
+
+@dataclass
+class BootstrapTimeline:
+    """Monotonic timestamps for one bootstrap, from its trigger to sync."""
+
+    trigger: str
+    started: float
+    started_at: datetime
+    attempts: int = 0
+    connecting: float | None = None
+    wol_sent: float | None = None
+    connected: float | None = None
+    device_id: float | None = None
+    sources: float | None = None
+    presets: float | None = None
+    synced: float | None = None
+
+    @property
+    def time_to_ready(self) -> float | None:
+        """Return seconds from the trigger until the client synced."""
+        return None if self.synced is None else self.synced - self.started
+
+    @property
+    def connect_duration(self) -> float | None:
+        """Return seconds the last connection attempt took to open."""
+        if self.connected is None or self.connecting is None:
+            return None
+        return self.connected - self.connecting
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the timeline with phases as offsets from the trigger."""
+        return {
+            "trigger": self.trigger,
+            "started_at": self.started_at.isoformat(),
+            "attempts": self.attempts,
+            "time_to_ready": self.time_to_ready,
+            "connect_duration": self.connect_duration,
+            "phases": {phase: self._offset(getattr(self, phase)) for phase in PHASES},
+        }
+
+    def _offset(self, stamp: float | None) -> float | None:
+        return None if stamp is None else stamp - self.started
+
+
+class BootstrapTimelineRecorder:
+    """Record the bootstrap in flight and keep recent completed ones."""
+
+    def __init__(self, history_size: int = HISTORY_SIZE) -> None:
+        """Initialize an empty recorder."""
+        self.current: BootstrapTimeline | None = None
+        self.history: deque[BootstrapTimeline] = deque(maxlen=history_size)
+
+    @property
+    def last(self) -> BootstrapTimeline | None:
+        """Return the most recent completed bootstrap."""
+        return self.history[-1] if self.history else None
+
+    def begin(self, trigger: str, *, restart: bool = False) -> BootstrapTimeline:
+        """Return the bootstrap in flight, starting one if needed or requested."""
+        if self.current is None or restart:
+            self.current = BootstrapTimeline(
+                trigger=trigger, started=time.monotonic(), started_at=datetime.now(UTC)
+            )
+        return self.current
+
+    def mark_attempt(self) -> None:
+        """Record the start of a connection attempt."""
+        if self.current is not None:
+            self.current.attempts += 1
+            self.current.connecting = time.monotonic()
+
+    def mark(self, phase: str) -> None:
+        """Record the first time the bootstrap in flight reached ``phase``."""
+        if self.current is not None and getattr(self.current, phase) is None:
+            setattr(self.current, phase, time.monotonic())
+
+    def finish(self) -> BootstrapTimeline | None:
+        """Complete the bootstrap in flight and move it into the history."""
+        timeline = self.current
+        if timeline is None:
+            return None
+        self.mark("synced")
+        self.history.append(timeline)
+        self.current = None
+        return timeline
@@ -0,0 +1,72 @@
+"""In-memory trace of recent Trinnov Altitude protocol traffic."""
+
+from __future__ import annotations
+
+import dataclasses
+import time
+from typing import Any
+
+TRACE_CAPACITY = 256
+
+
+class ProtocolTrace:
+    """Fixed-capacity ring buffer of client events and protocol messages.
+
+    Slots are allocated up front and overwritten in place, so recording keeps
+    a reference to the event and its message without building anything per
+    message; entries are only formatted when the trace is read.
+    """
+
+    __slots__ = ("_events", "_next", "_payloads", "_stamps", "capacity", "recorded")
+
+    def __init__(self, capacity: int = TRACE_CAPACITY) -> None:
+        """Initialize an empty trace holding at most ``capacity`` entries."""
+        if capacity < 1:
+            raise ValueError("Trace capacity must be at least 1")
+        self.capacity = capacity
+        self.recorded = 0
+        self._next = 0
+        self._stamps = [0.0] * capacity
+        self._events = [""] * capacity
+        self._payloads: list[object | None] = [None] * capacity
+
+    def __len__(self) -> int:
+        """Return the number of entries held."""
+        return min(self.recorded, self.capacity)
+
+    def record(self, event: str, payload: object | None = None) -> None:
+        """Store an event, overwriting the oldest entry when full."""
+        slot = self._next
+        self._stamps[slot] = time.monotonic()
+        self._events[slot] = event
+        self._payloads[slot] = payload
+        self._next = slot + 1 if slot + 1 < self.capacity else 0
+        self.recorded += 1
+
+    def clear(self) -> None:
+        """Drop every entry, releasing the payloads."""
+        self._payloads = [None] * self.capacity
+        self._next = 0
+        self.recorded = 0
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Return held entries oldest first, with their monotonic timestamps."""
+        size = len(self)
+        start = self._next - size
+        return [
+            {
+                "monotonic": self._stamps[slot],
+                "event": self._events[slot],
+                "payload": _describe(self._payloads[slot]),
+            }
+            for slot in (index % self.capacity for index in range(start, start + size))
+        ]
+
+
+def _describe(payload: object | None) -> dict[str, Any] | None:
+    """Render a message or adapter event as plain data."""
+    if payload is None:
+        return None
+    if dataclasses.is_dataclass(payload) and not isinstance(payload, type):
+        return {"type": type(payload).__name__, **dataclasses.asdict(payload)}
+    return {"type": type(payload).__name__, "repr": repr(payload)}
@@ -0,0 +1,74 @@
+"""Deterministic replay of Trinnov Altitude protocol captures.
+
+A capture written by the integration's capture mode is fed back into a
+``TrinnovAltitudeClient`` that is not connected to anything: each message is
+applied to the client state and emitted to its callbacks exactly as the read
+loop would, so ``AltitudeStateAdapter`` and the coordinator see the same
+traffic the processor sent.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from trinnov_altitude.client import TrinnovAltitudeClient
+
+from custom_components.trinnov_altitude.capture import CaptureRecord, read_capture
+
+
+@dataclass
+class ReplayResult:
+    """What a replay fed and how long it took."""
+
+    records: int
+    messages: int
+    elapsed: float
+
+
+class CaptureReplayer:
+    """Feed capture records into a client, at recorded speed or flat out."""
+
+    def __init__(
+        self, client: TrinnovAltitudeClient, records: list[CaptureRecord]
+    ) -> None:
+        """Initialize a replay of ``records`` into ``client``."""
+        self.client = client
+        self.records = records
+
+    @classmethod
+    def from_file(cls, client: TrinnovAltitudeClient, path: Path) -> CaptureReplayer:
+        """Load a capture file for replay."""
+        _header, records = read_capture(path)
+        return cls(client, records)
+
+    async def async_replay(self, speed: float | None = None) -> ReplayResult:
+        """Replay every record.
+
+        With ``speed`` records keep their recorded spacing divided by
+        ``speed``; without it they are fed as fast as possible, yielding to
+        the event loop after each one as a socket read would.
+        """
+        client = self.client
+        messages = 0
+        started = time.perf_counter()
+        for record in self.records:
+            if speed:
+                delay = record.offset / speed - (time.perf_counter() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if record.message is not None:
+                client.state.apply(record.message)
+                client._emit(record.event, record.message)
+                messages += 1
+            elif record.runtime is not None:
+                client._set_runtime(**record.runtime)
+            else:
+                if record.event == "state_changed":
+                    # Emitted when a quiet line let the client commit catalogs.
+                    client.state.commit_pending_catalogs()
+                client._emit(record.event, None)
+            await asyncio.sleep(0)
+        return ReplayResult(len(self.records), messages, time.perf_counter() - started)
@@ -0,0 +1,287 @@
+"""Scriptable Trinnov Altitude protocol simulator for load and latency tests.
+
+The simulator is an asyncio TCP server speaking enough of the Altitude
+protocol for ``TrinnovAltitudeClient`` to connect, sync and send commands.
+Responses can be delayed with a fixed latency plus seeded jitter, and tests
+can push bursts of unsolicited messages, drop connections or refuse new ones
+as a powered-off processor would.
+
+Run it standalone to stand in for a processor on a machine without one::
+
+    python -m tests.simulator --port 44100 --latency 0.02 --jitter 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import random
+import re
+from collections import deque
+from collections.abc import Iterable
+from typing import Self
+
+from trinnov_altitude.mocks import MockTrinnovAltitudeServer
+
+POWER_OFF_LINE = "power_off_SECURED_FHZMCH48FE"
+
+_TOGGLE = re.compile(r"^(mute|dim|bypass)\s(0|1|2)$")
+_UPMIXER = re.compile(r"^upmixer\s(\S+)$")
+_REMAPPING = re.compile(r"^remapping_mode\s(\S+)$")
+_VOLUME_RAMP = re.compile(r"^volume_ramp\s(-?\d+(?:\.\d+)?)\s(\d+(?:\.\d+)?)$")
+_ACCEPTED = re.compile(
+    r"^(?:(?:fav_light|quick_optimized|use_acoustic_correct|use_level_alignment"
+    r"|use_time_alignment)\s(?:0|1|2)|change_page\s-?\d+)$"
+)
+
+
+class AltitudeSimulator(MockTrinnovAltitudeServer):
+    """Simulated Altitude processor with configurable timing and faults."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int | None = 0,
+        device_id: str = "10485761",
+        version: str = "4.3.2",
+        presets: dict[int, str] | None = None,
+        sources: dict[int, str] | None = None,
+        history_size: int = 1024,
+    ) -> None:
+        """Initialize a simulator; ``port`` 0 picks a free port on start."""
+        super().__init__(host, port, presets=presets, sources=sources)
+        self.latency = latency
+        self.jitter = jitter
+        self.device_id = device_id
+        self.version = version
+        self.mute = False
+        self.dim = False
+        self.bypass = False
+        self.upmixer = "auto"
+        self.source_format = "Atmos narrow"
+        # Whether command responses include their "OK" acknowledgement.
+        self.ack_commands = True
+        # A powered-off processor refuses connections until it is woken.
+        self.accepting = True
+        self.connections: set[asyncio.StreamWriter] = set()
+        self.connection_count = 0
+        self.messages_sent = 0
+        self.received_messages: deque[str] = deque(maxlen=history_size)  # type: ignore[assignment]
+        self._random = random.Random(seed)
+        self._connected = asyncio.Event()
+
+    async def __aenter__(self) -> Self:
+        """Start serving."""
+        await self.start_server()
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Stop serving and drop every connection."""
+        await self.stop_server()
+
+    @property
+    def welcome(self) -> str:
+        """Return the banner sent to each new connection."""
+        return f"Welcome on Trinnov Optimizer (Version {self.version}, ID {self.device_id})"
+
+    async def handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client connection until it leaves or is dropped."""
+        if not self.accepting:
+            await _close(writer)
+            return
+
+        task = asyncio.current_task()
+        if task is not None:
+            self.active_handlers.add(task)
+        self.connections.add(writer)
+        self.connection_count += 1
+        self._connected.set()
+        try:
+            await self._send(writer, [self.welcome])
+            await self._send(writer, self._initial_messages())
+            while message_bytes := await reader.readline():
+                message = message_bytes.decode(self.ENCODING).strip()
+                self.received_messages.append(message)
+                if message == POWER_OFF_LINE:
+                    await self._send(writer, self._acked(["OK"]))
+                    self._stop_listening()
+                    break
+                if message == "bye":
+                    break
+                await self._send(writer, self._acked(self._handle_message(message)))
+        except (asyncio.CancelledError, OSError):
+            pass
+        finally:
+            self.connections.discard(writer)
+            if task is not None:
+                self.active_handlers.discard(task)
+            await _close(writer)
+
+    def _initial_messages(self) -> list[str]:
+        return [
+            "OK",
+            "SOURCES_CHANGED",
+            f"CURRENT_SOURCE_FORMAT_NAME {self.source_format}",
+            *self._state_lines(),
+            "LABELS_CLEAR",
+            *(f"LABEL {index}: {name}" for index, name in sorted(self.presets.items())),
+            "PROFILES_CLEAR",
+            *(
+                f"PROFILE {index}: {name}"
+                for index, name in sorted(self.sources.items())
+            ),
+            "SRATE 48000",
+            "AUDIOSYNC Slave",
+            f"CURRENT_PROFILE {self.current_source_index}",
+            f"CURRENT_PRESET {self.current_preset_index}",
+            f"UPMIXER {self.upmixer}",
+        ]
+
+    def _state_lines(self) -> list[str]:
+        return [
+            f"VOLUME {self.volume}",
+            f"BYPASS {int(self.bypass)}",
+            f"DIM {int(self.dim)}",
+            f"MUTE {int(self.mute)}",
+        ]
+
+    def _handle_state_message(self, message: str) -> list[str] | None:
+        if message in {"get_current_state", "send volume"}:
+            return self._state_lines()
+        if message == "upmixer":
+            return [f"UPMIXER {self.upmixer}"]
+        if match := _TOGGLE.match(message):
+            name, value = match.group(1), int(match.group(2))
+            state = not getattr(self, name) if value == 2 else bool(value)
+            setattr(self, name, state)
+            return ["OK", f"{name.upper()} {int(state)}"]
+        if match := _UPMIXER.match(message):
+            self.upmixer = match.group(1)
+            return ["OK", f"UPMIXER {self.upmixer}"]
+        if match := _REMAPPING.match(message):
+            return ["OK", f"REMAPPING_MODE {match.group(1)}"]
+        if match := _VOLUME_RAMP.match(message):
+            self.volume = float(match.group(1))
+            return ["OK", f"VOLUME {self.volume}"]
+        if _ACCEPTED.match(message):
+            return ["OK"]
+        return super()._handle_state_message(message)
+
+    def _acked(self, responses: list[str]) -> list[str]:
+        if self.ack_commands:
+            return responses
+        return [response for response in responses if response != "OK"]
+
+    def _response_delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+
+    async def _send(self, writer: asyncio.StreamWriter, lines: Iterable[str]) -> None:
+        payload = "".join(f"{line}\n" for line in lines)
+        if not payload:
+            return
+        if delay := self._response_delay():
+            await asyncio.sleep(delay)
+        writer.write(payload.encode(self.ENCODING))
+        await writer.drain()
+        self.messages_sent += payload.count("\n")
+
+    async def wait_for_connection(self, timeout: float = 5.0) -> None:
+        """Wait until a client has connected since the last drop."""
+        async with asyncio.timeout(timeout):
+            await self._connected.wait()
+
+    async def push(self, *lines: str) -> None:
+        """Send unsolicited messages to every connected client at once."""
+        payload = "".join(f"{line}\n" for line in lines).encode(self.ENCODING)
+        for writer in tuple(self.connections):
+            with contextlib.suppress(OSError):
+                writer.write(payload)
+                await writer.drain()
+                self.messages_sent += len(lines)
+
+    async def burst(
+        self, lines: Iterable[str], *, repeat: int = 1, interval: float = 0.0
+    ) -> None:
+        """Push ``lines`` ``repeat`` times, ``interval`` seconds apart."""
+        lines = list(lines)
+        for count in range(repeat):
+            if count and interval:
+                await asyncio.sleep(interval)
+            await self.push(*lines)
+
+    async def volume_sweep(self, start: float, stop: float, step: float) -> None:
+        """Push a volume ramp from ``start`` to ``stop`` as the device would."""
+        levels = [
+            round(start + step * index, 1)
+            for index in range(int(abs(stop - start) / abs(step)) + 1)
+        ]
+        self.volume = levels[-1]
+        await self.push(*(f"VOLUME {level}" for level in levels))
+
+    async def resync(self) -> None:
+        """Resend the full catalog and state, as after a configuration change."""
+        await self.push(*self._initial_messages())
+
+    async def disconnect(self) -> None:
+        """Drop every connection, as a network interruption would."""
+        self._connected.clear()
+        for writer in tuple(self.connections):
+            writer.transport.abort()
+        self.connections.clear()
+
+    async def power_off(self) -> None:
+        """Stop listening and drop every connection until ``power_on``."""
+        self._stop_listening()
+        await self.disconnect()
+
+    def _stop_listening(self) -> None:
+        self.accepting = False
+        if self.server is not None:
+            self.server.close()
+
+    async def power_on(self) -> None:
+        """Listen again on the same port, as a woken processor does."""
+        self.accepting = True
+        if self.server is None or not self.server.is_serving():
+            await self.start_server()
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    with contextlib.suppress(OSError):
+        await writer.wait_closed()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    simulator = AltitudeSimulator(
+        args.host, args.port, latency=args.latency, jitter=args.jitter
+    )
+    async with simulator:
+        print(f"Simulated Trinnov Altitude listening on {args.host}:{simulator.port}")
+        await asyncio.Event().wait()
+
+
+def main() -> None:
+    """Serve a simulated processor until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument(
+        "--port", type=int, default=MockTrinnovAltitudeServer.DEFAULT_PORT
+    )
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Tests for the Trinnov Altitude warm-start cache."""
+
+from dataclasses import replace
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from trinnov_altitude.adapter import AltitudeSnapshot, snapshot_from_state
+from trinnov_altitude.state import AltitudeState
+
+from custom_components.trinnov_altitude.cache import (
+    SAVE_DELAY_SECONDS,
+    STORAGE_VERSION,
+    CachedState,
+    TrinnovAltitudeStateCache,
+)
+from custom_components.trinnov_altitude.const import DOMAIN
+
+STORAGE_KEY = f"{DOMAIN}.ABC123"
+CACHED_DATA = {
+    "sources": [[0, "Kaleidescape"], [1, "Apple TV"]],
+    "presets": [[0, "Built-in"], [1, "Movies"]],
+    "version": "4.2.9",
+    "source": "Apple TV",
+    "current_source_index": 1,
+    "preset": "Movies",
+    "current_preset_index": 1,
+    "upmixer": "dolby",
+}
+
+
+def _synced_snapshot() -> AltitudeSnapshot:
+    return replace(
+        snapshot_from_state(AltitudeState()),
+        synced=True,
+        sources=((0, "Kaleidescape"), (1, "Apple TV")),
+        presets=((0, "Built-in"), (1, "Movies")),
+        version="4.2.9",
+    )
+
+
+def test_cached_state_fills_only_missing_fields() -> None:
+    """Live values should win over cached ones as they arrive."""
+    cached = CachedState.from_dict(CACHED_DATA)
+    state = AltitudeState()
+    state.volume = -30.0
+    state.presets = {0: "Live preset"}
+
+    filled = cached.fill(snapshot_from_state(state))
+
+    assert filled.sources == ((0, "Kaleidescape"), (1, "Apple TV"))
+    assert filled.presets == ((0, "Live preset"),)
+    assert filled.source == "Apple TV"
+    assert filled.upmixer == "dolby"
+    assert filled.volume == -30.0
+
+
+def test_cached_state_round_trips_and_ignores_malformed_catalogs() -> None:
+    """Stored catalogs should round trip and skip malformed entries."""
+    cached = CachedState.from_dict(CACHED_DATA)
+    assert CachedState.from_dict(cached.as_dict()) == cached
+
+    malformed = CachedState.from_dict({"sources": [[0, "A"], ["x", "B"], 3]})
+    assert malformed.sources == ((0, "A"),)
+    assert CachedState.from_dict({"presets": "bad"}).presets == ()
+    assert CachedState().fill(snapshot_from_state(AltitudeState())).sources == ()
+
+
+async def test_cache_loads_stored_state(hass: HomeAssistant, hass_storage) -> None:
+    """The cache should restore the last saved catalog."""
+    hass_storage[STORAGE_KEY] = {
+        "version": STORAGE_VERSION,
+        "key": STORAGE_KEY,
+        "data": CACHED_DATA,
+    }
+    cache = TrinnovAltitudeStateCache(hass, "ABC123")
+
+    state = await cache.async_load()
+
+    assert state is not None
+    assert state.presets == ((0, "Built-in"), (1, "Movies"))
+    assert cache.state == state
+
+
+async def test_cache_debounces_saves_of_synced_snapshots(
+    hass: HomeAssistant, hass_storage
+) -> None:
+    """Synced snapshots should be written once after the save delay."""
+    cache = TrinnovAltitudeStateCache(hass, "ABC123")
+    assert await cache.async_load() is None
+
+    unsynced = AltitudeState()
+    unsynced.sources = {0: "Ignored"}
+    cache.async_update(snapshot_from_state(unsynced))
+    assert cache.state is None
+
+    snapshot = _synced_snapshot()
+    cache.async_update(snapshot)
+    cache.async_update(snapshot)
+    await hass.async_block_till_done()
+    assert STORAGE_KEY not in hass_storage
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SAVE_DELAY_SECONDS + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert hass_storage[STORAGE_KEY]["data"]["sources"] == [
+        [0, "Kaleidescape"],
+        [1, "Apple TV"],
+    ]
+
+    await cache.async_remove()
+    assert cache.state is None
@@ -0,0 +1,170 @@
+"""Tests for Trinnov Altitude protocol captures."""
+
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from trinnov_altitude.lifecycle import AltitudeRuntimeState, PowerState, SyncState
+from trinnov_altitude.protocol import IdentsMessage, VolumeMessage
+
+from custom_components.trinnov_altitude import capture as capture_module
+from custom_components.trinnov_altitude.capture import (
+    CaptureRecord,
+    ProtocolCapture,
+    decode_record,
+    encode_record,
+    read_capture,
+)
+from custom_components.trinnov_altitude.const import (
+    DOMAIN,
+    SERVICE_START_CAPTURE,
+    SERVICE_STOP_CAPTURE,
+)
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        CaptureRecord(0.5, "received_message", message=VolumeMessage(volume=-30.5)),
+        CaptureRecord(
+            1.0, "received_message", message=IdentsMessage(features=("a", "b"))
+        ),
+        CaptureRecord(
+            1.5,
+            "runtime_changed",
+            runtime={"power": PowerState.WAKING, "sync": SyncState.SYNCING},
+        ),
+        CaptureRecord(2.0, "disconnected"),
+    ],
+)
+def test_record_round_trip(record: CaptureRecord) -> None:
+    """Records should survive encoding as one compact line."""
+    line = encode_record(record)
+
+    assert "\n" not in line
+    assert decode_record(line) == record
+
+
+async def test_capture_buffers_and_flushes(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Records should reach the file on the timer, the threshold and close."""
+    path = tmp_path / "captures" / "session.jsonl"
+    capture = ProtocolCapture(hass, path, "ABC123")
+    await capture.async_open()
+    runtime = AltitudeRuntimeState(power=PowerState.WAKING)
+
+    capture.record("received_message", VolumeMessage(volume=-40.0), runtime)
+    capture.record("runtime_changed", None, runtime)
+    # Only timestamps changed; the lifecycle did not.
+    capture.record(
+        "runtime_changed", None, runtime.with_changes(last_message_at=dt_util.utcnow())
+    )
+    assert capture.records == 2
+    assert len(path.read_text().splitlines()) == 1
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(path.read_text().splitlines()) == 3
+
+    with patch.object(capture_module, "MAX_BUFFERED_RECORDS", 2):
+        capture.record("connected", None, runtime)
+        capture.record("disconnected", None, runtime)
+        await hass.async_block_till_done(wait_background_tasks=True)
+    assert len(path.read_text().splitlines()) == 5
+
+    capture.record("connected", None, runtime)
+    await capture.async_close()
+
+    header, records = read_capture(path)
+    assert header["device_id"] == "ABC123"
+    assert [record.event for record in records] == [
+        "received_message",
+        "runtime_changed",
+        "connected",
+        "disconnected",
+        "connected",
+    ]
+    assert records[1].runtime is not None
+    assert records[1].runtime["power"] is PowerState.WAKING
+    assert records[0].offset <= records[-1].offset
+
+
+def test_read_capture_rejects_unknown_version(tmp_path: Path) -> None:
+    """Captures from an unknown format version should not be misread."""
+    path = tmp_path / "old.jsonl"
+    path.write_text('{"version": 0}\n')
+
+    with pytest.raises(ValueError, match="Unsupported capture version"):
+        read_capture(path)
+
+
+async def test_capture_services(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry, tmp_path: Path
+) -> None:
+    """Capture actions should record client events to the capture directory."""
+    hass.config.config_dir = str(tmp_path)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+
+    with pytest.raises(HomeAssistantError, match="not capturing"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_CAPTURE, {}, blocking=True, return_response=True
+        )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_START_CAPTURE,
+        {"filename": "glitch.jsonl"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "path": str(tmp_path / "trinnov_altitude" / "captures" / "glitch.jsonl")
+    }
+    with pytest.raises(HomeAssistantError, match="already capturing"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_CAPTURE, {}, blocking=True, return_response=True
+        )
+
+    coordinator._handle_client_event("received_message", VolumeMessage(volume=-20.0))
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_STOP_CAPTURE, {}, blocking=True, return_response=True
+    )
+
+    assert response is not None
+    assert response["records"] == 1
+    _header, records = read_capture(Path(str(response["path"])))
+    assert records[0].message == VolumeMessage(volume=-20.0)
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_START_CAPTURE, {}, blocking=True, return_response=True
+    )
+    assert response is not None
+    assert Path(str(response["path"])).name.startswith("ABC123-")
+    # Unloading the entry closes a capture still running.
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    assert coordinator.capture is None
+
+
+async def test_capture_rejects_paths(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+) -> None:
+    """Capture file names must not escape the capture directory."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(Exception, match="filename"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_START_CAPTURE,
+            {"filename": "../secrets.yaml"},
+            blocking=True,
+            return_response=True,
+        )
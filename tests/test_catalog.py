@@ -0,0 +1,59 @@
+"""Tests for Trinnov Altitude catalog name lookup."""
+
+from custom_components.trinnov_altitude.catalog import (
+    CatalogIndex,
+    catalog_from_value,
+    normalize_name,
+)
+
+SOURCES = ((0, "Kaleidescape"), (1, "Apple TV"), (2, "Blu-ray  Player"))
+
+
+def test_normalize_name_folds_case_and_whitespace() -> None:
+    """Normalized names should ignore case and whitespace runs."""
+    assert normalize_name("  Blu-ray \t PLAYER ") == "blu-ray player"
+
+
+def test_lookup_tiers() -> None:
+    """Lookups should fall through exact, case-insensitive and whitespace tiers."""
+    index = CatalogIndex(SOURCES)
+
+    assert index.lookup("Apple TV") == 1
+    assert index.lookup("apple tv") == 1
+    assert index.lookup(" blu-ray player ") == 2
+    assert index.lookup("Aple TV") is None
+    assert index.lookup("Aple TV", fuzzy=True) == 1
+    assert index.lookup("Roku", fuzzy=True) is None
+
+
+def test_duplicate_names_keep_existing_resolution() -> None:
+    """Lookups should pick the lowest id and select options the highest.
+
+    Name lookups used to return the first match in catalog order, while the
+    select options were a dict built in catalog order, so later ids won.
+    """
+    index = CatalogIndex(((3, "HDMI"), (1, "hdmi"), (2, "HDMI")))
+
+    assert index.lookup("HDMI") == 2
+    assert index.lookup("Hdmi") == 1
+    assert index.names == {"hdmi": 1, "HDMI": 3}
+
+
+def test_name_for() -> None:
+    """Ids should map back to display names."""
+    index = CatalogIndex(SOURCES)
+
+    assert index.name_for(0) == "Kaleidescape"
+    assert index.name_for(9) is None
+
+
+def test_catalog_from_value_accepts_snapshots_and_mappings() -> None:
+    """Snapshot tuples and client mappings should give the same catalog."""
+    expected = ((0, "Kaleidescape"), (1, "Apple TV"))
+
+    assert catalog_from_value({1: "Apple TV", 0: "Kaleidescape"}) == expected
+    assert catalog_from_value(((1, "Apple TV"), [2, "TV"], (0, "Kaleidescape"))) == (
+        expected
+    )
+    assert catalog_from_value({"bad": "key", 3: 7}) == ((3, "7"),)
+    assert catalog_from_value(None) == ()
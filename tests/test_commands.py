@@ -1,13 +1,23 @@
 """Tests for Trinnov Altitude command service."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.exceptions import HomeAssistantError
 from trinnov_altitude.const import RemappingMode
-from trinnov_altitude.exceptions import CommandConvergenceTimeoutError
+from trinnov_altitude.exceptions import (
+    CommandConvergenceTimeoutError,
+    CommandRejectedError,
+    NotConnectedError,
+)
+from trinnov_altitude.lifecycle import PowerState
 
-from custom_components.trinnov_altitude.commands import TrinnovAltitudeCommands
+from custom_components.trinnov_altitude.catalog import CatalogIndex
+from custom_components.trinnov_altitude.commands import (
+    TrinnovAltitudeCommands,
+    describe_command_error,
+)
 
 
 def _mock_client() -> MagicMock:
@@ -67,6 +77,25 @@ async def test_invoke_with_ack_for_source_set_by_name() -> None:
     client.command.assert_not_called()
 
 
+def test_name_lookups_use_bound_catalog_indexes() -> None:
+    """Bound to the coordinator, lookups should not re-sort client catalogs."""
+    client = _mock_client()
+    commands = TrinnovAltitudeCommands(client)
+    indexes = {
+        "sources": CatalogIndex(((0, "Kaleidescape"), (1, "Apple TV"))),
+        "presets": CatalogIndex(((0, "Built-in"), (1, "Movies"))),
+    }
+    commands.use_catalogs(indexes.__getitem__)
+
+    with patch(
+        "custom_components.trinnov_altitude.commands.catalog_from_mapping"
+    ) as from_mapping:
+        assert commands.source_id("apple tv") == 1
+        assert commands.preset_id("Movies") == 1
+
+    from_mapping.assert_not_called()
+
+
 async def test_invoke_wraps_protocol_command_errors() -> None:
     """Protocol command failures should surface as Home Assistant errors."""
     client = _mock_client()
@@ -159,3 +188,444 @@ def test_build_line_upmixer_uses_raw_string_when_value_attr_missing() -> None:
     commands = TrinnovAltitudeCommands(client)
 
     assert commands._build_line("upmixer_set", ("dolby",)) == "upmixer dolby"
+
+
+async def test_invoke_coalesces_volume_to_latest_target() -> None:
+    """Volume targets requested while one is in flight should collapse to the newest."""
+    client = _mock_client()
+    release = asyncio.Event()
+    sent: list[float] = []
+
+    async def volume_set(db: float) -> None:
+        sent.append(db)
+        await release.wait()
+
+    client.volume_set = AsyncMock(side_effect=volume_set)
+    commands = TrinnovAltitudeCommands(client)
+
+    calls = [
+        asyncio.create_task(commands.invoke("volume_set", db)) for db in (-40, -35, -30)
+    ]
+    await asyncio.sleep(0)
+    assert sent == [-40]
+    assert commands.queue_depth == 1
+
+    release.set()
+    await asyncio.gather(*calls)
+
+    assert sent == [-40, -30]
+    assert commands.queue_depth == 0
+
+
+async def test_deferred_commands_flush_in_order_with_coalescing() -> None:
+    """Commands held during wake-up should run in order once released."""
+    client = _mock_client()
+    commands = TrinnovAltitudeCommands(client)
+    commands.defer_until_ready()
+
+    calls = [
+        asyncio.create_task(commands.invoke("mute_on")),
+        asyncio.create_task(commands.invoke("preset_set", 1)),
+        asyncio.create_task(commands.invoke("preset_set", 3)),
+    ]
+    await asyncio.sleep(0)
+    assert commands.deferring
+    assert commands.queue_depth == 2
+    client.mute_on.assert_not_called()
+
+    commands.release_deferred()
+    await asyncio.gather(*calls)
+
+    client.mute_on.assert_awaited_once()
+    client.preset_set.assert_awaited_once_with(3)
+    assert commands.queue_stats.deferred == 3
+    assert commands.queue_stats.coalesced == 1
+    assert not commands.deferring
+
+
+async def test_deferred_commands_fail_when_wake_deadline_passes() -> None:
+    """Held commands should be dropped, not sent, once the deadline passes."""
+    client = _mock_client()
+    commands = TrinnovAltitudeCommands(client)
+    commands.defer_until_ready(timeout=0.01)
+
+    with pytest.raises(HomeAssistantError, match="dropped mute_on"):
+        await commands.invoke("mute_on")
+    with pytest.raises(HomeAssistantError, match="did not finish waking"):
+        commands.defer_until_ready(timeout=0.01)
+        await commands.async_wait_until_ready()
+    await asyncio.sleep(0.02)
+
+    client.mute_on.assert_not_called()
+    assert commands.queue_stats.deferred_expired == 1
+    assert commands.queue_depth == 0
+    assert not commands.deferring
+
+    await commands.invoke("mute_on")
+    client.mute_on.assert_awaited_once()
+
+
+async def test_wake_deadline_rejects_every_held_command() -> None:
+    """The deadline should fail held commands rather than hand them the line."""
+    client = _mock_client()
+    commands = TrinnovAltitudeCommands(client)
+    commands.defer_until_ready(timeout=0.01)
+
+    calls = [
+        asyncio.create_task(commands.invoke(name, *args))
+        for name, args in (
+            ("mute_on", ()),
+            ("preset_set", (1,)),
+            ("volume_set", (-30,)),
+        )
+    ]
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    assert all(isinstance(result, HomeAssistantError) for result in results)
+    client.mute_on.assert_not_called()
+    client.preset_set.assert_not_called()
+    client.volume_set.assert_not_called()
+    assert commands.queue_stats.deferred_expired == 3
+    assert commands.queue_depth == 0
+    assert not commands.deferring
+
+
+async def test_wait_until_ready_returns_on_release() -> None:
+    """Readiness waiters should resume once the hold is released."""
+    commands = TrinnovAltitudeCommands(_mock_client())
+    await commands.async_wait_until_ready()
+
+    commands.defer_until_ready()
+    waiter = asyncio.create_task(commands.async_wait_until_ready())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    commands.release_deferred()
+    await waiter
+    commands.release_deferred()
+
+
+async def test_invoke_volume_surfaces_command_error() -> None:
+    """The caller that sends a volume target should receive its failure."""
+    client = _mock_client()
+    client.volume_set = AsyncMock(
+        side_effect=CommandConvergenceTimeoutError("volume -15.0 dB to be active", 5.0)
+    )
+    commands = TrinnovAltitudeCommands(client)
+
+    with pytest.raises(HomeAssistantError, match="volume -15.0"):
+        await commands.invoke("volume_set", -15.0)
+
+
+def _gated_client(release: asyncio.Event, sent: list[str]) -> MagicMock:
+    """Build a client whose commands record their order and block until released."""
+    client = _mock_client()
+
+    def recorder(name: str) -> AsyncMock:
+        async def run(*args: object) -> None:
+            sent.append(name if not args else f"{name} {args[0]}")
+            await release.wait()
+
+        return AsyncMock(side_effect=run)
+
+    for name in (
+        "volume_up",
+        "volume_set",
+        "mute_on",
+        "source_set",
+        "preset_set",
+        "dim_on",
+    ):
+        setattr(client, name, recorder(name))
+
+    async def command(line: str, **_kwargs: object) -> None:
+        sent.append(line)
+        await release.wait()
+
+    client.command = AsyncMock(side_effect=command)
+    return client
+
+
+async def test_invoke_runs_queued_commands_by_priority() -> None:
+    """Power and mute should jump ahead of queued normal and bulk commands."""
+    release = asyncio.Event()
+    sent: list[str] = []
+    commands = TrinnovAltitudeCommands(_gated_client(release, sent))
+
+    calls = [asyncio.create_task(commands.invoke("volume_up"))]
+    await asyncio.sleep(0)
+    calls += [
+        asyncio.create_task(commands.invoke("source_set", 1)),
+        asyncio.create_task(commands.invoke("dim_on")),
+        asyncio.create_task(commands.invoke("mute_on")),
+        asyncio.create_task(commands.invoke("power_off", require_ack=True)),
+    ]
+    await asyncio.sleep(0)
+    assert commands.queue_depth == 4
+
+    release.set()
+    await asyncio.gather(*calls)
+
+    assert sent == [
+        "volume_up",
+        "power_off_SECURED_FHZMCH48FE",
+        "mute_on",
+        "dim_on",
+        "source_set 1",
+    ]
+    assert commands.queue_depth == 0
+    stats = commands.queue_stats
+    assert stats.enqueued == 5
+    assert stats.executed == 5
+    assert stats.max_depth == 4
+    assert set(stats.last_wait) == {
+        "volume_up",
+        "source_set",
+        "dim_on",
+        "mute_on",
+        "power_off",
+    }
+    assert stats.average_wait >= 0
+
+
+async def test_invoke_coalesces_queued_setters() -> None:
+    """A queued source change should be replaced by a newer one."""
+    release = asyncio.Event()
+    sent: list[str] = []
+    commands = TrinnovAltitudeCommands(_gated_client(release, sent))
+
+    first = asyncio.create_task(commands.invoke("volume_up"))
+    await asyncio.sleep(0)
+    calls = [
+        asyncio.create_task(commands.invoke("source_set", 1)),
+        asyncio.create_task(commands.invoke("preset_set", 2)),
+        asyncio.create_task(commands.invoke("source_set_by_name", "Apple TV")),
+    ]
+    await asyncio.sleep(0)
+    assert commands.queue_depth == 2
+
+    release.set()
+    await asyncio.gather(first, *calls)
+
+    assert sent == ["volume_up", "source_set 1", "preset_set 2"]
+    assert commands.queue_stats.coalesced == 1
+
+
+async def test_invoke_rejects_commands_when_queue_is_full() -> None:
+    """Commands beyond the queue bound should fail instead of piling up."""
+    release = asyncio.Event()
+    sent: list[str] = []
+    commands = TrinnovAltitudeCommands(_gated_client(release, sent), max_queued=1)
+
+    running = asyncio.create_task(commands.invoke("volume_up"))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(commands.invoke("source_set", 1))
+    await asyncio.sleep(0)
+
+    with pytest.raises(HomeAssistantError, match="queue is full"):
+        await commands.invoke("mute_on")
+
+    # Replacing a queued setter reuses its slot, so it is still accepted.
+    replacement = asyncio.create_task(commands.invoke("source_set", 2))
+    release.set()
+    await asyncio.gather(running, queued, replacement)
+    assert commands.queue_stats.rejected == 1
+    assert sent == ["volume_up", "source_set 2"]
+
+
+async def test_invoke_cancelled_while_queued_releases_slot() -> None:
+    """A caller cancelled while waiting should not block later commands."""
+    release = asyncio.Event()
+    sent: list[str] = []
+    commands = TrinnovAltitudeCommands(_gated_client(release, sent))
+
+    running = asyncio.create_task(commands.invoke("volume_up"))
+    await asyncio.sleep(0)
+    queued = asyncio.create_task(commands.invoke("source_set", 1))
+    await asyncio.sleep(0)
+    queued.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await queued
+    assert commands.queue_depth == 0
+    assert not commands._coalescable
+
+    release.set()
+    await running
+    await commands.invoke("dim_on")
+    assert sent == ["volume_up", "dim_on"]
+
+
+async def test_invoke_cancelled_after_turn_granted_releases_line() -> None:
+    """A caller cancelled right after being granted the line should pass it on."""
+    release = asyncio.Event()
+    sent: list[str] = []
+    commands = TrinnovAltitudeCommands(_gated_client(release, sent))
+    grant_next = commands._grant_next
+    tasks: list[asyncio.Task[None]] = []
+
+    def grant_then_cancel() -> None:
+        grant_next()
+        if len(tasks) == 2 and not tasks[1].done():
+            tasks[1].cancel()
+
+    commands._grant_next = grant_then_cancel  # type: ignore[method-assign]
+    tasks.append(asyncio.create_task(commands.invoke("volume_up")))
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(commands.invoke("dim_on")))
+    await asyncio.sleep(0)
+
+    release.set()
+    await tasks[0]
+    with pytest.raises(asyncio.CancelledError):
+        await tasks[1]
+
+    await asyncio.wait_for(commands.invoke("mute_on"), 1.0)
+    assert sent == ["volume_up", "mute_on"]
+
+
+async def test_invoke_pipelined_sends_lines_before_acks_arrive() -> None:
+    """ACK commands in a batch should all be written before the first ACK."""
+    client = _mock_client()
+    acks: dict[str, asyncio.Future[None]] = {}
+    loop = asyncio.get_running_loop()
+
+    async def command(line: str, **_kwargs: object) -> None:
+        acks[line] = loop.create_future()
+        await acks[line]
+
+    client.command = AsyncMock(side_effect=command)
+    commands = TrinnovAltitudeCommands(client)
+
+    batch = asyncio.create_task(
+        commands.invoke_pipelined(
+            [("source_set", (1,)), ("preset_set", (2,)), ("upmixer_set", ("dolby",))]
+        )
+    )
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert list(acks) == ["profile 1", "loadp 2", "upmixer dolby"]
+
+    for future in acks.values():
+        future.set_result(None)
+    assert await batch == [None, None, None]
+    client.source_set.assert_not_called()
+    assert commands.queue_stats.executed == 1
+
+
+async def test_invoke_pipelined_reports_errors_per_command() -> None:
+    """Each pipelined command should get its own error or timeout."""
+    client = _mock_client()
+
+    async def command(line: str, **_kwargs: object) -> None:
+        if line == "loadp 2":
+            raise CommandRejectedError(line, "bad preset")
+        if line == "upmixer dolby":
+            raise TimeoutError
+
+    client.command = AsyncMock(side_effect=command)
+    client.dim_on = AsyncMock()
+    runtime = client.runtime
+    commands = TrinnovAltitudeCommands(client)
+
+    results = await commands.invoke_pipelined(
+        [
+            ("source_set", (1,)),
+            ("preset_set", (2,)),
+            ("upmixer_set", ("dolby",)),
+            ("source_set_by_name", ("Missing",)),
+            ("dim_on", ()),
+            ("power_off", ()),
+        ]
+    )
+
+    assert results[0] is None
+    assert isinstance(results[1], HomeAssistantError)
+    assert isinstance(results[2], TimeoutError)
+    assert isinstance(results[3], ValueError)
+    assert results[4] is None
+    assert results[5] is None
+    client.dim_on.assert_awaited_once()
+    runtime.with_changes.assert_called_once_with(power=PowerState.OFF)
+
+
+async def test_invoke_pipelined_runs_commands_without_lines_in_order() -> None:
+    """Commands without a raw line should split the pipeline and keep order."""
+    client = _mock_client()
+    order: list[str] = []
+
+    async def command(line: str, **_kwargs: object) -> None:
+        order.append(line)
+
+    async def volume_set(db: float) -> None:
+        order.append(f"volume {db}")
+
+    client.command = AsyncMock(side_effect=command)
+    client.volume_set = AsyncMock(side_effect=volume_set)
+    commands = TrinnovAltitudeCommands(client)
+
+    results = await commands.invoke_pipelined(
+        [("source_set", (1,)), ("volume_set", (-30.0,)), ("preset_set", (2,))]
+    )
+
+    assert results == [None, None, None]
+    assert order == ["profile 1", "volume -30.0", "loadp 2"]
+    assert await commands.invoke_pipelined([]) == []
+
+
+async def test_invoke_pipelined_reports_failed_fallback_command() -> None:
+    """A failing non-pipelined command should be reported, not raised."""
+    client = _mock_client()
+    client.volume_set = AsyncMock(
+        side_effect=CommandConvergenceTimeoutError("volume", 5.0)
+    )
+    commands = TrinnovAltitudeCommands(client)
+
+    results = await commands.invoke_pipelined([("volume_set", (-30.0,))])
+
+    assert isinstance(results[0], HomeAssistantError)
+
+
+def test_parse_command_lines_checks_argument_count() -> None:
+    """Argument counts should be checked against the client before sending."""
+
+    class Client:
+        async def volume_set(self, db: float) -> None:
+            """Set volume."""
+
+    commands = TrinnovAltitudeCommands(Client())  # type: ignore[arg-type]
+
+    assert commands.parse_command_lines(["volume_set -30"]) == [("volume_set", (-30,))]
+    with pytest.raises(HomeAssistantError, match="Invalid arguments"):
+        commands.parse_command_lines(["volume_set"])
+    with pytest.raises(HomeAssistantError, match="cannot be empty"):
+        commands.parse_command_lines(["volume_set -30", ""])
+
+
+def test_describe_command_error() -> None:
+    """Failed batch commands should get readable descriptions."""
+    assert "powered on" in describe_command_error(NotConnectedError())
+    assert describe_command_error(TimeoutError()) == (
+        "timed out waiting for acknowledgement"
+    )
+    assert describe_command_error(TypeError("x")) == "invalid arguments"
+    assert describe_command_error(RuntimeError()) == "RuntimeError"
+
+
+async def test_invoke_records_latency_per_method() -> None:
+    """Each execution path should record latency under its own stage."""
+    client = _mock_client()
+    client.source_set.side_effect = CommandConvergenceTimeoutError("source", 5.0)
+    commands = TrinnovAltitudeCommands(client)
+
+    await commands.invoke("power_off", require_ack=True)
+    await commands.invoke("preset_set", 3, require_ack=True)
+    await commands.invoke("mute_on")
+    with pytest.raises(HomeAssistantError):
+        await commands.invoke("source_set", 1, require_ack=True)
+
+    stats = commands.metrics.as_dict()
+    assert stats["power_off"]["latency"]["ack"]["count"] == 1
+    assert stats["preset_set"]["latency"]["converge"]["count"] == 1
+    assert stats["mute_on"]["latency"]["send"]["count"] == 1
+    assert stats["source_set"]["timeouts"] == 1
+    assert stats["source_set"]["latency"] == {}
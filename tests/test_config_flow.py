@@ -12,7 +12,11 @@ from trinnov_altitude.exceptions import (
     ConnectionTimeoutError,
 )
 
-from custom_components.trinnov_altitude.const import DOMAIN
+from custom_components.trinnov_altitude.const import (
+    CONF_BACKGROUND_STARTUP,
+    CONF_PUSH_COALESCE_WINDOW,
+    DOMAIN,
+)
 
 
 async def test_form_user_success(hass: HomeAssistant, mock_setup_entry):
@@ -301,9 +305,58 @@ async def test_options_flow_updates_mac(hass: HomeAssistant):
     updated_entry = hass.config_entries.async_get_entry(entry.entry_id)
     assert updated_entry is not None
     assert updated_entry.data[CONF_MAC] == "00:11:22:33:44:55"
+    assert updated_entry.options == {
+        CONF_BACKGROUND_STARTUP: False,
+        CONF_PUSH_COALESCE_WINDOW: 0.0,
+    }
     reload_entry.assert_called_once_with(entry.entry_id)
 
 
+async def test_options_flow_enables_background_startup(hass: HomeAssistant):
+    """Test options flow stores the background startup preference."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Trinnov Altitude (192.168.1.100)",
+        data={CONF_HOST: "192.168.1.100", CONF_MAC: None},
+        unique_id="ABC123",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.object(hass.config_entries, "async_schedule_reload"):
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={CONF_MAC: "", CONF_BACKGROUND_STARTUP: True},
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_BACKGROUND_STARTUP: True,
+        CONF_PUSH_COALESCE_WINDOW: 0.0,
+    }
+
+
+async def test_options_flow_stores_push_coalesce_window(hass: HomeAssistant):
+    """Test options flow stores the update coalescing window."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Trinnov Altitude (192.168.1.100)",
+        data={CONF_HOST: "192.168.1.100", CONF_MAC: None},
+        unique_id="ABC123",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.object(hass.config_entries, "async_schedule_reload"):
+        result = await hass.config_entries.options.async_init(entry.entry_id)
+        result = await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            user_input={CONF_MAC: "", CONF_PUSH_COALESCE_WINDOW: 0.05},
+        )
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_PUSH_COALESCE_WINDOW] == 0.05
+
+
 async def test_options_flow_rejects_invalid_mac(hass: HomeAssistant):
     """Test options flow validates manual MAC overrides."""
     entry = MockConfigEntry(
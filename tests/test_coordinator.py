@@ -2,10 +2,16 @@
 
 import asyncio
 import logging
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from trinnov_altitude.adapter import StateDelta, snapshot_from_state
 from trinnov_altitude.exceptions import ConnectionFailedError
 from trinnov_altitude.lifecycle import (
     AltitudeRuntimeState,
@@ -16,7 +22,10 @@ from trinnov_altitude.lifecycle import (
 )
 
 from custom_components.trinnov_altitude.commands import TrinnovAltitudeCommands
-from custom_components.trinnov_altitude.coordinator import TrinnovAltitudeCoordinator
+from custom_components.trinnov_altitude.coordinator import (
+    TrinnovAltitudeCoordinator,
+    delta_fields,
+)
 
 
 def _build_mock_client() -> MagicMock:
@@ -210,13 +219,12 @@ async def test_coordinator_retry_bootstrap_until_synced_success(
     client.start = AsyncMock(side_effect=start_side_effect)
     client.wait_synced = AsyncMock()
 
-    with patch(
-        "custom_components.trinnov_altitude.coordinator.asyncio.sleep", new=AsyncMock()
-    ):
+    with patch.object(coordinator.retry_scheduler, "async_wait", new=AsyncMock()):
         await coordinator._async_retry_bootstrap_until_synced(sync_timeout=5.0)
 
     assert attempts["count"] == 2
     client.wait_synced.assert_called_once_with(5.0)
+    assert coordinator.retry_scheduler.attempts == 0
 
 
 async def test_coordinator_retry_bootstrap_continues_until_synced(
@@ -241,9 +249,7 @@ async def test_coordinator_retry_bootstrap_continues_until_synced(
 
     client.wait_synced = AsyncMock(side_effect=wait_synced_side_effect)
 
-    with patch(
-        "custom_components.trinnov_altitude.coordinator.asyncio.sleep", new=AsyncMock()
-    ):
+    with patch.object(coordinator.retry_scheduler, "async_wait", new=AsyncMock()):
         await coordinator._async_retry_bootstrap_until_synced(sync_timeout=5.0)
 
     assert attempts["count"] == 2
@@ -266,6 +272,41 @@ async def test_coordinator_power_on_schedules_bootstrap_when_unsynced(
 
     client.power_on.assert_called_once()
     schedule.assert_called_once_with(5.0)
+    assert coordinator.retry_scheduler.waking
+    assert coordinator.commands.deferring
+    coordinator.commands.release_deferred()
+    assert not coordinator.commands.deferring
+
+
+async def test_coordinator_flushes_commands_held_during_wake(
+    hass: HomeAssistant,
+) -> None:
+    """Commands issued while waking should run once the coordinator sees sync."""
+    client = _build_mock_client()
+    client.state.synced = False
+    client.preset_set = AsyncMock()
+    commands = TrinnovAltitudeCommands(client)
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, commands, stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    with patch.object(coordinator, "_schedule_bootstrap_retry"):
+        await coordinator.async_power_on()
+    task = asyncio.create_task(commands.invoke("preset_set", 2))
+    await asyncio.sleep(0)
+    assert not task.done()
+    client.preset_set.assert_not_called()
+
+    client.state.synced = True
+    callback = client.register_adapter_callback.call_args[0][1]
+    callback(None, [StateDelta(field="synced", old=False, new=True)], [])
+    await task
+
+    client.preset_set.assert_awaited_once_with(2)
+    assert not commands.deferring
+    assert commands.queue_stats.deferred == 1
+    await coordinator.async_shutdown()
 
 
 async def test_coordinator_retry_bootstrap_handles_cancelled_sleep(
@@ -280,8 +321,505 @@ async def test_coordinator_retry_bootstrap_handles_cancelled_sleep(
     )
     coordinator._running = True
 
-    with patch(
-        "custom_components.trinnov_altitude.coordinator.asyncio.sleep",
+    with patch.object(
+        coordinator.retry_scheduler,
+        "async_wait",
         new=AsyncMock(side_effect=asyncio.CancelledError),
     ):
         await coordinator._async_retry_bootstrap_until_synced(sync_timeout=5.0)
+
+
+async def test_coordinator_coalesces_event_bursts_into_one_publish(
+    hass: HomeAssistant,
+) -> None:
+    """Bursts of adapter and client events should publish a single snapshot."""
+    client = _build_mock_client()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+    adapter_callback = client.register_adapter_callback.call_args[0][1]
+    client_callback = client.register_callback.call_args[0][0]
+
+    for volume in range(20):
+        client.state.volume = -40.0 + volume
+        adapter_callback(None, [], [])
+    client_callback("runtime_changed", None)
+    await hass.async_block_till_done()
+
+    listener.assert_called_once()
+    assert coordinator.data is not None
+    assert coordinator.data.volume == -21.0
+    assert coordinator.push_stats.events_received == 21
+    assert coordinator.push_stats.snapshots_published == 1
+    assert coordinator.push_stats.events_coalesced == 20
+
+
+async def test_coordinator_coalesce_window_folds_late_events(
+    hass: HomeAssistant,
+) -> None:
+    """A configured window should fold events arriving after the first tick."""
+    client = _build_mock_client()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass,
+        client,
+        TrinnovAltitudeCommands(client),
+        stable_device_id="ABC123",
+        push_coalesce_window=0.01,
+    )
+    await coordinator.async_start()
+
+    callback = client.register_adapter_callback.call_args[0][1]
+    callback(None, [], [])
+    await asyncio.sleep(0)
+    client.state.source = "Apple TV"
+    callback(None, [], [])
+    await hass.async_block_till_done()
+
+    assert coordinator.data is not None
+    assert coordinator.data.source == "Apple TV"
+    assert coordinator.push_stats.events_received == 2
+    assert coordinator.push_stats.snapshots_published == 1
+
+
+async def test_coordinator_routes_deltas_to_matching_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Adapter deltas should wake only listeners that read the changed fields."""
+    client = _build_mock_client()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    volume_listener = MagicMock()
+    power_listener = MagicMock()
+    catch_all_listener = MagicMock()
+    coordinator.async_add_listener(volume_listener, frozenset({"volume"}))
+    coordinator.async_add_listener(power_listener, frozenset({"runtime.power"}))
+    coordinator.async_add_listener(catch_all_listener)
+
+    callback = client.register_adapter_callback.call_args[0][1]
+    client.state.volume = -30.0
+    callback(None, [StateDelta(field="volume", old=-40.0, new=-30.0)], [])
+    await hass.async_block_till_done()
+
+    volume_listener.assert_called_once()
+    power_listener.assert_not_called()
+    catch_all_listener.assert_called_once()
+    assert coordinator.push_stats.listener_updates_skipped == 1
+
+
+async def test_coordinator_routes_runtime_subfields(hass: HomeAssistant) -> None:
+    """Runtime deltas route by subfield so message timestamps wake nobody."""
+    client = _build_mock_client()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    power_listener = MagicMock()
+    coordinator.async_add_listener(power_listener, frozenset({"runtime.power"}))
+    callback = client.register_adapter_callback.call_args[0][1]
+
+    old_runtime = client.runtime
+    client.runtime = old_runtime.with_changes(last_message_at=datetime.now(UTC))
+    callback(None, [StateDelta("runtime", old_runtime, client.runtime)], [])
+    await hass.async_block_till_done()
+    power_listener.assert_not_called()
+
+    old_runtime = client.runtime
+    client.runtime = old_runtime.with_changes(power=PowerState.OFF)
+    callback(None, [StateDelta("runtime", old_runtime, client.runtime)], [])
+    await hass.async_block_till_done()
+    power_listener.assert_called_once()
+
+
+async def test_coordinator_diffs_snapshots_for_lifecycle_events(
+    hass: HomeAssistant,
+) -> None:
+    """Events without deltas should route by diffing the published snapshot."""
+    client = _build_mock_client()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    source_listener = MagicMock()
+    volume_listener = MagicMock()
+    coordinator.async_add_listener(source_listener, frozenset({"source"}))
+    coordinator.async_add_listener(volume_listener, frozenset({"volume"}))
+
+    client.state.source = "Apple TV"
+    client.register_callback.call_args[0][0]("runtime_changed", None)
+    await hass.async_block_till_done()
+
+    source_listener.assert_called_once()
+    volume_listener.assert_not_called()
+
+
+def test_delta_fields_expands_unknown_runtime_values() -> None:
+    """Runtime deltas without a previous runtime should mark every subfield."""
+    changed = delta_fields([StateDelta("runtime", None, AltitudeRuntimeState())])
+
+    assert "runtime.power" in changed
+    assert "runtime.transport" in changed
+
+
+async def test_coordinator_memoizes_snapshot_until_state_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Snapshot reads should reuse one build until the adapter reports a change."""
+    client = _build_mock_client()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+    callback = client.register_adapter_callback.call_args[0][1]
+
+    with patch(
+        "custom_components.trinnov_altitude.coordinator.snapshot_from_state",
+        wraps=snapshot_from_state,
+    ) as build:
+        first = coordinator.snapshot
+        assert coordinator.power_status is PowerState.READY
+        assert coordinator.snapshot is first
+        build.assert_not_called()
+
+        client.state.volume = -20.0
+        callback(None, [StateDelta(field="volume", old=-40.0, new=-20.0)], [])
+        await hass.async_block_till_done()
+
+        second = coordinator.snapshot
+        assert coordinator.snapshot is second
+        assert coordinator.data is second
+        build.assert_called_once()
+
+    assert second.volume == -20.0
+    assert second.snapshot_version == first.snapshot_version + 1
+    assert coordinator.snapshot_version == second.snapshot_version
+
+
+async def test_coordinator_publish_snapshot_rebuilds_from_client_state(
+    hass: HomeAssistant,
+) -> None:
+    """Explicit publishes should pick up state mutated outside adapter events."""
+    client = _build_mock_client()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+    version = coordinator.snapshot_version
+
+    client.runtime = client.runtime.with_changes(power=PowerState.OFF)
+    assert coordinator.power_status is PowerState.READY
+
+    coordinator.async_publish_snapshot()
+
+    assert coordinator.power_status is PowerState.OFF
+    assert coordinator.data is not None
+    assert coordinator.data.snapshot_version == version + 1
+
+
+async def test_coordinator_catalog_index_rebuilt_only_on_catalog_change(
+    hass: HomeAssistant,
+) -> None:
+    """Catalog indexes should survive snapshot versions that keep the catalog."""
+    client = _build_mock_client()
+    commands = TrinnovAltitudeCommands(client)
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, commands, stable_device_id="ABC123"
+    )
+
+    sources = coordinator.catalog_index("sources")
+    assert sources.name_for(1) == "Apple TV"
+    assert coordinator.catalog_index("sources") is sources
+
+    client.state.volume = -30.0
+    coordinator.invalidate_snapshot()
+    assert coordinator.catalog_index("sources") is sources
+    assert commands.source_id("apple tv") == 1
+
+    client.state.sources = {0: "Kaleidescape", 1: "Apple TV", 2: "Roku"}
+    coordinator.invalidate_snapshot()
+    rebuilt = coordinator.catalog_index("sources")
+    assert rebuilt is not sources
+    assert rebuilt.name_for(2) == "Roku"
+
+
+async def test_coordinator_optimistic_publish_keeps_queued_diff(
+    hass: HomeAssistant,
+) -> None:
+    """An optimistic publish during the coalesce window must not eat a diff."""
+    client = _build_mock_client()
+    client.volume_set = AsyncMock()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass,
+        client,
+        TrinnovAltitudeCommands(client),
+        stable_device_id="ABC123",
+        push_coalesce_window=0.01,
+    )
+    await coordinator.async_start()
+    power_listener = MagicMock()
+    coordinator.async_add_listener(power_listener, frozenset({"runtime.power"}))
+
+    client.runtime = client.runtime.with_changes(power=PowerState.OFF)
+    client.register_callback.call_args[0][0]("runtime_changed", None)
+    await asyncio.sleep(0)
+    await coordinator.async_set_volume(-30.0)
+    power_listener.assert_not_called()
+    await hass.async_block_till_done()
+
+    power_listener.assert_called_once()
+    assert coordinator.data.runtime.power is PowerState.OFF
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_publishes_power_off_from_pipelined_batch(
+    hass: HomeAssistant,
+) -> None:
+    """Powering off inside a batch should publish the off state at once."""
+    client = _build_mock_client()
+    client.command = AsyncMock()
+    commands = TrinnovAltitudeCommands(client)
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, commands, stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+    power_listener = MagicMock()
+    coordinator.async_add_listener(power_listener, frozenset({"runtime.power"}))
+
+    results = await commands.invoke_pipelined([("preset_set", (1,)), ("power_off", ())])
+
+    assert results == [None, None]
+    power_listener.assert_called_once()
+    assert coordinator.data.runtime.power is PowerState.OFF
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_volume_target_until_device_confirms(
+    hass: HomeAssistant,
+) -> None:
+    """The requested volume should be shown until the device reports it."""
+    client = _build_mock_client()
+    client.volume_set = AsyncMock()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+    volume_listener = MagicMock()
+    coordinator.async_add_listener(volume_listener, frozenset({"volume"}))
+
+    await coordinator.async_set_volume(-30.0)
+
+    client.volume_set.assert_awaited_once_with(-30.0)
+    assert coordinator.optimistic.fields == {"volume"}
+    assert coordinator.data.volume == -30.0
+    volume_listener.assert_called_once()
+
+    callback = client.register_adapter_callback.call_args[0][1]
+    client.state.volume = -30.0
+    callback(None, [StateDelta(field="volume", old=-40.0, new=-30.0)], [])
+    await hass.async_block_till_done()
+
+    assert not coordinator.optimistic
+    assert coordinator.data.volume == -30.0
+    stats = coordinator.optimistic.stats
+    assert stats.confirmed == 1
+    assert stats.last_latency["volume_set"] >= 0.0
+    assert stats.average_latency == stats.total_latency
+
+
+async def test_coordinator_volume_target_expires_without_confirmation(
+    hass: HomeAssistant,
+) -> None:
+    """An unconfirmed volume target should fall back to the reported volume."""
+    client = _build_mock_client()
+    client.volume_set = AsyncMock()
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    await coordinator.async_set_volume(-30.0)
+    assert coordinator.data.volume == -30.0
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow()
+        + timedelta(seconds=coordinator._OPTIMISTIC_TIMEOUT_SECONDS + 1),
+    )
+    await hass.async_block_till_done()
+
+    assert not coordinator.optimistic
+    assert coordinator.data.volume == -40.0
+    assert coordinator.optimistic.stats.expired == 1
+
+
+async def test_coordinator_volume_target_rolls_back_on_error(
+    hass: HomeAssistant,
+) -> None:
+    """A failed volume command should drop the optimistic target."""
+    client = _build_mock_client()
+    client.volume_set = AsyncMock(side_effect=RuntimeError("boom"))
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+    volume_listener = MagicMock()
+    coordinator.async_add_listener(volume_listener, frozenset({"volume"}))
+
+    with pytest.raises(RuntimeError):
+        await coordinator.async_set_volume(-30.0)
+
+    assert not coordinator.optimistic
+    assert coordinator.data.volume == -40.0
+    assert coordinator.optimistic.stats.rolled_back == 1
+    assert volume_listener.call_count == 2
+
+
+async def test_coordinator_optimistic_value_replaced_by_newer_command(
+    hass: HomeAssistant,
+) -> None:
+    """Only the latest intended value should confirm, expire or roll back."""
+    client = _build_mock_client()
+    client.volume_set = AsyncMock(side_effect=[None, RuntimeError("boom")])
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    await coordinator.async_set_volume(-30.0)
+    assert coordinator.data.volume == -30.0
+
+    with pytest.raises(RuntimeError):
+        await coordinator.async_set_volume(-20.0)
+    assert not coordinator.optimistic
+    assert coordinator.data.volume == -40.0
+    assert coordinator.optimistic.stats.issued == 2
+    assert coordinator.optimistic.stats.rolled_back == 1
+
+    # The expiry armed for the replaced value must not touch later state.
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow()
+        + timedelta(seconds=coordinator._OPTIMISTIC_TIMEOUT_SECONDS + 1),
+    )
+    await hass.async_block_till_done()
+    assert coordinator.optimistic.stats.expired == 0
+
+
+async def test_coordinator_power_on_is_single_flight(hass: HomeAssistant) -> None:
+    """Concurrent power-on callers should share one wake and its readiness."""
+    client = _build_mock_client()
+    client.state.synced = False
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    with patch.object(coordinator, "_schedule_bootstrap_retry") as schedule:
+        waiters = [
+            asyncio.create_task(coordinator.async_power_on_and_wait(timeout=5))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0)
+        await coordinator.async_power_on()
+
+    client.power_on.assert_called_once()
+    schedule.assert_called_once()
+    assert coordinator.power_stats.requests == 3
+    assert coordinator.power_stats.deduplicated == 2
+    assert not any(waiter.done() for waiter in waiters)
+
+    client.state.synced = True
+    callback = client.register_adapter_callback.call_args[0][1]
+    callback(None, [StateDelta(field="synced", old=False, new=True)], [])
+    times = await asyncio.gather(*waiters)
+
+    assert all(time_to_ready >= 0.0 for time_to_ready in times)
+    assert coordinator.power_stats.completed == 1
+    assert coordinator.power_stats.last_time_to_ready is not None
+
+    # A finished wake does not swallow the next request.
+    await coordinator.async_power_on()
+    assert client.power_on.call_count == 2
+    assert coordinator.power_stats.wakes == 2
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_power_on_and_wait_times_out(hass: HomeAssistant) -> None:
+    """Waiting callers should get a clear error when the device never syncs."""
+    client = _build_mock_client()
+    client.state.synced = False
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+
+    with (
+        patch.object(coordinator, "_schedule_bootstrap_retry"),
+        pytest.raises(HomeAssistantError, match="did not become ready within 0.01"),
+    ):
+        await coordinator.async_power_on_and_wait(timeout=0.01)
+
+    await coordinator.async_shutdown()
+
+
+async def test_coordinator_records_bootstrap_timeline_for_wake(
+    hass: HomeAssistant,
+) -> None:
+    """A wake should record each bootstrap phase and publish its durations."""
+    client = _build_mock_client()
+    client.state.synced = False
+    coordinator = TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+    await coordinator.async_start()
+    # The startup bootstrap never synced, so it is still in flight.
+    assert coordinator.bootstrap_timeline.current is not None
+    assert coordinator.bootstrap_timeline.current.trigger == "startup"
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, frozenset({"time_to_ready"}))
+
+    with patch.object(coordinator, "_schedule_bootstrap_retry"):
+        await coordinator.async_power_on()
+    timeline = coordinator.bootstrap_timeline.current
+    assert timeline is not None
+    assert timeline.trigger == "wake"
+    assert timeline.wol_sent is not None
+
+    client_event = client.register_callback.call_args[0][0]
+    adapter_update = client.register_adapter_callback.call_args[0][1]
+    client_event("connected", None)
+    adapter_update(
+        None,
+        [
+            StateDelta(field="id", old=None, new="ABC123"),
+            StateDelta(field="sources", old=(), new=((0, "Kaleidescape"),)),
+            StateDelta(field="presets", old=(), new=()),
+        ],
+        [],
+    )
+    await hass.async_block_till_done()
+    assert timeline.connected is not None
+    assert timeline.device_id is not None
+    assert timeline.sources is not None
+    assert timeline.presets is None
+    listener.reset_mock()
+
+    client.state.synced = True
+    adapter_update(None, [StateDelta(field="synced", old=False, new=True)], [])
+    await hass.async_block_till_done()
+
+    assert coordinator.bootstrap_timeline.current is None
+    assert coordinator.bootstrap_timeline.last is timeline
+    assert timeline.synced is not None
+    assert coordinator.data.time_to_ready == timeline.time_to_ready
+    assert coordinator.data.connect_duration is None
+    listener.assert_called_once()
+    await coordinator.async_shutdown()
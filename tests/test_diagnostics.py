@@ -0,0 +1,67 @@
+"""Test Trinnov Altitude diagnostics."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_dumps
+from homeassistant.util import dt as dt_util
+from trinnov_altitude.adapter import AdapterEvent
+from trinnov_altitude.lifecycle import ConnectionErrorInfo, ConnectionErrorKind
+from trinnov_altitude.protocol import VolumeMessage
+
+from custom_components.trinnov_altitude.const import DOMAIN
+from custom_components.trinnov_altitude.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+
+async def test_config_entry_diagnostics(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+) -> None:
+    """Diagnostics should include counters and the trace, with secrets redacted."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+    coordinator._handle_client_event("received_message", VolumeMessage(volume=-30.0))
+    coordinator._handle_adapter_update(
+        None, [], [AdapterEvent(kind="volume_changed", payload={})]
+    )
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    assert diagnostics["entry"]["data"]["host"] == "**REDACTED**"
+    assert diagnostics["entry"]["data"]["mac"] == "**REDACTED**"
+    assert diagnostics["snapshot"]["id"] == "ABC123"
+    assert diagnostics["coordinator"]["push"]["events_received"] >= 1
+    assert "average_wait" in diagnostics["commands"]["queue"]
+    assert diagnostics["retry_scheduler"]["attempts"] == 0
+    entries = diagnostics["trace"]["entries"]
+    assert [entry["event"] for entry in entries] == ["received_message", "adapter"]
+    assert entries[0]["payload"] == {"type": "VolumeMessage", "volume": -30.0}
+    assert entries[0]["age"] >= entries[1]["age"] >= 0.0
+    assert "192.168.1.100" not in json_dumps(diagnostics)
+
+
+async def test_diagnostics_redact_connection_error_text(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+) -> None:
+    """The socket error text names the host, so only its kind is kept."""
+    mock_device = mock_setup_entry.return_value
+    mock_device.runtime = mock_device.runtime.with_changes(
+        last_error=ConnectionErrorInfo(
+            kind=ConnectionErrorKind.CONNECTION_FAILED,
+            message="[Errno 111] Connect call failed ('192.168.1.100', 44100)",
+            at=dt_util.utcnow(),
+        )
+    )
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, mock_config_entry)
+
+    last_error = diagnostics["snapshot"]["runtime"]["last_error"]
+    assert last_error["kind"] == ConnectionErrorKind.CONNECTION_FAILED
+    assert last_error["message"] == "**REDACTED**"
+    assert "192.168.1.100" not in json_dumps(diagnostics)
@@ -1,5 +1,6 @@
 """Test the Trinnov Altitude integration initialization."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 from homeassistant.const import CONF_HOST
@@ -8,6 +9,8 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.trinnov_altitude.const import (
     CLIENT_ID,
+    CONF_BACKGROUND_STARTUP,
+    CONF_PUSH_COALESCE_WINDOW,
     DOMAIN,
     SERVICE_SET_PRESET,
     SERVICE_SET_SOURCE_BY_NAME,
@@ -120,3 +123,156 @@ async def test_async_setup_entry_unexpected_error_shuts_down(
     await hass.async_block_till_done()
     mock_device.start.assert_called_once()
     mock_device.stop.assert_called_once()
+
+
+async def test_async_setup_entry_records_startup_timings(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Setup should record how long each startup phase took."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    timings = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator.startup_timings
+    assert timings.cache_load is not None
+    assert timings.client_start is not None
+    assert timings.wait_synced is not None
+    assert timings.platform_setup is not None
+    assert timings.setup_entry is not None
+    assert timings.setup_entry >= timings.platform_setup
+
+
+async def test_async_setup_entry_applies_push_coalesce_window(
+    hass: HomeAssistant, mock_setup_entry
+):
+    """The coalescing window option should reach the coordinator."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Trinnov Altitude (192.168.1.100)",
+        data={CONF_HOST: "192.168.1.100"},
+        options={CONF_PUSH_COALESCE_WINDOW: 0.05},
+        unique_id="ABC123",
+    )
+    config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].coordinator
+    assert coordinator._push_coalesce_window == 0.05
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_async_setup_entry_background_startup_does_not_wait_for_sync(
+    hass: HomeAssistant, mock_setup_entry
+):
+    """Background startup should finish setup before the device syncs."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Trinnov Altitude (192.168.1.100)",
+        data={CONF_HOST: "192.168.1.100"},
+        options={CONF_BACKGROUND_STARTUP: True},
+        unique_id="ABC123",
+    )
+    config_entry.add_to_hass(hass)
+    synced = asyncio.Event()
+
+    async def wait_synced(_timeout: float | None) -> None:
+        await synced.wait()
+
+    mock_device = mock_setup_entry.return_value
+    mock_device.wait_synced = AsyncMock(side_effect=wait_synced)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device.start.assert_called_once()
+    assert hass.states.get("remote.trinnov_altitude_192_168_1_100")
+    coordinator = hass.data[DOMAIN][config_entry.entry_id].coordinator
+    assert coordinator.startup_timings.wait_synced is None
+
+    synced.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert coordinator.startup_timings.wait_synced is not None
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_async_setup_entry_background_startup_logs_unexpected_error(
+    hass: HomeAssistant, mock_setup_entry, caplog
+):
+    """Unexpected background bootstrap errors should be logged, not raised."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Trinnov Altitude (192.168.1.100)",
+        data={CONF_HOST: "192.168.1.100"},
+        options={CONF_BACKGROUND_STARTUP: True},
+        unique_id="ABC123",
+    )
+    config_entry.add_to_hass(hass)
+    mock_device = mock_setup_entry.return_value
+    mock_device.start = AsyncMock(side_effect=RuntimeError("boom"))
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert "Unexpected error while starting Trinnov Altitude client" in caplog.text
+    await hass.config_entries.async_unload(config_entry.entry_id)
+
+
+async def test_async_setup_entry_warm_starts_from_cache(
+    hass: HomeAssistant,
+    hass_storage,
+    mock_config_entry,
+    mock_trinnov_device_offline,
+    mock_setup_entry,
+):
+    """Cached catalogs should populate entities before the device syncs."""
+    hass_storage[f"{DOMAIN}.ABC123"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.ABC123",
+        "data": {
+            "sources": [[0, "Kaleidescape"], [1, "Apple TV"]],
+            "presets": [[0, "Built-in"], [1, "Movies"]],
+            "version": "4.2.9",
+            "source": "Apple TV",
+            "current_source_index": 1,
+            "preset": "Movies",
+            "current_preset_index": 1,
+            "upmixer": "dolby",
+        },
+    }
+    mock_trinnov_device_offline.wait_synced = AsyncMock(side_effect=TimeoutError)
+    mock_setup_entry.return_value = mock_trinnov_device_offline
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    source_select = hass.states.get("select.trinnov_altitude_192_168_1_100_source")
+    assert source_select
+    assert source_select.attributes["options"] == ["Kaleidescape", "Apple TV"]
+    assert source_select.state == "Apple TV"
+    remote = hass.states.get("remote.trinnov_altitude_192_168_1_100")
+    assert remote
+    assert remote.attributes["activity_list"] == ["Kaleidescape", "Apple TV"]
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+    assert coordinator.data.sources == ((0, "Kaleidescape"), (1, "Apple TV"))
+    assert coordinator.data.version == "4.2.9"
+
+    await hass.config_entries.async_unload(mock_config_entry.entry_id)
+
+
+async def test_async_remove_entry_deletes_cache(
+    hass: HomeAssistant, hass_storage, mock_config_entry, mock_setup_entry
+):
+    """Removing the entry should delete its warm-start cache."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    await hass.config_entries.async_remove(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert f"{DOMAIN}.ABC123" not in hass_storage
@@ -0,0 +1,60 @@
+"""Tests for Trinnov Altitude command latency metrics."""
+
+from trinnov_altitude.exceptions import CommandConvergenceTimeoutError
+
+from custom_components.trinnov_altitude.metrics import (
+    CommandMetrics,
+    LatencyHistogram,
+)
+
+
+def test_histogram_buckets_and_summary() -> None:
+    """Samples should land in fixed buckets with approximate quantiles."""
+    histogram = LatencyHistogram()
+    for seconds in (0.003, 0.02, 0.02, 0.02, 0.3, 12.0):
+        histogram.record(seconds)
+
+    summary = histogram.as_dict()
+    assert summary["count"] == 6
+    assert summary["max"] == 12.0
+    assert summary["p50"] == 0.025
+    assert summary["p95"] == 12.0
+    assert summary["buckets"]["le_0.005"] == 1
+    assert summary["buckets"]["le_0.025"] == 3
+    assert summary["buckets"]["le_0.5"] == 1
+    assert summary["buckets"]["le_inf"] == 1
+    assert len(histogram.counts) == len(summary["buckets"])
+
+
+def test_empty_histogram_reports_zero() -> None:
+    """An empty histogram should summarize without dividing by zero."""
+    summary = LatencyHistogram().as_dict()
+
+    assert summary["count"] == 0
+    assert summary["mean"] == summary["p95"] == 0.0
+
+
+def test_command_metrics_counts_outcomes() -> None:
+    """Errors, timeouts and slow ACKs should be counted per method."""
+    metrics = CommandMetrics()
+    metrics.record("power_off", "ack", 0.05, timeout=2.0)
+    metrics.record("power_off", "ack", 1.9, timeout=2.0)
+    metrics.record_error("power_off", TimeoutError())
+    metrics.record_error("source_set", CommandConvergenceTimeoutError("source", 5.0))
+    metrics.record_error("source_set", ValueError("bad"))
+    metrics.record("volume_set", "echo", 0.2)
+
+    stats = metrics.as_dict()
+    assert list(stats) == ["power_off", "source_set", "volume_set"]
+    assert stats["power_off"]["calls"] == 3
+    assert stats["power_off"]["near_timeouts"] == 1
+    assert stats["power_off"]["timeouts"] == 1
+    assert stats["power_off"]["latency"]["ack"]["count"] == 2
+    assert stats["source_set"]["timeouts"] == 1
+    assert stats["source_set"]["errors"] == 1
+    # Echoes confirm a call already counted when it was sent.
+    assert stats["volume_set"]["calls"] == 0
+    assert stats["volume_set"]["latency"]["echo"]["count"] == 1
+
+    metrics.reset()
+    assert metrics.as_dict() == {}
@@ -0,0 +1,94 @@
+"""Tests for the Trinnov Altitude optimistic overlay."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.trinnov_altitude.optimistic import (
+    OptimisticOverlay,
+    values_match,
+)
+
+
+@pytest.mark.parametrize(
+    ("intended", "reported", "expected"),
+    [
+        (-30.0, -30.04, True),
+        (-30.0, -30.1, False),
+        (-30.0, -30, True),
+        (True, True, True),
+        (True, None, False),
+        (None, None, True),
+        ("Blu-ray", " blu-ray ", True),
+        ("upmix on native", "upmix_on_native", False),
+        (2, 2, True),
+    ],
+)
+def test_values_match(intended, reported, expected) -> None:
+    """Reported values should confirm intended ones with type-aware matching."""
+    assert values_match(intended, reported) is expected
+
+
+def test_overlay_tokens_guard_replaced_values() -> None:
+    """Rollback and expiry should only affect the value they were issued for."""
+    overlay = OptimisticOverlay()
+    first = overlay.set("mute", True, "mute_on")
+    second = overlay.set("mute", False, "mute_off")
+
+    assert not overlay.rollback("mute", first)
+    assert not overlay.expire("mute", first)
+    assert overlay.is_pending("mute", second)
+    assert overlay.expire("mute", second)
+    assert not overlay
+    assert overlay.stats.issued == 2
+    assert overlay.stats.expired == 1
+    assert overlay.stats.rolled_back == 0
+    assert overlay.stats.average_latency == 0.0
+
+
+def test_overlay_reconcile_confirms_matching_fields_only() -> None:
+    """Only fields the snapshot now reports should be confirmed."""
+    echoes: list[tuple[str, float]] = []
+    overlay = OptimisticOverlay(on_confirm=lambda *echo: echoes.append(echo))
+    overlay.set_many({"current_source_index": 2, "source": "Blu-ray"}, "source_set")
+
+    confirmed = overlay.reconcile(
+        SimpleNamespace(current_source_index=2, source="Apple TV")
+    )
+
+    assert confirmed == {"current_source_index"}
+    assert overlay.fields == {"source"}
+    assert overlay.stats.confirmed == 1
+    assert overlay.stats.max_latency >= overlay.stats.last_latency["source_set"]
+    # The command is not echoed until all of its values are.
+    assert echoes == []
+
+
+def test_overlay_reports_one_echo_per_command() -> None:
+    """A command setting several fields should be echoed once."""
+    echoes: list[tuple[str, float]] = []
+    overlay = OptimisticOverlay(on_confirm=lambda *echo: echoes.append(echo))
+    overlay.set_many(
+        {"current_source_index": 2, "source": "Blu-ray", "preset": "Movies"},
+        "source_set",
+    )
+    overlay.set("mute", True, "mute_set")
+
+    overlay.reconcile(
+        SimpleNamespace(
+            current_source_index=2, source="Blu-ray", preset="Default", mute=False
+        )
+    )
+    assert echoes == []
+    overlay.reconcile(
+        SimpleNamespace(
+            current_source_index=2, source="Blu-ray", preset="Movies", mute=True
+        )
+    )
+
+    assert sorted(command for command, _latency in echoes) == [
+        "mute_set",
+        "source_set",
+    ]
+    assert overlay.stats.issued == 4
+    assert overlay.stats.confirmed == 4
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock
 import pytest
 from homeassistant.components.remote import (
     ATTR_COMMAND,
+    ATTR_DELAY_SECS,
     SERVICE_SEND_COMMAND,
     SERVICE_TURN_OFF,
     SERVICE_TURN_ON,
@@ -498,3 +499,80 @@ async def test_remote_is_off_when_disconnected(
     state = hass.states.get("remote.trinnov_altitude_192_168_1_100")
     assert state
     assert state.state == "off"
+
+
+async def test_remote_send_command_batch_mode_pipelines_commands(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """A zero delay should send the command list as one pipelined batch."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    await hass.services.async_call(
+        "remote",
+        SERVICE_SEND_COMMAND,
+        {
+            ATTR_ENTITY_ID: "remote.trinnov_altitude_192_168_1_100",
+            ATTR_COMMAND: ["source_set 1", "preset_set 2", "upmixer_set dolby"],
+            ATTR_DELAY_SECS: 0,
+        },
+        blocking=True,
+    )
+
+    assert [call.args[0] for call in mock_device.command.call_args_list] == [
+        "profile 1",
+        "loadp 2",
+        "upmixer dolby",
+    ]
+    mock_device.source_set.assert_not_called()
+
+
+async def test_remote_send_command_batch_mode_reports_failures(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Batch mode should raise one error naming every failed command."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    mock_device.command = AsyncMock(side_effect=[None, TimeoutError])
+    with pytest.raises(HomeAssistantError, match="preset_set: timed out"):
+        await hass.services.async_call(
+            "remote",
+            SERVICE_SEND_COMMAND,
+            {
+                ATTR_ENTITY_ID: "remote.trinnov_altitude_192_168_1_100",
+                ATTR_COMMAND: ["source_set 1", "preset_set 2"],
+                ATTR_DELAY_SECS: 0,
+            },
+            blocking=True,
+        )
+
+
+async def test_remote_send_command_validates_whole_list_first(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """An invalid later command should be rejected before earlier ones run."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    with pytest.raises(HomeAssistantError, match="Command 2 \\('upmixer_set bogus'\\)"):
+        await hass.services.async_call(
+            "remote",
+            SERVICE_SEND_COMMAND,
+            {
+                ATTR_ENTITY_ID: "remote.trinnov_altitude_192_168_1_100",
+                ATTR_COMMAND: ["mute_on", "upmixer_set bogus"],
+            },
+            blocking=True,
+        )
+
+    mock_device.mute_on.assert_not_called()
@@ -0,0 +1,115 @@
+"""Test deterministic replay of captured Trinnov Altitude sessions."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from homeassistant.core import HomeAssistant
+from trinnov_altitude.client import TrinnovAltitudeClient
+from trinnov_altitude.lifecycle import PowerState
+from trinnov_altitude.protocol import CurrentSourceFormatMessage, VolumeMessage
+
+from custom_components.trinnov_altitude.capture import CaptureRecord
+from custom_components.trinnov_altitude.commands import TrinnovAltitudeCommands
+from custom_components.trinnov_altitude.coordinator import TrinnovAltitudeCoordinator
+
+from .replay import CaptureReplayer
+from .simulator import AltitudeSimulator
+
+_COMPARED_FIELDS = (
+    "id",
+    "version",
+    "volume",
+    "mute",
+    "dim",
+    "source",
+    "preset",
+    "sources",
+    "presets",
+    "source_format",
+    "upmixer",
+    "synced",
+)
+
+
+def _coordinator(
+    hass: HomeAssistant, client: TrinnovAltitudeClient
+) -> TrinnovAltitudeCoordinator:
+    return TrinnovAltitudeCoordinator(
+        hass, client, TrinnovAltitudeCommands(client), stable_device_id="ABC123"
+    )
+
+
+def _offline_client() -> TrinnovAltitudeClient:
+    """Return a client whose callbacks are driven only by a replay."""
+    client = TrinnovAltitudeClient("127.0.0.1", heartbeat_interval=None)
+    client.start = AsyncMock()
+    client.wait_synced = AsyncMock()
+    client.stop = AsyncMock()
+    return client
+
+
+async def test_replay_reproduces_captured_session(
+    hass: HomeAssistant, socket_enabled, tmp_path: Path
+) -> None:
+    """Replaying a capture should rebuild the state the live session reached."""
+    path = tmp_path / "session.jsonl"
+    async with AltitudeSimulator() as simulator:
+        client = TrinnovAltitudeClient(
+            simulator.host,
+            port=simulator.port,
+            heartbeat_interval=None,
+            reconcile_interval=None,
+        )
+        live = _coordinator(hass, client)
+        await live.async_start_capture(path)
+        await live.async_start(sync_timeout=5.0)
+        await simulator.burst(
+            [
+                "CURRENT_SOURCE_FORMAT_NAME Dolby TrueHD",
+                "CURRENT_SOURCE_FORMAT_NAME Atmos narrow",
+            ],
+            repeat=5,
+        )
+        await simulator.volume_sweep(-40.0, -35.0, 0.5)
+        await client.dim_on()
+        await asyncio.sleep(0.1)
+        await hass.async_block_till_done()
+        expected = live.snapshot
+        await live.async_shutdown()
+
+    replayed = _coordinator(hass, _offline_client())
+    await replayed.async_start()
+    result = await CaptureReplayer.from_file(replayed.client, path).async_replay()
+    await hass.async_block_till_done()
+
+    assert result.messages > 20
+    snapshot = replayed.snapshot
+    for field in _COMPARED_FIELDS:
+        assert getattr(snapshot, field) == getattr(expected, field), field
+    assert snapshot.volume == -35.0
+    assert snapshot.runtime.power is PowerState.READY
+    await replayed.async_shutdown()
+
+
+async def test_replay_at_recorded_speed(hass: HomeAssistant) -> None:
+    """Replays at a speed factor should keep the recorded spacing."""
+    records = [
+        CaptureRecord(0.0, "received_message", message=VolumeMessage(volume=-30.0)),
+        CaptureRecord(
+            0.1, "received_message", message=CurrentSourceFormatMessage("PCM")
+        ),
+        CaptureRecord(0.2, "state_changed"),
+        CaptureRecord(0.2, "received_message", message=VolumeMessage(volume=-31.0)),
+    ]
+    coordinator = _coordinator(hass, _offline_client())
+    await coordinator.async_start()
+
+    result = await CaptureReplayer(coordinator.client, records).async_replay(speed=2.0)
+    await hass.async_block_till_done()
+
+    assert result.elapsed >= 0.1
+    assert result.messages == 3
+    assert coordinator.snapshot.volume == -31.0
+    assert coordinator.snapshot.source_format == "PCM"
+    await coordinator.async_shutdown()
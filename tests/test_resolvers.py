@@ -2,7 +2,9 @@
 
 from types import SimpleNamespace
 
+from custom_components.trinnov_altitude.catalog import CatalogIndex
 from custom_components.trinnov_altitude.resolvers import (
+    _normalize_upmixer,
     resolve_preset_name,
     resolve_source_name,
     resolve_upmixer_value,
@@ -81,3 +83,41 @@ def test_resolve_upmixer_uses_active_fallback_and_none() -> None:
     )
     state = SimpleNamespace(upmixer=None, active_upmixer=" Dolby_Upmixer ")
     assert resolve_upmixer_value(state) == "Dolby_Upmixer"
+
+
+def test_resolvers_use_the_given_catalog_index() -> None:
+    """A caller's catalog index should resolve names without re-indexing."""
+    state = SimpleNamespace(
+        source=None,
+        current_source_index=2,
+        sources=(),
+        preset=None,
+        current_preset_index=1,
+        presets=(),
+    )
+
+    assert resolve_source_name(state, CatalogIndex(((2, "Blu-ray"),))) == "Blu-ray"
+    assert resolve_preset_name(state, CatalogIndex(((1, "Movies"),))) == "Movies"
+    assert resolve_preset_name(state, CatalogIndex(((1, ""),))) == "Preset 1"
+
+
+def test_resolve_upmixer_known_spellings_skip_normalizing() -> None:
+    """Known upmixer spellings should resolve from the alias table."""
+    _normalize_upmixer.cache_clear()
+
+    assert resolve_upmixer_value(SimpleNamespace(upmixer="upmix_on_native")) == (
+        "upmix on native"
+    )
+    assert _normalize_upmixer.cache_info().misses == 0
+
+
+def test_resolvers_handle_unhashable_catalogs_and_raw_upmixer_spellings() -> None:
+    """Uncacheable catalogs and unusual upmixer spellings should still resolve."""
+    state = SimpleNamespace(
+        source=None, current_source_index=1, sources=((1, "Kodi"), [2, "TV"])
+    )
+    assert resolve_source_name(state) == "Kodi"
+    assert (
+        resolve_upmixer_value(SimpleNamespace(upmixer=" Upmix_On_Native "))
+        == "upmix on native"
+    )
@@ -0,0 +1,88 @@
+"""Test bootstrap retry pacing."""
+
+import asyncio
+from unittest.mock import patch
+
+from custom_components.trinnov_altitude.retry import BootstrapRetryScheduler
+
+
+def test_backoff_grows_exponentially_up_to_cap() -> None:
+    """Delays should double per attempt and stop at the cap."""
+    scheduler = BootstrapRetryScheduler(
+        initial_delay=5.0, max_delay=60.0, multiplier=2.0, jitter=0.0
+    )
+
+    delays = [scheduler.next_delay() for _ in range(6)]
+
+    assert delays == [5.0, 10.0, 20.0, 40.0, 60.0, 60.0]
+    assert scheduler.attempts == 6
+    assert scheduler.delay == 60.0
+
+
+def test_backoff_stays_capped_after_many_attempts() -> None:
+    """Days of failed attempts should keep returning the cap, not overflow."""
+    scheduler = BootstrapRetryScheduler(max_delay=300.0, jitter=0.0)
+
+    delays = [scheduler.next_delay() for _ in range(5000)]
+
+    assert delays[-1] == 300.0
+    assert scheduler.attempts == 5000
+
+
+def test_backoff_applies_bounded_jitter() -> None:
+    """Jitter should spread delays within the configured ratio."""
+    scheduler = BootstrapRetryScheduler(initial_delay=10.0, jitter=0.2)
+
+    with patch(
+        "custom_components.trinnov_altitude.retry.random.uniform",
+        side_effect=lambda low, high: high,
+    ):
+        assert scheduler.next_delay() == 12.0
+
+    for _ in range(20):
+        scheduler.reset()
+        assert 8.0 <= scheduler.next_delay() <= 12.0
+
+
+def test_wake_resets_backoff_to_fast_cadence() -> None:
+    """A wake request should switch to the fast cadence for the wake window."""
+    scheduler = BootstrapRetryScheduler(jitter=0.0, wake_delay=1.0, wake_window=60.0)
+    for _ in range(5):
+        scheduler.next_delay()
+
+    scheduler.wake()
+
+    assert scheduler.attempts == 0
+    assert scheduler.waking
+    assert scheduler.next_delay() == 1.0
+    assert scheduler.next_delay() == 1.0
+
+
+def test_wake_window_expires_back_to_backoff() -> None:
+    """After the wake window the scheduler should resume exponential backoff."""
+    scheduler = BootstrapRetryScheduler(
+        initial_delay=5.0, jitter=0.0, wake_delay=1.0, wake_window=0.0
+    )
+
+    scheduler.wake()
+
+    assert not scheduler.waking
+    assert scheduler.next_delay() == 5.0
+
+
+async def test_wake_interrupts_pending_wait() -> None:
+    """A long backoff sleep should end as soon as a wake is requested."""
+    scheduler = BootstrapRetryScheduler()
+    wait = asyncio.create_task(scheduler.async_wait(300.0))
+    await asyncio.sleep(0)
+
+    scheduler.wake()
+
+    await asyncio.wait_for(wait, 1.0)
+
+
+async def test_wait_times_out_without_wake() -> None:
+    """Without a wake request the wait should last the requested delay."""
+    scheduler = BootstrapRetryScheduler()
+
+    await asyncio.wait_for(scheduler.async_wait(0.01), 1.0)
@@ -333,9 +333,10 @@ async def test_upmixer_select_option_valid(
 
     mock_device.upmixer_set.assert_called_once()
 
+    # The selected mode shows optimistically until the device echoes it.
     state = hass.states.get("select.trinnov_altitude_192_168_1_100_upmixer")
     assert state
-    assert state.state == "auto"
+    assert state.state == "dolby"
 
 
 async def test_source_select_uses_index_fallback_when_label_missing(
@@ -484,3 +485,44 @@ async def test_upmixer_select_option_invalid(
     entity = TrinnovAltitudeUpmixerSelect(data.coordinator)
     with pytest.raises(HomeAssistantError, match="Unknown upmixer option"):
         await entity.async_select_option("bad")
+
+
+async def test_source_select_options_rebuilt_only_on_catalog_change(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Options should be reused across snapshots until the catalog changes."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    data = hass.data[DOMAIN][mock_config_entry.entry_id]
+    entity = TrinnovAltitudeSourceSelect(data.coordinator)
+    options = entity.options
+
+    data.coordinator.async_publish_snapshot()
+    assert entity.options is options
+
+    mock_device = mock_setup_entry.return_value
+    mock_device.state.sources = {0: "Kaleidescape", 1: "Apple TV"}
+    data.coordinator.async_publish_snapshot()
+    assert entity.options is not options
+    assert entity.options == ["Kaleidescape", "Apple TV"]
+
+    mock_device.state.current_source_index = 7
+    data.coordinator.async_publish_snapshot()
+    assert entity.options == ["Kaleidescape", "Apple TV", "Source 7"]
+
+
+async def test_upmixer_select_options_are_shared(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Known upmixer values should reuse the precomputed option list."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    data = hass.data[DOMAIN][mock_config_entry.entry_id]
+    entity = TrinnovAltitudeUpmixerSelect(data.coordinator)
+    assert entity.options is entity.options
@@ -1,6 +1,12 @@
 """Test the Trinnov Altitude sensor platform."""
 
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.components.sensor import SensorEntity
 from homeassistant.core import HomeAssistant
+from trinnov_altitude.adapter import StateDelta
 from trinnov_altitude.lifecycle import (
     ControlHealth,
     PowerState,
@@ -8,6 +14,8 @@ from trinnov_altitude.lifecycle import (
     TransportState,
 )
 
+from custom_components.trinnov_altitude.const import DOMAIN
+
 
 async def test_power_status_ready(
     hass: HomeAssistant, mock_config_entry, mock_setup_entry
@@ -331,3 +339,191 @@ async def test_sensor_upmixer_falls_back_to_active_value_when_mode_missing(
     state = hass.states.get("sensor.trinnov_altitude_192_168_1_100_upmixer")
     assert state
     assert state.state == "none"
+
+
+async def test_volume_delta_skips_unrelated_sensor_writes(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """A volume-only delta should not rewrite sensors that ignore volume."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    version_before = hass.states.get("sensor.trinnov_altitude_192_168_1_100_version")
+    volume_before = hass.states.get("sensor.trinnov_altitude_192_168_1_100_volume")
+    assert version_before
+    assert volume_before
+
+    mock_device.state.volume = -35.0
+    callback = mock_device.register_adapter_callback.call_args[0][1]
+    callback(None, [StateDelta(field="volume", old=-40.0, new=-35.0)], [])
+    await hass.async_block_till_done()
+
+    version_after = hass.states.get("sensor.trinnov_altitude_192_168_1_100_version")
+    volume_after = hass.states.get("sensor.trinnov_altitude_192_168_1_100_volume")
+    assert version_after
+    assert volume_after
+    assert volume_after.state == "-35.0"
+    assert version_after.last_reported == version_before.last_reported
+    assert volume_after.last_reported != volume_before.last_reported
+
+
+async def test_unchanged_sensors_skip_state_writes_on_full_publish(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """A full publish should only write entities whose rendered state changed."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+    mock_device = mock_setup_entry.return_value
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+    stats = coordinator.push_stats
+    writes = stats.state_writes
+    version_before = hass.states.get("sensor.trinnov_altitude_192_168_1_100_version")
+    assert version_before
+
+    mock_device.state.volume = -35.0
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+
+    version_after = hass.states.get("sensor.trinnov_altitude_192_168_1_100_version")
+    assert version_after
+    assert version_after.last_reported == version_before.last_reported
+    volume = hass.states.get("sensor.trinnov_altitude_192_168_1_100_volume")
+    assert volume
+    assert volume.state == "-35.0"
+    # Volume sensor, volume number and media player render the new volume.
+    assert stats.state_writes == writes + 3
+    assert stats.state_writes_suppressed > 0
+
+
+async def test_sensor_value_computed_once_per_snapshot_version(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Sensor values should be memoized until a new snapshot is published."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+    sensor = next(
+        entity
+        for entity in hass.data["sensor"].entities
+        if entity.entity_description.key == "power_status"
+    )
+    calls: list[int] = []
+    value_fn = sensor._value_fn
+
+    def counting_value_fn(state):
+        calls.append(state.snapshot_version)
+        return value_fn(state)
+
+    sensor._value_fn = counting_value_fn
+    sensor._rendered = None
+
+    assert sensor.native_value == "ready"
+    assert sensor.native_value == "ready"
+    assert sensor.icon == "mdi:power-on"
+    assert len(calls) == 1
+
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+    assert sensor.native_value == "ready"
+    assert len(calls) == 2
+    assert calls[1] > calls[0]
+
+
+async def test_bootstrap_duration_sensors(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Startup should populate the last time-to-ready diagnostic sensor."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+    timeline = coordinator.bootstrap_timeline.last
+    assert timeline is not None
+    assert timeline.trigger == "startup"
+
+    state = hass.states.get("sensor.trinnov_altitude_192_168_1_100_last_time_to_ready")
+    assert state
+    assert float(state.state) >= 0.0
+    assert state.attributes["unit_of_measurement"] == "s"
+    state = hass.states.get(
+        "sensor.trinnov_altitude_192_168_1_100_last_connect_duration"
+    )
+    assert state
+    assert state.state == "unknown"
+
+
+async def test_coordinator_writes_compute_state_once(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Deciding whether to write should not compute the entity state."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+    mock_device = mock_setup_entry.return_value
+    stats = coordinator.push_stats
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+    state_reads = 0
+    sensor_state = SensorEntity.state
+
+    def counted_state(entity: SensorEntity) -> Any:
+        nonlocal state_reads
+        state_reads += 1
+        return sensor_state.fget(entity)
+
+    with patch.object(SensorEntity, "state", property(counted_state)):
+        writes = stats.state_writes
+        mock_device.state.volume = -36.0
+        coordinator.async_publish_snapshot()
+        await hass.async_block_till_done()
+
+    # Volume sensor, volume number and media player render the new volume,
+    # and the one sensor among them computed its state once.
+    assert stats.state_writes - writes == 3
+    assert state_reads == 1
+
+
+async def test_other_writes_reset_write_suppression(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """A write outside the coordinator path should not leave a stale record."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+    entity = hass.data[SENSOR_DOMAIN].get_entity(
+        "sensor.trinnov_altitude_192_168_1_100_version"
+    )
+    stats = coordinator.push_stats
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+    writes = stats.state_writes
+
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+    assert stats.state_writes == writes
+
+    entity.async_write_ha_state()
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+    assert stats.state_writes == writes + 1
+
+    coordinator.async_publish_snapshot()
+    await hass.async_block_till_done()
+    assert stats.state_writes == writes + 1
@@ -1,5 +1,6 @@
 """Test Trinnov Altitude domain services."""
 
+import asyncio
 from types import SimpleNamespace
 from typing import cast
 from unittest.mock import AsyncMock
@@ -7,15 +8,23 @@ from unittest.mock import AsyncMock
 import pytest
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from trinnov_altitude.exceptions import CommandRejectedError, NoMacAddressError
 
 from custom_components.trinnov_altitude.commands import TrinnovAltitudeCommands
 from custom_components.trinnov_altitude.const import (
+    ATTR_COMMANDS,
     ATTR_ENTRY_ID,
+    ATTR_FUZZY,
+    ATTR_PRESET,
     ATTR_PRESET_ID,
     ATTR_SOURCE,
     ATTR_UPMIXER,
     DOMAIN,
+    SERVICE_COMMAND_STATS,
+    SERVICE_POWER_ON,
+    SERVICE_SEND_BATCH,
     SERVICE_SET_PRESET,
+    SERVICE_SET_PRESET_BY_NAME,
     SERVICE_SET_SOURCE_BY_NAME,
     SERVICE_SET_UPMIXER,
 )
@@ -99,6 +108,188 @@ async def test_service_set_source_by_name_unknown_source(
         )
 
 
+async def test_service_set_source_by_name_ignores_case_and_whitespace(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Source names should match regardless of case and extra whitespace."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_SOURCE_BY_NAME,
+        {ATTR_SOURCE: "  apple   tv "},
+        blocking=True,
+    )
+
+    mock_device.source_set.assert_called_once_with(1)
+
+
+async def test_service_set_source_by_name_fuzzy(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Fuzzy matching should pick the closest source name when requested."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    with pytest.raises(ServiceValidationError, match="Unknown source name"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_SOURCE_BY_NAME,
+            {ATTR_SOURCE: "Bluray"},
+            blocking=True,
+        )
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_SOURCE_BY_NAME,
+        {ATTR_SOURCE: "Bluray", ATTR_FUZZY: True},
+        blocking=True,
+    )
+
+    mock_device.source_set.assert_called_once_with(2)
+
+
+async def test_service_set_preset_by_name(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Preset names should resolve to preset ids."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_PRESET_BY_NAME,
+        {ATTR_PRESET: "music"},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_PRESET_BY_NAME,
+        {ATTR_PRESET: "Movis", ATTR_FUZZY: True},
+        blocking=True,
+    )
+
+    assert [call.args for call in mock_device.preset_set.call_args_list] == [
+        (2,),
+        (1,),
+    ]
+    with pytest.raises(ServiceValidationError, match="Unknown preset name"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_PRESET_BY_NAME,
+            {ATTR_PRESET: "Concert"},
+            blocking=True,
+        )
+
+
+async def test_service_send_batch_returns_per_command_results(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Batch service should pipeline commands and report each result."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    mock_device.command = AsyncMock(
+        side_effect=[None, CommandRejectedError("loadp 9", "unknown preset")]
+    )
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SEND_BATCH,
+        {ATTR_COMMANDS: ["source_set 1", "preset_set 9", "mute_on"]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert [call.args[0] for call in mock_device.command.call_args_list] == [
+        "profile 1",
+        "loadp 9",
+    ]
+    mock_device.mute_on.assert_called_once()
+    assert response == {
+        "results": [
+            {"command": "source_set 1", "success": True, "error": None},
+            {
+                "command": "preset_set 9",
+                "success": False,
+                "error": "Command rejected: loadp 9 (unknown preset)",
+            },
+            {"command": "mute_on", "success": True, "error": None},
+        ]
+    }
+
+
+async def test_service_send_batch_raises_without_response(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Without a response variable, failed commands should raise an error."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    mock_device.command = AsyncMock(
+        side_effect=[None, CommandRejectedError("loadp 9", "unknown preset")]
+    )
+    with pytest.raises(
+        HomeAssistantError,
+        match=r"1 of 3 .* failed: 'preset_set 9': Command rejected: loadp 9",
+    ):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SEND_BATCH,
+            {ATTR_COMMANDS: ["source_set 1", "preset_set 9", "mute_on"]},
+            blocking=True,
+        )
+    mock_device.mute_on.assert_called_once()
+
+    mock_device.command = AsyncMock()
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SEND_BATCH,
+        {ATTR_COMMANDS: ["source_set 1", "mute_on"]},
+        blocking=True,
+    )
+
+
+async def test_service_send_batch_rejects_invalid_list_before_sending(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """An invalid command anywhere in the batch should stop the whole batch."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    with pytest.raises(ServiceValidationError, match="Command 5 \\('bogus'\\)"):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SEND_BATCH,
+            {
+                ATTR_COMMANDS: [
+                    "source_set 1",
+                    "preset_set 2",
+                    "mute_on",
+                    "volume_set -30",
+                    "bogus",
+                ]
+            },
+            blocking=True,
+            return_response=True,
+        )
+
+    mock_device.command.assert_not_called()
+    mock_device.mute_on.assert_not_called()
+    mock_device.volume_set.assert_not_called()
+
+
 async def test_service_requires_entry_id_when_multiple_entries(
     hass: HomeAssistant, mock_config_entry, mock_setup_entry
 ):
@@ -195,3 +386,89 @@ async def test_unload_services_is_safe_when_not_registered(hass: HomeAssistant):
     assert hass.services.has_service(DOMAIN, SERVICE_SET_SOURCE_BY_NAME)
     async_unload_services(hass)
     assert not hass.services.has_service(DOMAIN, SERVICE_SET_SOURCE_BY_NAME)
+
+
+async def test_service_set_preset_by_name_waits_for_wake(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """Preset names issued during wake-up should resolve once the device syncs."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    commands = hass.data[DOMAIN][mock_config_entry.entry_id].commands
+    presets = mock_device.state.presets
+    mock_device.state.presets = {}
+    commands.defer_until_ready()
+
+    call = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_PRESET_BY_NAME,
+            {ATTR_PRESET: "Music"},
+            blocking=True,
+        )
+    )
+    await asyncio.sleep(0)
+    assert not call.done()
+
+    mock_device.state.presets = presets
+    commands.release_deferred()
+    await call
+
+    mock_device.preset_set.assert_called_once_with(2)
+
+
+async def test_service_power_on_returns_time_to_ready(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """The power-on action should report how long the device took to be ready."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_POWER_ON, {}, blocking=True, return_response=True
+    )
+
+    mock_device.power_on.assert_called_once()
+    assert response is not None
+    assert response["time_to_ready"] >= 0.0
+
+    mock_device.power_on.side_effect = NoMacAddressError
+    with pytest.raises(HomeAssistantError, match="mac address"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_POWER_ON, {}, blocking=True, return_response=True
+        )
+
+
+async def test_service_command_stats_reports_and_resets(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """The command stats action should return latency metrics, then reset."""
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_PRESET, {ATTR_PRESET_ID: 1}, blocking=True
+    )
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_COMMAND_STATS,
+        {"reset": True},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response is not None
+    assert response["methods"]["preset_set"]["latency"]["converge"]["count"] == 1
+    assert response["queue"]["executed"] >= 1
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_COMMAND_STATS, {}, blocking=True, return_response=True
+    )
+    assert response is not None
+    assert response["methods"] == {}
@@ -0,0 +1,134 @@
+"""Test the Trinnov Altitude protocol simulator against the real client."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+from trinnov_altitude.client import TrinnovAltitudeClient
+from trinnov_altitude.const import UpmixerMode
+from trinnov_altitude.lifecycle import TransportState
+
+from .simulator import AltitudeSimulator
+
+
+@pytest.fixture
+async def simulator(socket_enabled) -> AsyncIterator[AltitudeSimulator]:
+    """Serve a simulated processor on a free local port."""
+    async with AltitudeSimulator(sources={0: "Kaleidescape", 1: "Apple TV"}) as sim:
+        yield sim
+
+
+def _client(simulator: AltitudeSimulator) -> TrinnovAltitudeClient:
+    return TrinnovAltitudeClient(
+        simulator.host,
+        port=simulator.port,
+        command_timeout=1.0,
+        heartbeat_interval=None,
+        reconcile_interval=None,
+        reconnect_initial_backoff=0.05,
+        reconnect_max_backoff=0.1,
+    )
+
+
+async def test_client_syncs_and_controls_simulator(
+    simulator: AltitudeSimulator,
+) -> None:
+    """The client should sync the catalog and drive every simulated setting."""
+    client = _client(simulator)
+    await client.start()
+    try:
+        await client.wait_synced(5)
+        assert client.state.id == simulator.device_id
+        assert client.state.sources == {0: "Kaleidescape", 1: "Apple TV"}
+
+        await client.volume_set(-25.5)
+        await client.mute_on()
+        await client.dim_toggle()
+        await client.bypass_on()
+        await client.upmixer_set(UpmixerMode.MODE_DOLBY)
+        await client.source_set(1)
+        await client.command("volume -20", wait_for_ack=True, ack_timeout=1.0)
+        await asyncio.sleep(0.05)
+
+        assert client.state.volume == -20.0
+        assert client.state.mute is True
+        assert client.state.dim is True
+        assert client.state.bypass is True
+        assert client.state.upmixer == "dolby"
+        assert client.state.source == "Apple TV"
+        assert "volume -25.5" in simulator.received_messages
+    finally:
+        await client.stop()
+
+
+async def test_simulator_latency_and_missing_acks(
+    simulator: AltitudeSimulator,
+) -> None:
+    """Responses should be delayed, and withheld ACKs should time out."""
+    client = _client(simulator)
+    await client.start()
+    try:
+        await client.wait_synced(5)
+        # Let the ACKs of the bootstrap commands drain first.
+        await asyncio.sleep(0.05)
+        simulator.latency = 0.05
+        simulator.jitter = 0.01
+
+        started = time.monotonic()
+        await client.command("mute 1", wait_for_ack=True, ack_timeout=1.0)
+        assert time.monotonic() - started >= 0.04
+
+        simulator.ack_commands = False
+        with pytest.raises(TimeoutError):
+            await client.command("mute 0", wait_for_ack=True, ack_timeout=0.2)
+    finally:
+        await client.stop()
+
+
+async def test_simulator_bursts_and_sweeps(simulator: AltitudeSimulator) -> None:
+    """Pushed bursts should reach the client in order."""
+    client = _client(simulator)
+    await client.start()
+    try:
+        await client.wait_synced(5)
+        sent = simulator.messages_sent
+
+        await simulator.burst(["DIM 1", "DIM 0"], repeat=10)
+        await simulator.volume_sweep(-40.0, -30.0, 0.5)
+        await simulator.resync()
+        await asyncio.sleep(0.1)
+
+        assert simulator.messages_sent - sent >= 20 + 21
+        assert client.state.volume == -30.0
+        assert client.state.dim is False
+        assert client.state.synced
+    finally:
+        await client.stop()
+
+
+async def test_simulator_disconnects_and_power_state(
+    simulator: AltitudeSimulator,
+) -> None:
+    """Dropped clients should reconnect, except while the device is off."""
+    client = _client(simulator)
+    await client.start()
+    try:
+        await client.wait_synced(5)
+
+        await simulator.disconnect()
+        await simulator.wait_for_connection()
+        await client.wait_synced(5)
+        assert simulator.connection_count == 2
+
+        await simulator.power_off()
+        await asyncio.sleep(0.3)
+        assert client.runtime.transport != TransportState.CONNECTED
+        assert simulator.connection_count == 2
+
+        await simulator.power_on()
+        await simulator.wait_for_connection()
+        await client.wait_synced(5)
+        assert simulator.connection_count == 3
+    finally:
+        await client.stop()
@@ -3,6 +3,9 @@
 from homeassistant.components.switch import SERVICE_TURN_OFF, SERVICE_TURN_ON
 from homeassistant.const import ATTR_ENTITY_ID, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant
+from trinnov_altitude.adapter import StateDelta
+
+from custom_components.trinnov_altitude.const import DOMAIN
 
 
 async def test_switches(hass: HomeAssistant, mock_config_entry, mock_setup_entry):
@@ -85,3 +88,39 @@ async def test_switch_reflects_device_state(
     state = hass.states.get("switch.trinnov_altitude_192_168_1_100_mute")
     assert state
     assert state.state == STATE_ON
+
+
+async def test_mute_switch_shows_optimistic_state_until_echo(
+    hass: HomeAssistant, mock_config_entry, mock_setup_entry
+):
+    """The mute switch should flip immediately and settle on the device echo."""
+    mock_config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mock_device = mock_setup_entry.return_value
+    coordinator = hass.data[DOMAIN][mock_config_entry.entry_id].coordinator
+
+    await hass.services.async_call(
+        "switch",
+        SERVICE_TURN_ON,
+        {ATTR_ENTITY_ID: "switch.trinnov_altitude_192_168_1_100_mute"},
+        blocking=True,
+    )
+
+    state = hass.states.get("switch.trinnov_altitude_192_168_1_100_mute")
+    assert state
+    assert state.state == STATE_ON
+    assert coordinator.optimistic.fields == {"mute"}
+
+    mock_device.state.mute = True
+    callback = mock_device.register_adapter_callback.call_args[0][1]
+    callback(None, [StateDelta(field="mute", old=False, new=True)], [])
+    await hass.async_block_till_done()
+
+    state = hass.states.get("switch.trinnov_altitude_192_168_1_100_mute")
+    assert state
+    assert state.state == STATE_ON
+    assert not coordinator.optimistic
+    assert coordinator.optimistic.stats.last_latency.keys() == {"mute_on"}
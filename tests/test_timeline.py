@@ -0,0 +1,60 @@
+"""Tests for the Trinnov Altitude bootstrap timeline."""
+
+from unittest.mock import patch
+
+from custom_components.trinnov_altitude.timeline import BootstrapTimelineRecorder
+
+
+def test_timeline_records_phases_and_durations() -> None:
+    """Phases should be stamped once and reported as offsets from the trigger."""
+    recorder = BootstrapTimelineRecorder(history_size=2)
+    clock = iter([10.0, 10.5, 11.0, 11.25, 12.0, 20.0, 30.0, 40.0])
+    with patch(
+        "custom_components.trinnov_altitude.timeline.time.monotonic",
+        side_effect=lambda: next(clock),
+    ):
+        recorder.begin("wake")
+        recorder.mark("wol_sent")
+        recorder.mark_attempt()
+        recorder.mark("connected")
+        recorder.mark("device_id")
+        recorder.mark("device_id")
+        assert recorder.begin("reconnect").trigger == "wake"
+        recorder.mark("sources")
+        recorder.mark("presets")
+        timeline = recorder.finish()
+
+    assert timeline is not None
+    assert recorder.current is None
+    assert recorder.last is timeline
+    assert timeline.attempts == 1
+    assert timeline.time_to_ready == 30.0
+    assert timeline.connect_duration == 0.25
+    data = timeline.as_dict()
+    assert data["trigger"] == "wake"
+    assert data["phases"] == {
+        "wol_sent": 0.5,
+        "connected": 1.25,
+        "device_id": 2.0,
+        "sources": 10.0,
+        "presets": 20.0,
+        "synced": 30.0,
+    }
+
+
+def test_timeline_history_is_bounded_and_idle_marks_are_ignored() -> None:
+    """Marks outside a bootstrap are dropped and history keeps the newest runs."""
+    recorder = BootstrapTimelineRecorder(history_size=2)
+    recorder.mark("connected")
+    recorder.mark_attempt()
+    assert recorder.finish() is None
+    assert recorder.last is None
+
+    for trigger in ("startup", "wake", "reconnect"):
+        recorder.begin(trigger)
+        recorder.finish()
+
+    assert [timeline.trigger for timeline in recorder.history] == ["wake", "reconnect"]
+    assert recorder.last is not None
+    assert recorder.last.connect_duration is None
+    assert recorder.last.as_dict()["phases"]["connected"] is None
@@ -0,0 +1,47 @@
+"""Tests for the Trinnov Altitude protocol trace."""
+
+import pytest
+from trinnov_altitude.protocol import MuteMessage
+
+from custom_components.trinnov_altitude.trace import ProtocolTrace
+
+
+def test_trace_keeps_latest_entries_oldest_first() -> None:
+    """A full trace should overwrite its oldest entries in place."""
+    trace = ProtocolTrace(capacity=3)
+    stamps = trace._stamps
+    for index in range(5):
+        trace.record(f"event_{index}")
+
+    assert len(trace) == 3
+    assert trace.recorded == 5
+    assert trace._stamps is stamps
+    assert [entry["event"] for entry in trace.entries()] == [
+        "event_2",
+        "event_3",
+        "event_4",
+    ]
+    monotonic = [entry["monotonic"] for entry in trace.entries()]
+    assert monotonic == sorted(monotonic)
+
+
+def test_trace_describes_payloads() -> None:
+    """Messages should be rendered as plain data when the trace is read."""
+    trace = ProtocolTrace()
+    trace.record("received_message", MuteMessage(state=True))
+    trace.record("disconnected")
+    trace.record("custom", object())
+
+    first, second, third = trace.entries()
+    assert first["payload"] == {"type": "MuteMessage", "state": True}
+    assert second["payload"] is None
+    assert third["payload"]["type"] == "object"
+
+    trace.clear()
+    assert trace.entries() == []
+
+
+def test_trace_rejects_empty_capacity() -> None:
+    """A trace must hold at least one entry."""
+    with pytest.raises(ValueError):
+        ProtocolTrace(capacity=0)